@@ -0,0 +1,266 @@
+r"""
+Graph of citations between judicial decisions.
+
+Citations are found in the text of each :class:`.Opinion` with
+`eyecite <https://github.com/freelawproject/eyecite>`_\, and each one that
+matches the citation of another decision in the same collection becomes an
+edge of a :class:`CitationGraph` keyed by the decisions'
+Caselaw Access Project IDs. Comparisons across a collection of decisions
+can use the graph to skip pairs of decisions that aren't connected by
+a short chain of citations.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from eyecite import get_citations
+from eyecite.models import FullCaseCitation
+from justopinion.decisions import Decision
+
+from authorityspoke.decisions import DecisionReading
+
+# the decision ID, its own citations, and the text of its opinions
+CitationTask = Tuple[int, List[str], List[str]]
+
+
+def normalize_cite(cite: str) -> str:
+    """Make a citation comparable regardless of case and spacing."""
+    return "".join(cite.lower().split())
+
+
+def extract_cites(text: str) -> List[str]:
+    """
+    Find the full case citations in a text.
+
+    :returns:
+        each citation found, in the order of its first appearance,
+        as normalized by :func:`normalize_cite`
+    """
+    cites: Dict[str, None] = {}
+    for citation in get_citations(text):
+        if isinstance(citation, FullCaseCitation):
+            cites[normalize_cite(citation.corrected_citation())] = None
+    return list(cites)
+
+
+def _extract_task(task: CitationTask) -> Tuple[int, List[str], List[str]]:
+    """Find the citations in one decision's opinions, in a worker process."""
+    decision_id, own_cites, texts = task
+    cites: Dict[str, None] = {}
+    for text in texts:
+        for cite in extract_cites(text):
+            cites[cite] = None
+    return decision_id, [normalize_cite(cite) for cite in own_cites], list(cites)
+
+
+def _citation_task(decision: Union[Decision, DecisionReading]) -> CitationTask:
+    if isinstance(decision, DecisionReading):
+        # text left on disk is read for the task, but not kept on the Opinion
+        texts = [decision.read_opinion_text(opinion) for opinion in decision.opinions]
+        decision = decision.decision
+    else:
+        texts = [opinion.text for opinion in decision.opinions]
+    if decision.id is None:
+        raise ValueError(
+            f"Decision {decision} has no ID, so it can't be added to a CitationGraph."
+        )
+    return (
+        decision.id,
+        [citation.cite for citation in decision.citations],
+        [text for text in texts if text],
+    )
+
+
+class CitationGraph:
+    """
+    Directed graph of citations between decisions, keyed by decision ID.
+
+    An edge from one decision to another means an opinion of the first
+    decision cites the second.
+    """
+
+    def __init__(self):
+        """Create empty graph."""
+        self.cites: Dict[int, Set[int]] = {}
+        self.cited_by: Dict[int, Set[int]] = {}
+        self.ids_by_cite: Dict[str, int] = {}
+        self.unresolved: Dict[int, Set[str]] = {}
+        # IDs of the decisions with each unresolved citation
+        self._citing_by_unresolved: Dict[str, Set[int]] = {}
+
+    @classmethod
+    def from_decisions(
+        cls,
+        decisions: Iterable[Union[Decision, DecisionReading]],
+        max_workers: Optional[int] = None,
+        chunksize: int = 4,
+    ) -> CitationGraph:
+        r"""
+        Build graph by extracting the citations from every decision's opinions.
+
+        :param decisions:
+            :class:`.Decision`\s or :class:`.DecisionReading`\s with
+            Caselaw Access Project IDs and opinion text
+
+        :param max_workers:
+            number of processes for extracting citations. ``None`` uses
+            one process per CPU, and ``1`` extracts the citations without
+            starting any new processes.
+
+        :param chunksize:
+            number of decisions sent to a worker process at a time
+        """
+        graph = cls()
+        if max_workers == 1:
+            # extract one decision at a time, so only one decision's text is read
+            tasks = map(_citation_task, decisions)
+            graph.add_results(map(_extract_task, tasks))
+            return graph
+        task_list = [_citation_task(decision) for decision in decisions]
+        if len(task_list) <= 1:
+            graph.add_results(map(_extract_task, task_list))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                graph.add_results(
+                    executor.map(_extract_task, task_list, chunksize=chunksize)
+                )
+        return graph
+
+    def add_results(self, results: Iterable[Tuple[int, List[str], List[str]]]) -> None:
+        """
+        Add decisions with the citations found in their opinions.
+
+        Citations to decisions that aren't in the graph yet are kept
+        in ``unresolved``, and become edges if a decision with a matching
+        citation is added later. Only the citations of the new decisions,
+        and the earlier unresolved citations matching the new decisions'
+        own citations, are resolved.
+
+        :param results:
+            tuples of a decision ID, the decision's own citations,
+            and the citations found in its opinions
+        """
+        results = list(results)
+        new_cites = []
+        for decision_id, own_cites, _ in results:
+            self.cites.setdefault(decision_id, set())
+            self.cited_by.setdefault(decision_id, set())
+            for cite in own_cites:
+                cite = normalize_cite(cite)
+                self.ids_by_cite[cite] = decision_id
+                new_cites.append(cite)
+        for decision_id, _, found_cites in results:
+            unresolved = self.unresolved.setdefault(decision_id, set())
+            for cite in found_cites:
+                cite = normalize_cite(cite)
+                if not self._link(decision_id, cite):
+                    unresolved.add(cite)
+                    self._citing_by_unresolved.setdefault(cite, set()).add(
+                        decision_id
+                    )
+        for cite in new_cites:
+            for decision_id in self._citing_by_unresolved.pop(cite, ()):
+                self.unresolved[decision_id].discard(cite)
+                self._link(decision_id, cite)
+
+    def add_decision(self, decision: Union[Decision, DecisionReading]) -> None:
+        """Extract the citations from one decision and add it to the graph."""
+        self.add_results([_extract_task(_citation_task(decision))])
+
+    def _link(self, decision_id: int, cite: str) -> bool:
+        """
+        Add an edge for a citation, if the cited decision is known.
+
+        :returns:
+            whether the citation was resolved
+        """
+        cited_id = self.ids_by_cite.get(cite)
+        if cited_id is None:
+            return False
+        if cited_id != decision_id:
+            self.cites[decision_id].add(cited_id)
+            self.cited_by[cited_id].add(decision_id)
+        return True
+
+    def __contains__(self, decision_id: object) -> bool:
+        return decision_id in self.cites
+
+    def __len__(self) -> int:
+        return len(self.cites)
+
+    @property
+    def edges(self) -> List[Tuple[int, int]]:
+        """Get (citing ID, cited ID) pairs for every citation in the graph."""
+        return [
+            (citing, cited)
+            for citing, cited_ids in self.cites.items()
+            for cited in sorted(cited_ids)
+        ]
+
+    def neighbors(self, decision_id: int) -> Set[int]:
+        """Get decisions that cite or are cited by a decision."""
+        return self.cites.get(decision_id, set()) | self.cited_by.get(
+            decision_id, set()
+        )
+
+    def within(self, decision_id: int, hops: int = 1) -> Dict[int, int]:
+        """
+        Find decisions connected to a decision by a chain of citations.
+
+        The direction of the citations doesn't matter.
+
+        :param decision_id:
+            ID of the decision to start from
+
+        :param hops:
+            maximum number of citations in the chain
+
+        :returns:
+            the number of hops to each connected decision, not including
+            the starting decision
+        """
+        distances = {decision_id: 0}
+        queue = deque([decision_id])
+        while queue:
+            current = queue.popleft()
+            if distances[current] == hops:
+                continue
+            for neighbor in self.neighbors(current):
+                if neighbor not in distances:
+                    distances[neighbor] = distances[current] + 1
+                    queue.append(neighbor)
+        del distances[decision_id]
+        return distances
+
+    def connected(self, first_id: int, second_id: int, hops: int = 1) -> bool:
+        """Check whether two decisions are linked by at most ``hops`` citations."""
+        return second_id in self.within(first_id, hops=hops)
+
+    def pairs_within(
+        self, hops: int = 1, decision_ids: Optional[Iterable[int]] = None
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Yield each pair of decisions linked by at most ``hops`` citations.
+
+        Use these pairs instead of every pair of decisions to limit
+        comparisons to decisions that are likely to be related.
+
+        :param hops:
+            maximum number of citations linking the decisions in a pair
+
+        :param decision_ids:
+            if given, only pairs where both decisions are in this collection
+            are yielded, but the chains of citations can pass through any
+            decision in the graph
+
+        :returns:
+            pairs of IDs with the lower ID first, each yielded once
+        """
+        allowed = set(self.cites) if decision_ids is None else set(decision_ids)
+        for decision_id in sorted(allowed):
+            for other_id in sorted(self.within(decision_id, hops=hops)):
+                if other_id > decision_id and other_id in allowed:
+                    yield decision_id, other_id
@@ -0,0 +1,490 @@
+r"""
+Collections of :class:`.DecisionReading`\s that can be searched by their Holdings.
+
+A :class:`Corpus` indexes the :class:`.Holding`\s of every
+:class:`.DecisionReading` added to it by the predicate templates of their
+outputs, by the paths of the enactments they cite, and by the court and date
+of each :class:`~justopinion.decisions.Decision`\. A search for the Holdings
+that imply, are implied by, or contradict a Holding only compares it to
+the Holdings sharing one of its output templates, because those are the
+only Holdings the comparison could succeed for.
+
+A Corpus created with ``track_relations=True`` also keeps the set of
+pairs of its Holdings that imply or contradict each other. When a Holding
+is added or removed, only that Holding's relations are found or
+discarded, and each change is reported as a :class:`RelationChange`\.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from concurrent.futures import Executor
+import datetime
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+from typing import Tuple, Union
+
+from authorityspoke.decisions import DecisionReading
+from authorityspoke.holdings import Holding
+from authorityspoke.indexes import EnactmentPathIndex, output_templates
+from authorityspoke.rules import Rule
+
+IMPLIES = "implies"
+CONTRADICTS = "contradicts"
+
+
+class CorpusHolding(NamedTuple):
+    """A Holding in a Corpus, with the DecisionReading that posits it."""
+
+    reading: DecisionReading
+    holding: Holding
+
+
+class RelationChange(NamedTuple):
+    r"""
+    A relation between two Holdings of a Corpus that was found or discarded.
+
+    :param added:
+        ``True`` if the relation was found, or ``False`` if it was discarded
+        because one of the Holdings was removed
+
+    :param relation:
+        ``"implies"`` if ``left`` implies ``right``\, or ``"contradicts"``
+        if they contradict each other
+    """
+
+    added: bool
+    relation: str
+    left: CorpusHolding
+    right: CorpusHolding
+
+
+def _implies(left: Holding, right: Holding) -> bool:
+    return left.implies(right)
+
+
+def _contradicts(left: Holding, right: Holding) -> bool:
+    return left.contradicts(right)
+
+
+class Corpus:
+    r"""
+    Indexed collection of DecisionReadings.
+
+    The Holdings of a :class:`.DecisionReading` are indexed when the
+    DecisionReading is added to the Corpus. Holdings posited afterward
+    are only indexed if they're posited with :meth:`posit`\.
+    """
+
+    def __init__(
+        self, readings: Iterable[DecisionReading] = (), track_relations: bool = False
+    ):
+        r"""
+        Create Corpus, optionally containing some DecisionReadings.
+
+        :param readings:
+            :class:`.DecisionReading`\s to add to the Corpus
+
+        :param track_relations:
+            whether to keep the pairs of Holdings that imply or contradict
+            each other, updating them whenever a Holding is added or removed
+        """
+        self.track_relations = track_relations
+        self.readings: List[DecisionReading] = []
+        self.listeners: List[Callable[[RelationChange], None]] = []
+        # numbers of the readings, by the readings' ids
+        self._reading_ids: Dict[int, int] = {}
+        # Holdings by number; numbers of removed Holdings aren't reused
+        self._entries: Dict[int, CorpusHolding] = {}
+        self._next_number = 0
+        # the number of the reading each Holding came from
+        self._reading_numbers: Dict[int, int] = {}
+        # numbers of the Holdings with each output template
+        self._by_template: Dict[str, Set[int]] = {}
+        # numbers of the Holdings with outputs that can't be indexed by template
+        self._unindexed: Set[int] = set()
+        self._enactments = EnactmentPathIndex()
+        # numbers of the readings from each court
+        self._by_court: Dict[str, List[int]] = {}
+        self._dates: List[Tuple[datetime.date, int]] = []
+        # pairs of Holding numbers for each relation; contradiction pairs are sorted
+        self._relations: Dict[str, Set[Tuple[int, int]]] = {
+            IMPLIES: set(),
+            CONTRADICTS: set(),
+        }
+        for reading in readings:
+            self.add(reading)
+
+    def __len__(self) -> int:
+        return len(self.readings)
+
+    @property
+    def holdings(self) -> List[CorpusHolding]:
+        """Get every Holding in the Corpus, in the order they were added."""
+        return list(self._entries.values())
+
+    def subscribe(self, listener: Callable[[RelationChange], None]) -> None:
+        r"""
+        Call a function with every :class:`RelationChange` of the Corpus.
+
+        Changes are only found if the Corpus was created
+        with ``track_relations=True``\.
+        """
+        self.listeners.append(listener)
+
+    def relations(self, relation: str) -> List[Tuple[CorpusHolding, CorpusHolding]]:
+        r"""
+        Get the known pairs of Holdings with a relation.
+
+        :param relation:
+            ``"implies"`` for pairs where the first Holding implies the second,
+            or ``"contradicts"`` for pairs that contradict each other
+
+        :returns:
+            the pairs of Holdings, in the order the Holdings were added
+        """
+        return [
+            (self._entries[left], self._entries[right])
+            for left, right in sorted(self._relations[relation])
+        ]
+
+    def add(self, reading: DecisionReading) -> List[RelationChange]:
+        """
+        Add a DecisionReading and index its Holdings.
+
+        :returns:
+            the relations found for the DecisionReading's Holdings
+        """
+        reading_number = len(self.readings)
+        self.readings.append(reading)
+        self._reading_ids[id(reading)] = reading_number
+        court = reading.decision.court
+        if court is not None:
+            for key in {court.slug, court.name}:
+                self._by_court.setdefault(key, []).append(reading_number)
+        insort(self._dates, (reading.decision.decision_date, reading_number))
+        return self._add_holdings(reading_number, reading.holdings)
+
+    def posit(
+        self,
+        reading: DecisionReading,
+        holdings: Union[Holding, Rule, List[Union[Holding, Rule]]],
+    ) -> List[RelationChange]:
+        r"""
+        Posit Holdings in a DecisionReading of the Corpus and index them.
+
+        Holdings that :meth:`.DecisionReading.posit` merges with a Holding the
+        DecisionReading already had aren't indexed again. If the DecisionReading
+        isn't in the Corpus, it's added with all its Holdings.
+
+        :returns:
+            the relations found for the new Holdings
+        """
+        before = {id(holding) for holding in reading.holdings}
+        reading.posit(holdings)
+        if id(reading) not in self._reading_ids:
+            return self.add(reading)
+        new_holdings = [
+            holding for holding in reading.holdings if id(holding) not in before
+        ]
+        return self._add_holdings(self._reading_ids[id(reading)], new_holdings)
+
+    def remove_holding(self, holding: Holding) -> List[RelationChange]:
+        r"""
+        Remove a Holding from the Corpus's indexes.
+
+        The Holding isn't removed from its :class:`.DecisionReading`\.
+
+        :returns:
+            the relations discarded because they included the Holding
+        """
+        numbers = {
+            number
+            for number, entry in self._entries.items()
+            if entry.holding is holding
+        }
+        if not numbers:
+            return []
+        changes = []
+        for relation, pairs in self._relations.items():
+            for pair in sorted(pairs):
+                if pair[0] in numbers or pair[1] in numbers:
+                    pairs.discard(pair)
+                    changes.append(self._change(False, relation, pair))
+        for number in numbers:
+            del self._entries[number]
+            del self._reading_numbers[number]
+            self._unindexed.discard(number)
+        for template in list(self._by_template):
+            self._by_template[template] -= numbers
+            if not self._by_template[template]:
+                del self._by_template[template]
+        self._enactments.remove(holding)
+        self._announce(changes)
+        return changes
+
+    def _change(
+        self, added: bool, relation: str, pair: Tuple[int, int]
+    ) -> RelationChange:
+        return RelationChange(
+            added=added,
+            relation=relation,
+            left=self._entries[pair[0]],
+            right=self._entries[pair[1]],
+        )
+
+    def _announce(self, changes: List[RelationChange]) -> None:
+        for change in changes:
+            for listener in self.listeners:
+                listener(change)
+
+    def _add_holdings(
+        self, reading_number: int, holdings: Iterable[Holding]
+    ) -> List[RelationChange]:
+        reading = self.readings[reading_number]
+        changes = []
+        for holding in holdings:
+            number = self._next_number
+            self._next_number += 1
+            self._entries[number] = CorpusHolding(reading=reading, holding=holding)
+            self._reading_numbers[number] = reading_number
+            templates = output_templates(holding)
+            if templates is None:
+                self._unindexed.add(number)
+            else:
+                for template in templates:
+                    self._by_template.setdefault(template, set()).add(number)
+            self._enactments.add(holding)
+            if self.track_relations:
+                changes.extend(self._find_relations(number))
+        self._announce(changes)
+        return changes
+
+    def _find_relations(self, number: int) -> List[RelationChange]:
+        """Find the relations between a Holding and the earlier Holdings."""
+        holding = self._entries[number].holding
+        found = []
+        for other_number in self._candidate_numbers(holding):
+            if other_number == number:
+                continue
+            other = self._entries[other_number].holding
+            if holding.implies(other):
+                found.append((IMPLIES, (number, other_number)))
+            if other.implies(holding):
+                found.append((IMPLIES, (other_number, number)))
+            if holding.contradicts(other):
+                found.append((CONTRADICTS, (other_number, number)))
+        changes = []
+        for relation, pair in found:
+            self._relations[relation].add(pair)
+            changes.append(self._change(True, relation, pair))
+        return changes
+
+    def _readings_matching(
+        self,
+        court: Optional[str] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> Optional[Set[int]]:
+        """Get numbers of the readings passing the filters, or None if unfiltered."""
+        if court is None and start is None and end is None:
+            return None
+        low = 0 if start is None else bisect_left(self._dates, (start,))
+        high = (
+            len(self._dates)
+            if end is None
+            else bisect_right(self._dates, (end, len(self._dates)))
+        )
+        numbers = {number for _, number in self._dates[low:high]}
+        if court is not None:
+            numbers.intersection_update(self._by_court.get(court, ()))
+        return numbers
+
+    def find_readings(
+        self,
+        court: Optional[str] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> List[DecisionReading]:
+        """
+        Find the DecisionReadings for Decisions of a court or time period.
+
+        :param court:
+            the slug or name of the court that issued the Decision
+
+        :param start:
+            the earliest ``decision_date`` to include
+
+        :param end:
+            the latest ``decision_date`` to include
+
+        :returns:
+            the matching DecisionReadings, in the order they were added
+        """
+        numbers = self._readings_matching(court=court, start=start, end=end)
+        if numbers is None:
+            return list(self.readings)
+        return [self.readings[number] for number in sorted(numbers)]
+
+    def find_citing(
+        self,
+        path: str,
+        include_subsections: bool = True,
+        include_ancestors: bool = False,
+        despite: Optional[bool] = None,
+    ) -> List[CorpusHolding]:
+        r"""
+        Find the Holdings that cite an enactment.
+
+        Takes the same parameters as :meth:`.EnactmentPathIndex.find`\.
+        """
+        return [
+            self._entries[number]
+            for number in self._enactments.find_numbers(
+                path,
+                include_subsections=include_subsections,
+                include_ancestors=include_ancestors,
+                despite=despite,
+            )
+        ]
+
+    def _candidate_numbers(self, holding: Holding) -> Iterable[int]:
+        templates = output_templates(holding)
+        if templates is None:
+            return list(self._entries)
+        found = set(self._unindexed)
+        for template in templates:
+            found.update(self._by_template.get(template, ()))
+        return sorted(found)
+
+    def candidates(
+        self,
+        holding: Union[Holding, Rule],
+        court: Optional[str] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> List[CorpusHolding]:
+        r"""
+        Find the Holdings that could imply, be implied by, or contradict a Holding.
+
+        The candidates include every Holding with an output that has the same
+        predicate template as an output of ``holding``\, and every Holding
+        with outputs that can't be indexed by template.
+
+        :param holding:
+            the :class:`.Holding` or :class:`.Rule` to compare
+
+        :returns:
+            the candidate Holdings, in the order they were added,
+            from the DecisionReadings passing the filters
+            of :meth:`find_readings`
+        """
+        if isinstance(holding, Rule):
+            holding = Holding(rule=holding)
+        readings = self._readings_matching(court=court, start=start, end=end)
+        return [
+            self._entries[number]
+            for number in self._candidate_numbers(holding)
+            if readings is None or self._reading_numbers[number] in readings
+        ]
+
+    def _find(
+        self,
+        holding: Union[Holding, Rule],
+        test: Callable[[Holding, Holding], bool],
+        holding_first: bool,
+        executor: Optional[Executor],
+        **filters: Optional[Union[str, datetime.date]],
+    ) -> List[CorpusHolding]:
+        if isinstance(holding, Rule):
+            holding = Holding(rule=holding)
+        found = self.candidates(holding, **filters)
+        others = [item.holding for item in found]
+        queried = [holding] * len(found)
+        if holding_first:
+            arguments = (queried, others)
+        else:
+            arguments = (others, queried)
+        if executor is None:
+            results = map(test, *arguments)
+        else:
+            results = executor.map(test, *arguments)
+        return [item for item, result in zip(found, results) if result]
+
+    def find_implying(
+        self,
+        holding: Union[Holding, Rule],
+        court: Optional[str] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[CorpusHolding]:
+        r"""
+        Find the Holdings in the Corpus that imply a Holding.
+
+        :param holding:
+            the :class:`.Holding` or :class:`.Rule` that may be implied
+
+        :param executor:
+            a :class:`~concurrent.futures.Executor` for comparing the
+            candidate Holdings in parallel, such as a
+            :class:`~concurrent.futures.ProcessPoolExecutor`
+
+        :returns:
+            the Holdings that imply ``holding``\, from the DecisionReadings
+            passing the filters of :meth:`find_readings`
+        """
+        return self._find(
+            holding,
+            _implies,
+            holding_first=False,
+            executor=executor,
+            court=court,
+            start=start,
+            end=end,
+        )
+
+    def find_implied_by(
+        self,
+        holding: Union[Holding, Rule],
+        court: Optional[str] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[CorpusHolding]:
+        r"""
+        Find the Holdings in the Corpus that are implied by a Holding.
+
+        Takes the same parameters as :meth:`find_implying`\.
+        """
+        return self._find(
+            holding,
+            _implies,
+            holding_first=True,
+            executor=executor,
+            court=court,
+            start=start,
+            end=end,
+        )
+
+    def find_contradicting(
+        self,
+        holding: Union[Holding, Rule],
+        court: Optional[str] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[CorpusHolding]:
+        r"""
+        Find the Holdings in the Corpus that contradict a Holding.
+
+        Takes the same parameters as :meth:`find_implying`\.
+        """
+        return self._find(
+            holding,
+            _contradicts,
+            holding_first=False,
+            executor=executor,
+            court=court,
+            start=start,
+            end=end,
+        )
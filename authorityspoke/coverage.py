@@ -0,0 +1,171 @@
+r"""
+Summaries of the statutory text cited by Rules, for fast comparison.
+
+Comparing two :class:`~legislice.enactments.EnactmentPassage`\s builds a
+:class:`~anchorpoint.textsequences.TextSequence` of each passage's selected
+text every time. A :class:`PassageSummary` stores that selected text once,
+with an ID shared by every passage selecting the same text, and the results
+of implication tests between summaries are cached by those IDs. An
+:class:`EnactmentCoverage` holds the summaries for a whole
+:class:`~legislice.groups.EnactmentGroup`\.
+
+The results are the same as the comparisons of
+:class:`~legislice.enactments.EnactmentPassage`\s: a passage implies
+another if it contains all the other passage's selected text,
+and passages have the same meaning if they select the same text.
+
+The tables of IDs are cleared when they get too large, or when
+:func:`clear_caches` is called. IDs are never reused, so passages with
+the same ID always select the same text, but passages summarized before
+and after the tables were cleared can select the same text with different
+IDs. Comparisons fall back to the summaries' text when the IDs differ.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from typing import Dict, FrozenSet, Hashable, Iterable, NamedTuple, Optional, Tuple
+
+from legislice.enactments import EnactmentPassage
+
+# characters ignored at the ends of a passage when comparing text
+END_PUNCTUATION = ",:;. "
+
+MAX_CACHED_IMPLICATIONS = 100_000
+MAX_INTERNED = 100_000
+
+Meaning = Tuple[Optional[str], ...]
+
+
+class InternTable:
+    """Thread-safe table of IDs for keys, which never reuses an ID."""
+
+    def __init__(self, max_size: int = MAX_INTERNED):
+        """
+        Create empty table.
+
+        :param max_size:
+            number of keys to remember before forgetting them all
+        """
+        self.max_size = max_size
+        self.ids: Dict[Hashable, int] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def clear(self) -> None:
+        """Forget all keys, without reusing their IDs."""
+        with self._lock:
+            self.ids.clear()
+
+    def intern(self, key: Hashable) -> int:
+        """Get the ID for a key, adding the key to the table if it's new."""
+        found = self.ids.get(key)
+        if found is not None:
+            return found
+        with self._lock:
+            found = self.ids.get(key)
+            if found is None:
+                if len(self.ids) >= self.max_size:
+                    self.ids.clear()
+                found = next(self._counter)
+                self.ids[key] = found
+            return found
+
+
+_text_ids = InternTable()
+_meaning_ids = InternTable()
+_implications: Dict[Tuple[int, int], bool] = {}
+
+
+def clear_caches() -> None:
+    """Forget the IDs of summarized texts and the results of implication tests."""
+    _text_ids.clear()
+    _meaning_ids.clear()
+    _implications.clear()
+
+
+class PassageSummary(NamedTuple):
+    """The text selected by an :class:`~legislice.enactments.EnactmentPassage`."""
+
+    text_id: int
+    texts: Tuple[str, ...]
+    stripped: FrozenSet[str]
+    meaning_id: int
+    meaning: Meaning
+
+    @classmethod
+    def from_passage(cls, passage: EnactmentPassage) -> PassageSummary:
+        """Summarize the selected text of a passage."""
+        sequence = passage.text_sequence()
+        texts = tuple(item.text for item in sequence.passages if item is not None)
+        meaning = tuple(
+            None if item is None else item.text.strip(END_PUNCTUATION)
+            for item in sequence.strip().passages
+        )
+        return cls(
+            text_id=_text_ids.intern(texts),
+            texts=texts,
+            stripped=frozenset(text.strip(END_PUNCTUATION) for text in texts),
+            meaning_id=_meaning_ids.intern(meaning),
+            meaning=meaning,
+        )
+
+    def means(self, other: PassageSummary) -> bool:
+        """Test whether ``self`` selects the same text as ``other``."""
+        return self.meaning_id == other.meaning_id or self.meaning == other.meaning
+
+    def implies(self, other: PassageSummary) -> bool:
+        """Test whether ``self`` includes all the text selected in ``other``."""
+        if self.text_id == other.text_id:
+            return True
+        key = (self.text_id, other.text_id)
+        result = _implications.get(key)
+        if result is None:
+            result = all(
+                text in self.stripped or any(text in own for own in self.texts)
+                for text in other.stripped
+            )
+            if len(_implications) >= MAX_CACHED_IMPLICATIONS:
+                _implications.clear()
+            _implications[key] = result
+        return result
+
+
+class EnactmentCoverage(NamedTuple):
+    """Summaries of the passages of an EnactmentGroup."""
+
+    summaries: Tuple[PassageSummary, ...]
+    text_ids: FrozenSet[int]
+    meaning_ids: FrozenSet[int]
+    meanings: FrozenSet[Meaning]
+
+    @classmethod
+    def from_passages(cls, passages: Iterable[EnactmentPassage]) -> EnactmentCoverage:
+        """Summarize each passage of a group."""
+        summaries = tuple(PassageSummary.from_passage(passage) for passage in passages)
+        return cls(
+            summaries=summaries,
+            text_ids=frozenset(summary.text_id for summary in summaries),
+            meaning_ids=frozenset(summary.meaning_id for summary in summaries),
+            meanings=frozenset(summary.meaning for summary in summaries),
+        )
+
+    def implies_passage(self, other: PassageSummary) -> bool:
+        """Test whether any passage in the group implies ``other``."""
+        if other.text_id in self.text_ids:
+            return True
+        return any(summary.implies(other) for summary in self.summaries)
+
+    def implies_all(self, other: EnactmentCoverage) -> bool:
+        """Test whether each passage of ``other`` is implied by a passage of ``self``."""
+        return all(self.implies_passage(summary) for summary in other.summaries)
+
+    def has_all_meanings_of(self, other: EnactmentCoverage) -> bool:
+        """Test whether each passage of ``other`` has the meaning of one of ``self``."""
+        if other.meaning_ids <= self.meaning_ids:
+            return True
+        return other.meanings <= self.meanings
@@ -10,17 +10,20 @@ to multiple :class:`.authorityspoke.opinion.OpinionReading`\s.
 from __future__ import annotations
 
 import operator
-from typing import Dict, Iterator, List
+from typing import Any, Callable, Dict, Iterator, List
 from typing import Optional, Sequence, Tuple, Union
 
 from anchorpoint.textselectors import TextQuoteSelector, TextPositionSelector
+from anchorpoint.textselectors import TextPositionSet
 from justopinion.decisions import Decision, CaseBody, CaseData, Opinion, CAPCitation
 
 from nettlesome.terms import Comparable, ContextRegister, Explanation
 from nettlesome.factors import Factor
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
+from authorityspoke.explanations import ExplanationStream
 from authorityspoke.holdings import Holding, HoldingGroup
+from authorityspoke.indexes import QuoteIndex
 from authorityspoke.opinions import (
     OpinionReading,
     TermWithAnchors,
@@ -42,19 +45,52 @@ class DecisionReading(BaseModel, Comparable):
     decision: Decision
     generic: bool = False
     opinion_readings: List[OpinionReading] = []
+    _opinion_text_loaders: Dict[int, Callable[[], str]] = PrivateAttr(
+        default_factory=dict
+    )
+    # the list of OpinionReadings, its length, and its majority reading
+    _majority: Tuple[Optional[List[OpinionReading]], int, Optional[OpinionReading]] = (
+        PrivateAttr(default=(None, 0, None))
+    )
+    # the list of Opinions, its length, and the Opinions matching each
+    # (opinion_type, opinion_author) pair
+    _opinion_matches: Tuple[
+        Optional[List[Opinion]], int, Dict[Tuple[str, str], Optional[Opinion]]
+    ] = PrivateAttr(default=(None, 0, {}))
 
     def __str__(self):
         citation = self.decision.citations[0].cite if self.decision.citations else ""
         name = self.decision.name_abbreviation or self.decision.name
         return f"Reading for {name}, {citation} ({self.decision.decision_date})"
 
+    def _clear_pairings(self) -> None:
+        private = self.__pydantic_private__
+        private["_majority"] = (None, 0, None)
+        private["_opinion_matches"] = (None, 0, {})
+
     @property
     def majority(self) -> Optional[OpinionReading]:
-        """Return the majority OpinionReading, or None if it doesn't exist."""
-        for reading in self.opinion_readings:
+        r"""
+        Return the majority OpinionReading, or None if it doesn't exist.
+
+        The result is kept until :meth:`add_opinion_reading` is called, or until
+        ``opinion_readings`` is replaced or resized some other way.
+        """
+        # private attributes are read directly, because getting them through
+        # BaseModel.__getattr__ would take longer than searching a short list
+        private = self.__pydantic_private__
+        readings = self.opinion_readings
+        cached_readings, length, majority = private["_majority"]
+        if cached_readings is readings and length == len(readings):
+            if majority is None or majority.opinion_type == "majority":
+                return majority
+        majority = None
+        for reading in readings:
             if reading.opinion_type == "majority":
-                return reading
-        return None
+                majority = reading
+                break
+        private["_majority"] = (readings, len(readings), majority)
+        return majority
 
     @property
     def opinions(self) -> List[Opinion]:
@@ -66,10 +102,24 @@ class DecisionReading(BaseModel, Comparable):
         opinion_type: str = "",
         opinion_author: str = "",
     ) -> Optional[Opinion]:
-        """Find an Opinion described by the given attributes."""
-        return self.decision.find_matching_opinion(
-            opinion_type=opinion_type, opinion_author=opinion_author
-        )
+        r"""
+        Find an Opinion described by the given attributes.
+
+        Results are kept until :meth:`add_opinion` is called, or until
+        the Decision's list of Opinions is replaced or resized some other way.
+        """
+        private = self.__pydantic_private__
+        opinions = self.decision.opinions
+        cached_opinions, length, matches = private["_opinion_matches"]
+        if cached_opinions is not opinions or length != len(opinions):
+            matches = {}
+            private["_opinion_matches"] = (opinions, len(opinions), matches)
+        key = (opinion_type, opinion_author)
+        if key not in matches:
+            matches[key] = self.decision.find_matching_opinion(
+                opinion_type=opinion_type, opinion_author=opinion_author
+            )
+        return matches[key]
 
     def find_opinion_matching_reading(
         self,
@@ -81,6 +131,90 @@ class DecisionReading(BaseModel, Comparable):
             opinion_author=opinion_reading.opinion_author,
         )
 
+    def set_opinion_text_loader(
+        self, opinion_index: int, loader: Callable[[], str]
+    ) -> None:
+        r"""
+        Use a function to get an Opinion's text when it's first needed.
+
+        The :class:`~justopinion.decisions.Opinion`'s ``text`` attribute
+        stays empty until the text is loaded, so code that reads
+        ``opinion.text`` directly, or saves the Decision instead of the
+        DecisionReading, should call :meth:`load_opinion_texts` first.
+        The text is loaded automatically by :meth:`select_text`,
+        :meth:`locate_text`, :meth:`resolve_anchor_positions`,
+        :meth:`model_dump`, and :meth:`model_dump_json`\.
+
+        :param opinion_index:
+            the position of the Opinion in the Decision's list of Opinions
+
+        :param loader:
+            a function that returns the text of the Opinion
+        """
+        self._opinion_text_loaders[opinion_index] = loader
+
+    def load_opinion_text(self, opinion: Opinion) -> Opinion:
+        """Load an Opinion's text, if it was left to be loaded later."""
+        for index, candidate in enumerate(self.opinions):
+            if candidate is opinion and index in self._opinion_text_loaders:
+                opinion.text = self._opinion_text_loaders.pop(index)()
+        return opinion
+
+    def read_opinion_text(self, opinion: Opinion) -> str:
+        """
+        Get an Opinion's text without keeping it, if it was left to be loaded later.
+
+        Unlike :meth:`load_opinion_text`, the text isn't stored on the Opinion,
+        so reading the text of many DecisionReadings doesn't keep all of
+        it in memory.
+        """
+        for index, candidate in enumerate(self.opinions):
+            if candidate is opinion and index in self._opinion_text_loaders:
+                return self._opinion_text_loaders[index]()
+        return opinion.text
+
+    def load_opinion_texts(self) -> None:
+        """Load the text of every Opinion, e.g. before saving the Decision."""
+        for opinion in self.opinions:
+            self.load_opinion_text(opinion)
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """Serialize the DecisionReading, after loading any Opinion text."""
+        self.load_opinion_texts()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize the DecisionReading as JSON, after loading any Opinion text."""
+        self.load_opinion_texts()
+        return super().model_dump_json(**kwargs)
+
+    def locate_text(
+        self,
+        selector: Union[
+            bool,
+            str,
+            TextPositionSelector,
+            TextQuoteSelector,
+            Sequence[Union[str, TextQuoteSelector, TextPositionSelector]],
+        ],
+        opinion_type: str = "",
+        opinion_author: str = "",
+    ) -> Optional[TextPositionSet]:
+        r"""
+        Find the positions of text in an Opinion, to resolve anchors for the Opinion.
+
+        :param selector:
+            a selector referencing a text passage in the :class:`Opinion`.
+
+        :returns:
+            the positions of the selected text, or ``None`` if
+            there's no matching Opinion.
+        """
+        opinion = self.find_matching_opinion(opinion_type, opinion_author)
+        if opinion is None:
+            return None
+        return self.load_opinion_text(opinion).locate_text(selector)
+
     def select_text(
         self,
         selector: Union[
@@ -106,7 +240,26 @@ class DecisionReading(BaseModel, Comparable):
             can't be found.
         """
         opinion = self.find_matching_opinion(opinion_type, opinion_author)
-        return opinion.select_text(selector) if opinion else None
+        if opinion is None:
+            return None
+        return self.load_opinion_text(opinion).select_text(selector)
+
+    def resolve_anchor_positions(self) -> None:
+        r"""
+        Add the positions of the quotes in each OpinionReading's anchors.
+
+        Each :class:`.Opinion`'s text is indexed once with a
+        :class:`.QuoteIndex`, and all the quotes anchoring holdings,
+        terms, and enactments to that Opinion are found with the index.
+        """
+        for opinion_reading in self.opinion_readings:
+            opinion = self.find_opinion_matching_reading(opinion_reading)
+            if opinion is None:
+                continue
+            index = QuoteIndex(self.load_opinion_text(opinion).text)
+            opinion_reading.anchored_holdings = index.resolve_anchors(
+                opinion_reading.anchored_holdings
+            )
 
     def add_opinion_reading(self, opinion_reading: OpinionReading) -> None:
         """Add an OpinionReading for an existing Opinion of the Decision."""
@@ -119,6 +272,7 @@ class DecisionReading(BaseModel, Comparable):
                 matching_opinion.author or opinion_reading.opinion_author
             )
         self.opinion_readings.append(opinion_reading)
+        self._clear_pairings()
 
     def get_majority(self) -> Optional[OpinionReading]:
         """Return the majority OpinionReading, creating it if needed."""
@@ -131,6 +285,7 @@ class DecisionReading(BaseModel, Comparable):
                     opinion_type=opinion.type, opinion_author=opinion.author
                 )
                 self.opinion_readings.append(new_reading)
+                self._clear_pairings()
                 return new_reading
         return None
 
@@ -138,9 +293,9 @@ class DecisionReading(BaseModel, Comparable):
     def holdings(self) -> HoldingGroup:
         """Get the holdings of this Decision's majority Opinion."""
         if self.majority is not None:
-            return HoldingGroup(self.majority.holdings)
+            return self.majority.holdings
         elif len(self.opinion_readings) == 1:
-            return HoldingGroup(self.opinion_readings[0].holdings)
+            return self.opinion_readings[0].holdings
         return HoldingGroup()
 
     def add_opinion(self, opinion: Opinion) -> None:
@@ -148,6 +303,7 @@ class DecisionReading(BaseModel, Comparable):
         if not self.decision.casebody:
             self.decision.casebody = CaseBody(data=CaseData())
         self.decision.casebody.data.opinions.append(opinion)
+        self._clear_pairings()
 
     def contradicts(self, other):
         """Check if a holding attributed to this decision contradicts a holding attributed in "other"."""
@@ -197,6 +353,18 @@ class DecisionReading(BaseModel, Comparable):
             return None
         return explanation
 
+    def stream_contradiction(
+        self, other: Union[DecisionReading, Opinion, Holding, Rule]
+    ) -> ExplanationStream:
+        """Get a stream of distinct Explanations of how self contradicts other."""
+        return ExplanationStream(self.explanations_contradiction(other))
+
+    def stream_implication(
+        self, other: Union[DecisionReading, Decision, Opinion, Holding, Rule]
+    ) -> ExplanationStream:
+        """Get a stream of distinct Explanations of how self implies other."""
+        return ExplanationStream(self.explanations_implication(other))
+
     def explanations_implication(
         self, other: Union[DecisionReading, Decision, Opinion, Holding, Rule]
     ) -> Iterator[Explanation]:
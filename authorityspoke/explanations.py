@@ -0,0 +1,154 @@
+r"""
+Streams of :class:`~nettlesome.terms.Explanation`\s that can be read in pages.
+
+Methods like :meth:`.DecisionReading.explanations_contradiction` generate
+Explanations one at a time, and often generate the same
+:class:`~nettlesome.terms.ContextRegister` several times, by comparing
+different pairs of Holdings or Factors. An :class:`ExplanationStream` skips
+the repeated registers and remembers each distinct Explanation it has
+generated, so any page of Explanations can be read without generating the
+earlier ones again.
+"""
+
+from __future__ import annotations
+
+from typing import FrozenSet, Iterable, Iterator, List, NamedTuple, Optional
+from typing import Set, Tuple, Union
+
+from nettlesome.terms import ContextRegister, Explanation
+
+RegisterKey = FrozenSet[Tuple[str, str]]
+
+# marks the end of the generator, which may also yield None
+_END = object()
+
+
+def register_key(explanation: Union[Explanation, ContextRegister]) -> RegisterKey:
+    """Get the pairs of Term keys matched by an Explanation's context register."""
+    if isinstance(explanation, Explanation):
+        explanation = explanation.context
+    return frozenset((key, value.key) for key, value in explanation.items())
+
+
+class ExplanationPage(NamedTuple):
+    r"""
+    Part of the Explanations of an :class:`ExplanationStream`\.
+
+    :param explanations:
+        the Explanations on the page
+
+    :param next_cursor:
+        the cursor for the next page, or ``None`` if this is the last page
+    """
+
+    explanations: List[Explanation]
+    next_cursor: Optional[int]
+
+
+class ExplanationStream:
+    r"""
+    Explanations from a generator, without repeated context registers.
+
+    Each Explanation is generated only once, when it's first needed.
+    """
+
+    def __init__(
+        self,
+        explanations: Iterable[Union[Explanation, ContextRegister]],
+        distinct: bool = True,
+    ):
+        r"""
+        Prepare to read Explanations from an iterable.
+
+        :param explanations:
+            the Explanations to read, usually from a generator
+            such as :meth:`.OpinionReading.explanations_implication`
+
+        :param distinct:
+            whether to skip Explanations with the same context register
+            as an earlier Explanation
+        """
+        self.distinct = distinct
+        self._source: Optional[Iterator] = iter(explanations)
+        self._found: List[Union[Explanation, ContextRegister]] = []
+        self._keys: Set[RegisterKey] = set()
+
+    def __iter__(self) -> Iterator[Union[Explanation, ContextRegister]]:
+        number = 0
+        while self._fill(number + 1):
+            yield self._found[number]
+            number += 1
+
+    def __len__(self) -> int:
+        """Count the Explanations generated so far."""
+        return len(self._found)
+
+    @property
+    def exhausted(self) -> bool:
+        """Check whether every Explanation has been generated."""
+        return self._source is None
+
+    def _fill(self, count: Optional[int] = None) -> bool:
+        """
+        Generate Explanations until there are ``count`` of them, if possible.
+
+        :param count:
+            the number of Explanations needed, or ``None`` to generate all of them
+
+        :returns:
+            whether there are at least ``count`` Explanations
+        """
+        while self._source is not None and (count is None or len(self._found) < count):
+            explanation = next(self._source, _END)
+            if explanation is _END:
+                self._source = None
+            elif explanation is None:
+                continue
+            elif not self.distinct:
+                self._found.append(explanation)
+            else:
+                key = register_key(explanation)
+                if key not in self._keys:
+                    self._keys.add(key)
+                    self._found.append(explanation)
+        return count is None or len(self._found) >= count
+
+    def get(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Union[Explanation, ContextRegister]]:
+        """
+        Get some of the Explanations, generating them if needed.
+
+        :param offset:
+            the number of Explanations to skip
+
+        :param limit:
+            the most Explanations to get, or ``None`` to get all the rest
+        """
+        if limit is None:
+            self._fill()
+            return self._found[offset:]
+        self._fill(offset + limit)
+        return self._found[offset : offset + limit]
+
+    def first(self, limit: int) -> List[Union[Explanation, ContextRegister]]:
+        """Get up to ``limit`` Explanations."""
+        return self.get(limit=limit)
+
+    def page(self, cursor: int = 0, limit: int = 10) -> ExplanationPage:
+        r"""
+        Get a page of Explanations, and the cursor for the next page.
+
+        :param cursor:
+            ``0`` for the first page, or the ``next_cursor`` of
+            the previous :class:`ExplanationPage`
+
+        :param limit:
+            the most Explanations on the page
+        """
+        explanations = self.get(offset=cursor, limit=limit)
+        next_cursor = cursor + len(explanations)
+        # only look ahead one Explanation to decide whether there's another page
+        if not self._fill(next_cursor + 1):
+            return ExplanationPage(explanations=explanations, next_cursor=None)
+        return ExplanationPage(explanations=explanations, next_cursor=next_cursor)
@@ -0,0 +1,497 @@
+r"""
+Indexes for lookups that would otherwise scan a whole text or list of Holdings.
+
+A :class:`QuoteIndex` is built once for an Opinion's text, and then
+resolves any number of :class:`~anchorpoint.textselectors.TextQuoteSelector`\s
+to the same positions that
+:meth:`~anchorpoint.textselectors.TextQuoteSelector.as_position` would find.
+
+    >>> text = "process, system, method of operation, concept, principle"
+    >>> index = QuoteIndex(text)
+    >>> index.as_position(TextQuoteSelector(exact="method of operation"))
+    TextPositionSelector(start=17, end=36)
+
+An :class:`EnactmentPathIndex` finds the :class:`.Holding`\s that cite
+an enactment or any of its subsections, :func:`holding_fingerprint`
+sorts Holdings into groups that could have the same meaning, and
+:func:`output_templates` sorts them into groups that could imply or
+contradict each other.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from functools import lru_cache
+import re
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from anchorpoint.textselectors import (
+    TextPositionSelector,
+    TextPositionSet,
+    TextQuoteSelector,
+    TextSelectionError,
+)
+from legislice.download import normalize_path
+from legislice.enactments import EnactmentPassage
+from nettlesome.entities import Entity
+from nettlesome.factors import Factor
+from ranges import RangeSet
+
+from authorityspoke.coverage import Meaning
+from authorityspoke.holdings import Holding
+from authorityspoke.rules import Rule
+
+if TYPE_CHECKING:
+    from authorityspoke.opinions import AnchoredHoldings
+
+QuoteKey = Tuple[str, str, str]
+
+# class name, whether generic, whether absent, and a summary of any predicate
+FactorKind = Tuple[str, bool, Optional[bool], Optional[Tuple]]
+HoldingFingerprint = Tuple[
+    bool,
+    bool,
+    bool,
+    bool,
+    FrozenSet[Meaning],
+    FrozenSet[Meaning],
+    FrozenSet[FactorKind],
+    FrozenSet[FactorKind],
+    FrozenSet[FactorKind],
+]
+
+WORD_START = re.compile(r"(?<!\w)\w")
+INNER_WORD_START = re.compile(r"(?<=\W)\w")
+
+
+class QuoteIndex:
+    r"""
+    Index of the word-initial substrings of a text, for locating quotations.
+
+    Matching is case-insensitive, and any whitespace is allowed between
+    a selector's ``prefix``, ``exact``, and ``suffix``, like
+    :meth:`~anchorpoint.textselectors.TextQuoteSelector.find_match`\.
+    Selectors the index can't handle exactly, such as selectors without
+    an ``exact`` quotation, are resolved with the selector's own regular expression.
+    """
+
+    def __init__(self, text: str, gram_size: int = 8):
+        """
+        Prepare to index a text. The index is built the first time it's needed.
+
+        :param text:
+            the text where quotations will be located
+
+        :param gram_size:
+            length of the substrings used as index keys
+        """
+        self.text = text
+        self.gram_size = gram_size
+        self.folded = text.lower()
+        # Lowercasing some characters changes the length of the string,
+        # so the positions in the folded text would no longer match.
+        self.aligned = len(self.folded) == len(text)
+        self._grams: Optional[Dict[str, List[int]]] = None
+        self._positions: Dict[QuoteKey, Optional[TextPositionSelector]] = {}
+
+    @property
+    def grams(self) -> Dict[str, List[int]]:
+        """
+        Get the positions of each word-initial substring of length ``gram_size``.
+
+        Only substrings that start at the beginning of a word are indexed,
+        which keeps the index several times smaller than the text.
+        """
+        if self._grams is None:
+            grams: Dict[str, List[int]] = {}
+            size = self.gram_size
+            folded = self.folded
+            for match in WORD_START.finditer(folded):
+                start = match.start()
+                grams.setdefault(folded[start : start + size], []).append(start)
+            self._grams = grams
+        return self._grams
+
+    def _candidate_starts(self, exact: str) -> Iterable[int]:
+        """Get positions where ``exact`` may start, in order."""
+        size = self.gram_size
+        # A word start inside the quotation is also a word start in the text.
+        offsets = [
+            match.start()
+            for match in INNER_WORD_START.finditer(exact)
+            if match.start() + size <= len(exact)
+        ]
+        if not offsets:
+            start = self.folded.find(exact)
+            while start != -1:
+                yield start
+                start = self.folded.find(exact, start + 1)
+            return
+        best_offset = min(
+            offsets[:8],
+            key=lambda offset: len(self.grams.get(exact[offset : offset + size], ())),
+        )
+        for start in self.grams.get(exact[best_offset : best_offset + size], ()):
+            if start >= best_offset:
+                yield start - best_offset
+
+    def _has_prefix(self, prefix: str, start: int) -> bool:
+        """Check for ``prefix`` and then any whitespace, ending at ``start``."""
+        if not prefix:
+            return True
+        end = start
+        while end > 0 and self.text[end - 1].isspace():
+            end -= 1
+        prefix_start = end - len(prefix)
+        return prefix_start >= 0 and bool(
+            _literal_pattern(prefix).fullmatch(self.text, prefix_start, end)
+        )
+
+    def _has_suffix(self, suffix: str, end: int) -> bool:
+        """Check for any whitespace and then ``suffix``, starting at ``end``."""
+        if not suffix:
+            return True
+        while end < len(self.text) and self.text[end].isspace():
+            end += 1
+        return bool(_literal_pattern(suffix).match(self.text, end))
+
+    def _locate_with_index(
+        self, selector: TextQuoteSelector
+    ) -> Optional[TextPositionSelector]:
+        exact_pattern = _literal_pattern(selector.exact)
+        prefix = selector.prefix.strip()
+        suffix = selector.suffix.strip()
+        for start in self._candidate_starts(selector.exact.lower()):
+            match = exact_pattern.match(self.text, start)
+            if (
+                match
+                and self._has_prefix(prefix, start)
+                and self._has_suffix(suffix, match.end())
+            ):
+                return TextPositionSelector(start=start, end=match.end())
+        return None
+
+    def _can_use_index(self, selector: TextQuoteSelector) -> bool:
+        exact = selector.exact
+        return (
+            self.aligned
+            and bool(exact)
+            and not exact[0].isspace()
+            and not exact[-1].isspace()
+            and len(exact.lower()) == len(exact)
+        )
+
+    def locate(self, selector: TextQuoteSelector) -> Optional[TextPositionSelector]:
+        """
+        Find the first position of the text selected by a quote selector.
+
+        :returns:
+            the position of the ``exact`` text, or ``None`` if the
+            selector doesn't match the text
+        """
+        key = (selector.prefix, selector.exact, selector.suffix)
+        if key not in self._positions:
+            position = None
+            if self._can_use_index(selector):
+                position = self._locate_with_index(selector)
+            if position is None:
+                match = selector.find_match(self.text)
+                if match:
+                    position = TextPositionSelector(
+                        start=match.start(1), end=match.end(1)
+                    )
+            self._positions[key] = position
+        return self._positions[key]
+
+    def as_position(self, selector: TextQuoteSelector) -> TextPositionSelector:
+        """Get the position of a quote selector, or raise an error if it isn't found."""
+        position = self.locate(selector)
+        if position is None:
+            text_sample = self.text[:100] + "..." if len(self.text) > 100 else self.text
+            raise TextSelectionError(
+                f'Unable to find pattern "{selector.passage_regex()}" '
+                f'in text: "{text_sample}"'
+            )
+        return position
+
+    def convert_quotes_to_positions(self, anchors: TextPositionSet) -> TextPositionSet:
+        """Get copy of a set of anchors, with the positions of its quotes added."""
+        if not anchors.quotes:
+            return anchors
+        rangeset = RangeSet(
+            [self.as_position(quote).range() for quote in anchors.quotes]
+        )
+        return anchors.merge_rangeset(rangeset)
+
+    def resolve_anchors(self, anchored: AnchoredHoldings) -> AnchoredHoldings:
+        r"""
+        Convert all the quote anchors of an :class:`.AnchoredHoldings` to positions.
+
+        Each distinct quote is located only once, even if it's used
+        as an anchor for several holdings, terms, or enactments.
+
+        :returns:
+            a new :class:`.AnchoredHoldings` with the same holdings, terms,
+            and enactments, whose anchors include the positions of their quotes
+        """
+        return anchored.model_copy(
+            update={
+                field: [
+                    item.model_copy(
+                        update={
+                            "anchors": self.convert_quotes_to_positions(item.anchors)
+                        }
+                    )
+                    for item in getattr(anchored, field)
+                ]
+                for field in ("holdings", "named_anchors", "enactment_anchors")
+            }
+        )
+
+
+class EnactmentPathIndex:
+    r"""
+    Index from the paths of cited enactments to the Holdings or Rules citing them.
+
+    Each :class:`.Holding` or :class:`.Rule` is indexed under the ``node``
+    path of every passage in its ``enactments`` and ``enactments_despite``\.
+    A query for a path also finds items citing subsections of that path,
+    so a query for ``/us/usc/t17/s102`` finds items citing
+    ``/us/usc/t17/s102/b``\.
+    """
+
+    def __init__(self, items: Iterable[Union[Holding, Rule]] = ()):
+        r"""
+        Create index, optionally containing some Holdings or Rules.
+
+        :param items:
+            :class:`.Holding`\s or :class:`.Rule`\s to add to the index
+        """
+        # removed items are replaced with None, so the other items keep their numbers
+        self._items: List[Optional[Union[Holding, Rule]]] = []
+        # lists of (item number, whether the enactment is "despite") for each path
+        self._citing: Dict[str, List[Tuple[int, bool]]] = {}
+        self._sorted_paths: List[str] = []
+        self._removed = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._items) - self._removed
+
+    @property
+    def paths(self) -> List[str]:
+        """Get every enactment path in the index, in sorted order."""
+        return list(self._sorted_paths)
+
+    def add(self, item: Union[Holding, Rule]) -> None:
+        """Index a Holding or Rule under the paths of the enactments it cites."""
+        number = len(self._items)
+        self._items.append(item)
+        for passages, despite in (
+            (item.enactments, False),
+            (item.enactments_despite, True),
+        ):
+            for passage in passages:
+                path = enactment_path(passage)
+                if path not in self._citing:
+                    self._citing[path] = []
+                    insort(self._sorted_paths, path)
+                self._citing[path].append((number, despite))
+
+    def remove(self, item: Union[Holding, Rule]) -> None:
+        r"""
+        Remove a Holding or Rule from the index.
+
+        The numbers returned by :meth:`find_numbers` for the other items
+        don't change.
+        """
+        numbers = {
+            number for number, indexed in enumerate(self._items) if indexed is item
+        }
+        if not numbers:
+            return
+        for number in numbers:
+            self._items[number] = None
+        self._removed += len(numbers)
+        for path in list(self._citing):
+            citing = [entry for entry in self._citing[path] if entry[0] not in numbers]
+            if citing:
+                self._citing[path] = citing
+            else:
+                del self._citing[path]
+                self._sorted_paths.remove(path)
+
+    def _paths_matching(
+        self, path: str, include_subsections: bool, include_ancestors: bool
+    ) -> Iterable[str]:
+        if path in self._citing:
+            yield path
+        if include_subsections:
+            # "0" sorts right after "/", so this covers every path under ``path``
+            start = bisect_left(self._sorted_paths, path + "/")
+            end = bisect_left(self._sorted_paths, path + "0")
+            yield from self._sorted_paths[start:end]
+        if include_ancestors:
+            parts = path.strip("/").split("/")
+            for length in range(1, len(parts)):
+                ancestor = "/" + "/".join(parts[:length])
+                if ancestor in self._citing:
+                    yield ancestor
+
+    def find(
+        self,
+        path: str,
+        include_subsections: bool = True,
+        include_ancestors: bool = False,
+        despite: Optional[bool] = None,
+    ) -> List[Union[Holding, Rule]]:
+        """
+        Find the Holdings or Rules that cite an enactment.
+
+        :param path:
+            the path of the enactment's node, like ``/us/usc/t17/s102``
+
+        :param include_subsections:
+            whether to include items that only cite part of the enactment
+
+        :param include_ancestors:
+            whether to include items that cite a larger passage containing
+            the enactment, such as the whole section of a subsection
+
+        :param despite:
+            if ``True``, only find items citing the enactment in
+            ``enactments_despite``; if ``False``, only in ``enactments``
+
+        :returns:
+            the matching items, in the order they were added to the index
+        """
+        numbers = self.find_numbers(
+            path,
+            include_subsections=include_subsections,
+            include_ancestors=include_ancestors,
+            despite=despite,
+        )
+        return [self._items[number] for number in numbers]
+
+    def find_numbers(
+        self,
+        path: str,
+        include_subsections: bool = True,
+        include_ancestors: bool = False,
+        despite: Optional[bool] = None,
+    ) -> List[int]:
+        r"""
+        Find the positions of the Holdings or Rules that cite an enactment.
+
+        Takes the same parameters as :meth:`find`\.
+
+        :returns:
+            the order in which each matching item was added to the index,
+            counting from 0
+        """
+        path = normalize_path(path)
+        numbers = set()
+        for matching_path in self._paths_matching(
+            path,
+            include_subsections=include_subsections,
+            include_ancestors=include_ancestors,
+        ):
+            for number, is_despite in self._citing[matching_path]:
+                if despite is None or despite == is_despite:
+                    numbers.add(number)
+        return sorted(numbers)
+
+
+def enactment_path(passage: EnactmentPassage) -> str:
+    """Get the normalized path of the node of an enactment passage."""
+    return normalize_path(passage.node)
+
+
+def _predicate_kind(factor: Factor) -> Optional[Tuple]:
+    """Summarize the parts of a Fact's predicate that must match for it to mean another."""
+    predicate = getattr(factor, "predicate", None)
+    if factor.generic or predicate is None:
+        return None
+    return (
+        predicate.__class__.__name__,
+        predicate.content_without_placeholders().lower(),
+        predicate.truth,
+        getattr(factor, "standard_of_proof", None),
+    )
+
+
+def _factor_kinds(factors: Iterable[Factor]) -> FrozenSet[FactorKind]:
+    # Entity.means doesn't compare the "absent" attribute
+    return frozenset(
+        (
+            factor.__class__.__name__,
+            factor.generic,
+            None if isinstance(factor, Entity) else factor.absent,
+            _predicate_kind(factor),
+        )
+        for factor in factors
+    )
+
+
+def holding_fingerprint(holding: Holding) -> HoldingFingerprint:
+    r"""
+    Summarize the attributes shared by any Holdings with the same meaning.
+
+    Holdings with different fingerprints can't have the same meaning, so a new
+    Holding only needs to be compared to known Holdings with the same fingerprint.
+    The fingerprint includes the Holding's and Rule's flags, the meanings of
+    the Rule's enactments, and the kinds of Factors in each part of its
+    :class:`.Procedure`\, but not the Factors' content.
+    """
+    rule = holding.rule
+    return (
+        holding.rule_valid,
+        holding.decided,
+        rule.mandatory,
+        rule.universal,
+        rule.enactment_coverage("enactments").meanings,
+        rule.enactment_coverage("enactments_despite").meanings,
+        _factor_kinds(rule.outputs),
+        _factor_kinds(rule.inputs),
+        _factor_kinds(rule.despite),
+    )
+
+
+def output_templates(holding: Union[Holding, Rule]) -> Optional[FrozenSet[str]]:
+    r"""
+    Get the predicate templates of the outputs of a Holding or Rule.
+
+    A Holding can only imply or contradict another Holding if an output of one
+    has the same predicate template as an output of the other, because
+    concrete :class:`.Fact`\s are only compared if their predicates have the
+    same content. That's also true of the contrapositives of an ``exclusive``
+    Holding, whose outputs are the same Factors marked ``absent``\.
+
+    :returns:
+        the lowercased content of each output's predicate without its
+        placeholders, or ``None`` if any output is generic or has no predicate,
+        so that it can't be ruled out by its content
+    """
+    templates = set()
+    for factor in holding.outputs:
+        kind = _predicate_kind(factor)
+        if kind is None:
+            return None
+        templates.add(kind[1])
+    return frozenset(templates) or None
+
+
+@lru_cache(maxsize=1024)
+def _literal_pattern(text: str) -> re.Pattern:
+    """Compile a case-insensitive pattern matching exactly the given text."""
+    return re.compile(re.escape(text), re.IGNORECASE)
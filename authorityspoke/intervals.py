@@ -0,0 +1,140 @@
+r"""
+Index of ranges of text, for finding what is anchored at a place in an Opinion.
+
+An :class:`IntervalIndex` stores :class:`Span`\s, each linking a range of
+character positions to an object such as a :class:`.HoldingWithAnchors`\.
+It finds every span overlapping a range or containing a position in
+logarithmic time plus the number of spans found, and new spans can be
+added without rebuilding the whole index.
+
+    >>> index = IntervalIndex()
+    >>> index.add(Span(start=0, end=10, item="first sentence"))
+    >>> index.add(Span(start=5, end=20, item="second sentence"))
+    >>> [span.item for span in index.at(7)]
+    ['first sentence', 'second sentence']
+    >>> [span.item for span in index.overlapping(10, 15)]
+    ['second sentence']
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import heapq
+import sys
+from typing import Any, Iterable, Iterator, List, NamedTuple
+
+# ``end`` of a span that continues to the end of the text, however long it is
+END_OF_TEXT = sys.maxsize
+
+
+class Span(NamedTuple):
+    r"""
+    A range of text positions, from ``start`` up to but not including ``end``.
+
+    A span with no known end should use :data:`END_OF_TEXT` as its ``end``\.
+    """
+
+    start: int
+    end: int
+    item: Any
+
+
+class _IntervalBlock:
+    """
+    Unchanging group of spans sorted by where they start.
+
+    A tree of the greatest ``end`` in each range of the sorted spans
+    allows skipping any range of spans that all end too early.
+    """
+
+    def __init__(self, spans: Iterable[Span]):
+        self.spans = sorted(spans, key=lambda span: (span.start, span.end))
+        self.starts = [span.start for span in self.spans]
+        size = 1
+        while size < len(self.spans):
+            size *= 2
+        self.size = size
+        max_ends = [-1] * (2 * size)
+        for position, span in enumerate(self.spans):
+            max_ends[size + position] = span.end
+        for node in range(size - 1, 0, -1):
+            max_ends[node] = max(max_ends[2 * node], max_ends[2 * node + 1])
+        self.max_ends = max_ends
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def overlapping(self, start: int, end: int) -> Iterator[Span]:
+        """Yield spans that start before ``end`` and end after ``start``, in order."""
+        limit = bisect_left(self.starts, end)
+        stack = [(1, 0, self.size)]
+        while stack:
+            node, low, high = stack.pop()
+            if low >= limit or self.max_ends[node] <= start:
+                continue
+            if node >= self.size:
+                yield self.spans[node - self.size]
+                continue
+            middle = (low + high) // 2
+            stack.append((2 * node + 1, middle, high))
+            stack.append((2 * node, low, middle))
+
+
+class IntervalIndex:
+    r"""
+    Index of :class:`Span`\s supporting overlap and point queries.
+
+    Spans are kept in blocks whose sizes decrease by at least half
+    from one block to the next. Adding a span merges it with any smaller
+    blocks, so each span is only moved into a new block a logarithmic
+    number of times.
+    """
+
+    def __init__(self, spans: Iterable[Span] = ()):
+        """
+        Create index, optionally containing some spans.
+
+        :param spans:
+            spans to include in the index
+        """
+        spans = list(spans)
+        self._blocks: List[_IntervalBlock] = [_IntervalBlock(spans)] if spans else []
+
+    def __len__(self) -> int:
+        return sum(len(block) for block in self._blocks)
+
+    def add(self, span: Span) -> None:
+        """Add a span to the index."""
+        merged = [span]
+        while self._blocks and len(self._blocks[-1]) <= len(merged):
+            merged = self._blocks.pop().spans + merged
+        self._blocks.append(_IntervalBlock(merged))
+
+    def extend(self, spans: Iterable[Span]) -> None:
+        """Add several spans to the index."""
+        for span in spans:
+            self.add(span)
+
+    def overlapping(self, start: int, end: int) -> List[Span]:
+        """
+        Find spans that share at least one position with a range.
+
+        :param start:
+            the first position of the range
+
+        :param end:
+            the position after the end of the range
+
+        :returns:
+            the matching spans, ordered by where they start
+        """
+        return list(
+            heapq.merge(
+                *(block.overlapping(start, end) for block in self._blocks),
+                key=lambda span: (span.start, span.end),
+            )
+        )
+
+    def at(self, position: int) -> List[Span]:
+        """Find spans that include a text position, ordered by where they start."""
+        return self.overlapping(position, position + 1)
@@ -0,0 +1,191 @@
+"""Download client that keeps a local cache of Enactment API responses."""
+
+from __future__ import annotations
+
+from contextlib import closing
+import datetime
+import json
+import pathlib
+import sqlite3
+import time
+from typing import Optional, Tuple, Union
+
+import requests
+
+from legislice.download import Client, PublicationCoverage, normalize_path
+from legislice.types import RawEnactment
+
+
+class CachedClient(Client):
+    """
+    Wrapper that saves responses from another client in a SQLite database.
+
+    Imitates the interface of :class:`legislice.download.Client`, so it
+    can be passed anywhere a client is expected. Several processes can
+    share one cache by using the same ``path``.
+
+    >>> import tempfile
+    >>> from authorityspoke.io.fake_enactments import FakeClient
+    >>> tmp_dir = tempfile.TemporaryDirectory()
+    >>> client = CachedClient(
+    ...     FakeClient.from_file("usc.json"), path=f"{tmp_dir.name}/cache.db"
+    ... )
+    >>> client.fetch("/us/const/amendment/IV")["start_date"]
+    '1791-12-15'
+    >>> client.count()
+    1
+    >>> tmp_dir.cleanup()
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        path: Union[str, pathlib.Path],
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Create cache for a client that will make any requests the cache can't answer.
+
+        :param client:
+            a :class:`~legislice.download.Client` (or an object imitating it)
+            used to fetch any Enactment not found in the cache
+
+        :param path:
+            location of the SQLite database file, which will be
+            created if it doesn't exist
+
+        :param ttl:
+            number of seconds before a cached response becomes stale
+            and has to be fetched again. ``None`` means responses never expire.
+
+        :param max_entries:
+            the number of responses to keep before discarding the
+            least recently used. ``None`` means there is no limit.
+        """
+        self.client = client
+        self.path = pathlib.Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.api_root = getattr(client, "api_root", "")
+        self.api_token = getattr(client, "api_token", "")
+        self.coverage = client.coverage
+        self.update_coverage_from_api = client.update_coverage_from_api
+        self._create_table()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _create_table(self) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS enactments ("
+                "node TEXT NOT NULL, "
+                "date TEXT NOT NULL, "
+                "response TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (node, date))"
+            )
+
+    @staticmethod
+    def cache_key(query: str, date: Union[datetime.date, str] = "") -> Tuple[str, str]:
+        """Get the normalized node path and date used to store a response."""
+        if isinstance(date, datetime.date):
+            date = date.isoformat()
+        return normalize_path(query), date or ""
+
+    def get_cached(
+        self, query: str, date: Union[datetime.date, str] = ""
+    ) -> Optional[RawEnactment]:
+        """Get a response from the cache without making any request, if it isn't stale."""
+        node, date = self.cache_key(query, date)
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT response, fetched_at FROM enactments WHERE node = ? AND date = ?",
+                (node, date),
+            ).fetchone()
+            if row is None:
+                return None
+            response, fetched_at = row
+            if self.ttl is not None and now - fetched_at >= self.ttl:
+                return None
+            connection.execute(
+                "UPDATE enactments SET accessed_at = ? WHERE node = ? AND date = ?",
+                (now, node, date),
+            )
+        return json.loads(response)
+
+    def save(
+        self,
+        query: str,
+        response: RawEnactment,
+        date: Union[datetime.date, str] = "",
+    ) -> None:
+        """Store a response, discarding old responses if the cache is over its size limit."""
+        node, date = self.cache_key(query, date)
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO enactments VALUES (?, ?, ?, ?, ?)",
+                (node, date, json.dumps(response, default=str), now, now),
+            )
+            if self.ttl is not None:
+                connection.execute(
+                    "DELETE FROM enactments WHERE fetched_at <= ?", (now - self.ttl,)
+                )
+            if self.max_entries is not None:
+                connection.execute(
+                    "DELETE FROM enactments WHERE rowid IN ("
+                    "SELECT rowid FROM enactments ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM enactments")
+
+    def count(self) -> int:
+        """Count the responses in the cache."""
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM enactments").fetchone()[0]
+
+    def fetch(self, query, date: Union[datetime.date, str] = "") -> RawEnactment:
+        """
+        Fetch data about legislation, using the cache if possible.
+
+        Queries for cross-references and inbound references are passed
+        through to the :class:`~legislice.download.Client` methods.
+
+        :param query:
+            A path to the desired legislation section using the United States Legislation Markup
+            tree-like citation format. Examples: /us/const/amendment/IV, /us/usc/t17/s103
+
+        :param date:
+            A date when the desired version of the legislation was in effect.
+        """
+        if isinstance(query, str):
+            return self.fetch_uri(query=query, date=date)
+        return super().fetch(query=query, date=date)
+
+    def fetch_uri(
+        self, query: str, date: Union[datetime.date, str] = ""
+    ) -> RawEnactment:
+        """Get a response for a path and date from the cache, or from the wrapped client."""
+        cached = self.get_cached(query, date)
+        if cached is not None:
+            return cached
+        response = self.client.fetch(query=query, date=date)
+        self.save(query, response, date)
+        return response
+
+    def fetch_db_coverage(self, code_uri: str) -> PublicationCoverage:
+        """Document date range of provisions of a code available from the wrapped client."""
+        return self.client.fetch_db_coverage(code_uri)
+
+    def _fetch_from_url(self, url: str) -> requests.Response:
+        return self.client._fetch_from_url(url)
@@ -0,0 +1,309 @@
+r"""
+Download many judicial decisions and save them as files.
+
+The :class:`SessionCAPClient` reuses pooled connections and retries
+failed requests. :func:`download_cases` fetches a list of citations or
+Caselaw Access Project IDs concurrently, and keeps a progress file so that
+an interrupted download can be resumed.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import pathlib
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from slugify import slugify
+from urllib3.util.retry import Retry
+
+from justopinion.citations import normalize_case_cite
+from justopinion.decisions import Decision
+from justopinion.download import CAPClient, CaseAccessProjectAPIError
+from pydantic import BaseModel
+
+from authorityspoke.io import filepaths
+from authorityspoke.io.writers import case_to_file
+
+CaseQuery = Union[int, str]
+
+
+class SessionCAPClient(CAPClient):
+    """
+    Caselaw Access Project client that sends requests through a pooled session.
+
+    Unlike :class:`justopinion.download.CAPClient`, connections are reused
+    between requests, and requests that fail with a server error or a
+    "too many requests" response are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        api_token: Optional[str] = "",
+        pool_size: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        endpoint: Optional[str] = None,
+    ):
+        """
+        Create client with a session that can keep ``pool_size`` open connections.
+
+        :param api_token:
+            API token for the Case Access Project
+
+        :param pool_size:
+            maximum number of connections to keep open to the API
+
+        :param retries:
+            number of times to retry a request that failed
+            with a connection error or a retryable status code
+
+        :param backoff_factor:
+            factor for the delay between retries, in seconds
+
+        :param endpoint:
+            URL for the cases endpoint of the API, if not the public API
+        """
+        super().__init__(api_token=api_token)
+        if endpoint:
+            self.endpoint = endpoint
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch_cite(self, cite, full_case: bool = False) -> requests.models.Response:
+        """Get the API list response for a queried citation, using the session."""
+        params = {"cite": normalize_case_cite(cite)}
+        headers = self.get_api_headers(full_case=full_case)
+        if full_case:
+            params["full_case"] = "true"
+        response = self.session.get(self.endpoint, params=params, headers=headers)
+        if response.status_code == 401:
+            detail = response.json()["detail"]
+            raise CaseAccessProjectAPIError(f"{detail} {self.api_alert}")
+        return response
+
+    def fetch_id(
+        self, cap_id: int, full_case: bool = False
+    ) -> requests.models.Response:
+        """Download a decision by Caselaw Access Project ID, using the session."""
+        url = self.endpoint + f"{cap_id}/"
+        headers = self.get_api_headers(full_case=full_case)
+        params = {}
+        if full_case:
+            params["full_case"] = "true"
+        response = self.session.get(url, params=params, headers=headers)
+        if cap_id and response.status_code == 404:
+            raise CaseAccessProjectAPIError(f"API returned no cases with id {cap_id}")
+        return response
+
+    def read_decision_from_response(
+        self, response: requests.models.Response
+    ) -> Decision:
+        """Deserialize a single case, raising an error if the request failed."""
+        if not response.ok:
+            raise CaseAccessProjectAPIError(
+                f"API returned status {response.status_code} for {response.url}"
+            )
+        if not response.json().get("results", True):
+            raise CaseAccessProjectAPIError(f"API returned no cases for {response.url}")
+        return super().read_decision_from_response(response)
+
+    def read_id(self, cap_id: int, full_case: bool = False) -> Decision:
+        """Download and deserialize a decision by Caselaw Access Project ID."""
+        response = self.fetch_id(cap_id=cap_id, full_case=full_case)
+        return self.read_decision_from_response(response)
+
+    def close(self) -> None:
+        """Close the session's open connections."""
+        self.session.close()
+
+
+class RateLimiter:
+    """Thread-safe limit on how often an action can start."""
+
+    def __init__(self, per_second: Optional[float] = None):
+        """
+        Create limiter allowing ``per_second`` actions per second.
+
+        ``None`` means there is no limit.
+        """
+        self.interval = 1 / per_second if per_second else 0.0
+        self.next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Wait until the next action is allowed to start."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class DownloadReport(BaseModel):
+    """Queries that were downloaded, skipped, or failed in a bulk download."""
+
+    downloaded: List[str] = []
+    skipped: List[str] = []
+    failed: Dict[str, str] = {}
+
+
+def filename_for_query(query: CaseQuery) -> str:
+    """Get the filename to use for a case found with a citation or ID."""
+    query = str(query)
+    if query.isdigit():
+        return f"{query}.json"
+    return slugify(query, separator="_") + ".json"
+
+
+def read_progress(progress_file: pathlib.Path) -> Set[str]:
+    """Get the queries recorded as complete in a progress file."""
+    completed: Set[str] = set()
+    if not progress_file.exists():
+        return completed
+    with open(progress_file, "r") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # the last line may be incomplete if the download was interrupted
+                continue
+            if entry.get("status") == "done":
+                completed.add(entry["query"])
+    return completed
+
+
+def _terminate_last_line(path: pathlib.Path) -> None:
+    """Add a newline after an incomplete last line, so new lines can be appended."""
+    if not path.exists() or not path.stat().st_size:
+        return
+    with open(path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def download_cases(
+    queries: Iterable[CaseQuery],
+    directory: Optional[pathlib.Path] = None,
+    client: Optional[CAPClient] = None,
+    full_case: bool = False,
+    max_workers: int = 4,
+    requests_per_second: Optional[float] = None,
+    progress_file: Optional[pathlib.Path] = None,
+) -> DownloadReport:
+    r"""
+    Download judicial decisions and save each one with :func:`.case_to_file`\.
+
+    Files that already exist are not downloaded again, and queries recorded
+    as complete in the progress file are skipped, so running the same
+    download again resumes where an interrupted download stopped.
+
+    :param queries:
+        citations or Caselaw Access Project IDs of the decisions to download
+
+    :param directory:
+        where the case files should be saved. If ``None`` is given,
+        the default is ``example_data/cases``\.
+
+    :param client:
+        a client to download the decisions. If ``None``, a new
+        :class:`SessionCAPClient` without an API token will be used.
+
+    :param full_case:
+        whether to request the full text of the opinions
+
+    :param max_workers:
+        number of decisions to download at the same time
+
+    :param requests_per_second:
+        maximum rate for starting new downloads. ``None`` means there is no limit.
+
+    :param progress_file:
+        file where the result of each query is recorded. Defaults to
+        ``.download_progress.jsonl`` in the same directory as the case files.
+
+    :returns:
+        a report of which queries were downloaded, skipped, or failed.
+        An error for one query is recorded as a failure of that query,
+        with the error's message, and the other queries are still downloaded.
+    """
+    directory = pathlib.Path(directory or filepaths.get_directory_path("cases"))
+    directory.mkdir(parents=True, exist_ok=True)
+    progress_file = pathlib.Path(
+        progress_file or directory / ".download_progress.jsonl"
+    )
+    owns_client = client is None
+    client = client or SessionCAPClient()
+    limiter = RateLimiter(requests_per_second)
+    completed = read_progress(progress_file)
+    _terminate_last_line(progress_file)
+    report = DownloadReport()
+    lock = threading.Lock()
+
+    def record(query: str, status: str, error: str = "") -> None:
+        with lock:
+            if status == "done":
+                report.downloaded.append(query)
+            else:
+                report.failed[query] = error
+            with open(progress_file, "a") as f:
+                entry = {"query": query, "status": status}
+                if error:
+                    entry["error"] = error
+                f.write(json.dumps(entry) + "\n")
+
+    def download(query: str) -> None:
+        filepath = directory / filename_for_query(query)
+        partial_filepath = filepath.with_name(filepath.name + ".part")
+        limiter.wait()
+        try:
+            decision = client.read(query, full_case=full_case)
+            case_to_file(decision, filepath=partial_filepath)
+            os.replace(partial_filepath, filepath)
+        except Exception as e:
+            # one bad case shouldn't stop the rest of the batch
+            if partial_filepath.exists():
+                partial_filepath.unlink()
+            record(query, "failed", f"{e.__class__.__name__}: {e}")
+            return
+        record(query, "done")
+
+    to_download = []
+    for query in dict.fromkeys(str(query) for query in queries):
+        if query in completed or (directory / filename_for_query(query)).exists():
+            report.skipped.append(query)
+        else:
+            to_download.append(query)
+
+    try:
+        if max_workers <= 1 or len(to_download) <= 1:
+            for query in to_download:
+                download(query)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(download, to_download))
+    finally:
+        if owns_client:
+            client.close()
+    return report
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 import datetime
 import json
-from typing import Dict, Optional, Union
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 from legislice.download import Client, normalize_path, LegislicePathError
 from legislice.enactments import CrossReference, Enactment
 from legislice.types import RawEnactment
 
 from authorityspoke.io import filepaths
+from authorityspoke.io.lazy_json import LazyNestedObject
 
 
 # A dict indexing responses by iso-format date strings.
@@ -18,6 +20,76 @@ ResponsesByDate = Dict[str, Dict]
 ResponsesByDateByPath = Dict[str, Dict[str, Dict]]
 
 
+class PathTrie:
+    r"""
+    Index of the paths in a set of responses, organized by path segment.
+
+    Each node that corresponds to a key of the responses also
+    has a sorted list of the dates of the versions available for that key.
+    The dates are only read from the responses when they're first needed.
+    """
+
+    def __init__(self):
+        """Create empty trie node."""
+        self.children: Dict[str, PathTrie] = {}
+        self.key: Optional[str] = None
+        self._responses: Optional[Mapping[str, Mapping]] = None
+        self._dates: Optional[List[str]] = None
+
+    @staticmethod
+    def split_path(path: str) -> List[str]:
+        """Get the segments of a normalized path."""
+        return normalize_path(path).strip("/").split("/")
+
+    @property
+    def dates(self) -> List[str]:
+        """Get the sorted dates of the versions available for this node's key."""
+        if self._dates is None:
+            if self._responses is None or self.key is None:
+                return []
+            self._dates = sorted(self._responses[self.key].keys())
+        return self._dates
+
+    def insert(self, key: str, responses: Mapping[str, Mapping]) -> None:
+        """
+        Add a key of the responses.
+
+        :param key:
+            the path of a response
+
+        :param responses:
+            the responses keyed by path, where the dates of the versions
+            of the response can be found when they're needed
+        """
+        node = self
+        for segment in self.split_path(key):
+            node = node.children.setdefault(segment, PathTrie())
+        node.key = key
+        node._responses = responses
+        node._dates = None
+
+    def closest(self, path: str) -> Optional[PathTrie]:
+        """Find the deepest node with a response that contains the given path."""
+        node = self
+        best = None
+        for segment in self.split_path(path):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.key is not None:
+                best = node
+        return best
+
+    def version_not_later_than(self, date: str = "") -> Optional[str]:
+        """Find the latest version date that is not after ``date``."""
+        if not date:
+            return self.dates[-1] if self.dates else None
+        index = bisect_right(self.dates, date)
+        if index == 0:
+            return None
+        return self.dates[index - 1]
+
+
 class FakeClient(Client):
     """
     Repository for mocking API responses locally.
@@ -28,6 +100,10 @@ class FakeClient(Client):
     def __init__(self, responses: ResponsesByDateByPath):
         """Populate fake client with fake response data."""
         self.responses = responses
+        self.path_index = PathTrie()
+        for key in responses.keys():
+            self.path_index.insert(key, responses)
+        self._nodes_by_version: Dict[Tuple[str, str], Dict[str, Dict]] = {}
         self.coverage: Dict[str, Dict[str, Union[datetime.date, str]]] = {
             "/us/const": {
                 "latest_heading": "United States Constitution",
@@ -50,26 +126,48 @@ class FakeClient(Client):
         self.update_coverage_from_api = False
 
     @classmethod
-    def from_file(cls, filename: str) -> FakeClient:
-        """Create new FakeClient from JSON data."""
+    def from_file(cls, filename: str, lazy: bool = False) -> FakeClient:
+        """
+        Create new FakeClient from JSON data.
+
+        :param filename:
+            name of a file in the "responses" example data directory
+
+        :param lazy:
+            whether to memory-map the file and decode each version of
+            each response only when it's first fetched, instead of
+            loading the whole file. Not available for compressed files.
+            The file stays open until :meth:`close` is called, or until
+            the end of a ``with`` block using the client.
+        """
         responses_filepath = filepaths.get_directory_path("responses")
         response_path = responses_filepath / filename
-        with open(response_path, "r") as f:
+        if lazy and filepaths.is_compressed(response_path):
+            raise ValueError(f"Can't memory-map compressed file {response_path}")
+        if lazy:
+            return cls(LazyNestedObject.from_file(response_path))
+        with filepaths.open_text(response_path) as f:
             responses = json.load(f)
         return cls(responses)
 
+    def close(self) -> None:
+        """Close the memory-mapped file of a client created with ``lazy=True``."""
+        close = getattr(self.responses, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> FakeClient:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     def get_entry_closest_to_cited_path(self, path: str) -> Optional[ResponsesByDate]:
         """Get key from responses attribute that gets the closest to the given path."""
-        path = normalize_path(path)
-        if self.responses.get(path):
-            return self.responses[path]
-        branches_that_start_path = [
-            entry for entry in self.responses.keys() if path.startswith(entry)
-        ]
-        if not branches_that_start_path:
+        entry = self.path_index.closest(path)
+        if entry is None:
             return None
-        name_of_best_entry = max(branches_that_start_path, key=len)
-        return self.responses[name_of_best_entry]
+        return self.responses[entry.key]
 
     def search_tree_for_path(
         self, path: str, branch: Dict
@@ -81,7 +179,8 @@ class FakeClient(Client):
         branches_that_start_path = [
             nested_node
             for nested_node in branch["children"]
-            if path.startswith(nested_node["node"])
+            if path.startswith(nested_node["node"] + "/")
+            or path == nested_node["node"]
         ]
         if branches_that_start_path:
             return self.search_tree_for_path(
@@ -89,6 +188,22 @@ class FakeClient(Client):
             )
         return None
 
+    def get_nodes_in_version(self, key: str, date: str) -> Dict[str, Dict]:
+        """
+        Get index of every node in one version of a response, keyed by path.
+
+        The index is built the first time each version is searched.
+        """
+        if (key, date) not in self._nodes_by_version:
+            nodes: Dict[str, Dict] = {}
+            to_visit = [self.responses[key][date]]
+            while to_visit:
+                branch = to_visit.pop()
+                nodes.setdefault(normalize_path(branch["node"]), branch)
+                to_visit.extend(reversed(branch.get("children") or []))
+            self._nodes_by_version[(key, date)] = nodes
+        return self._nodes_by_version[(key, date)]
+
     def fetch(self, query: str, date: Union[datetime.date, str] = "") -> RawEnactment:
         """
         Fetch data about legislation at specified path and date from Client's assigned API root.
@@ -106,30 +221,21 @@ class FakeClient(Client):
         :returns:
             A fake JSON response in the format of the Legislice API.
         """
-        responses = self.get_entry_closest_to_cited_path(query)
-        if not responses:
+        entry = self.path_index.closest(query)
+        if entry is None:
             raise LegislicePathError(f"No enacted text found for query {query}")
 
         if isinstance(date, datetime.date):
             date = date.isoformat()
 
-        if not date:
-            selected_date = max(responses.keys())
-        else:
-            versions_not_later_than_query = [
-                version_date
-                for version_date in responses.keys()
-                if version_date <= date
-            ]
-            if not versions_not_later_than_query:
-                raise ValueError(
-                    f"No enacted text found for query {query} after date {date}"
-                )
-            selected_date = max(versions_not_later_than_query)
-
-        selected_version = responses[selected_date]
-
-        result = self.search_tree_for_path(path=query, branch=selected_version)
+        selected_date = entry.version_not_later_than(date)
+        if selected_date is None:
+            raise ValueError(
+                f"No enacted text found for query {query} after date {date}"
+            )
+
+        nodes = self.get_nodes_in_version(entry.key, selected_date)
+        result = nodes.get(normalize_path(query))
         if not result:
             raise LegislicePathError(
                 f"No enacted text found for query {query} after date {date}"
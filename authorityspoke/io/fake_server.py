@@ -0,0 +1,263 @@
+r"""
+Local HTTP server imitating the Legislice and Caselaw Access Project APIs.
+
+Serves :class:`.FakeClient` data and example case files at the same URL
+shapes as the real APIs, so the real download clients can be load tested
+without making requests to the live services.
+
+>>> from authorityspoke import CAPClient, LegisClient
+>>> with FakeAPIServer.from_example_data() as server:
+...     legis_client = LegisClient(api_root=server.legislice_api_root)
+...     case_client = CAPClient()
+...     case_client.endpoint = server.cap_endpoint
+...     enactment = legis_client.fetch("/us/const/amendment/IV")
+...     decision = case_client.read_cite("388 F.2d 853")
+>>> enactment["start_date"]
+'1791-12-15'
+>>> decision.name_abbreviation
+'Wattenburg v. United States'
+"""
+
+from __future__ import annotations
+
+import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import pathlib
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from legislice.download import LegislicePathError
+
+from authorityspoke.decisions import RawDecision
+from authorityspoke.io import filepaths
+from authorityspoke.io.fake_enactments import FakeClient
+
+LEGISLICE_PREFIX = "/api/v1"
+CAP_PREFIX = "/v1/cases/"
+
+
+def load_cases(directory: Optional[pathlib.Path] = None) -> Dict[int, RawDecision]:
+    """
+    Load every JSON case file in a directory, keyed by Caselaw Access Project ID.
+
+    Files compressed with gzip or xz are also loaded.
+
+    :param directory:
+        the directory with the case files. Defaults to the "cases"
+        example data directory.
+    """
+    directory = directory or filepaths.get_directory_path("cases")
+    cases = {}
+    for path in sorted(directory.glob("*.json*")):
+        if filepaths.data_suffix(path) != ".json":
+            continue
+        with filepaths.open_text(path) as f:
+            case = json.load(f)
+        cases[case["id"]] = case
+    return cases
+
+
+def normalize_cite_for_search(cite: str) -> str:
+    """Make citation comparable regardless of case and spacing."""
+    return " ".join(cite.lower().split())
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    """Handler for requests to a :class:`FakeAPIServer`."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: FakeAPIServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Don't print a log line for every request."""
+        pass
+
+    def do_GET(self) -> None:
+        """Route a GET request to the Legislice or CAP imitation."""
+        status, body = self.server.respond(self.path)
+        content = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.server.write_throttled(self.wfile, content)
+
+
+class FakeAPIServer(ThreadingHTTPServer):
+    """
+    Server for Legislice and Caselaw Access Project API requests on localhost.
+
+    Use as a context manager to run the server in a background thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        enactment_client: Optional[FakeClient] = None,
+        cases: Optional[Dict[int, RawDecision]] = None,
+        latency: float = 0.0,
+        bytes_per_second: Optional[float] = None,
+        fail_every: Optional[int] = None,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+    ):
+        r"""
+        Create server that will answer requests with example data.
+
+        :param enactment_client:
+            a :class:`.FakeClient` with the enactment responses to serve
+
+        :param cases:
+            raw decisions to serve, keyed by Caselaw Access Project ID
+
+        :param latency:
+            number of seconds to wait before answering each request
+
+        :param bytes_per_second:
+            maximum rate for sending the body of each response.
+            ``None`` means there is no limit.
+
+        :param fail_every:
+            if given, every request with a number divisible by ``fail_every``
+            gets a 503 error, to test retries
+
+        :param address:
+            host and port to listen on. Port 0 chooses any free port.
+        """
+        super().__init__(address, FakeAPIHandler)
+        self.enactment_client = enactment_client or FakeClient(responses={})
+        self.cases = cases or {}
+        self.cases_by_cite: Dict[str, list] = {}
+        for case in self.cases.values():
+            for citation in case.get("citations", []):
+                key = normalize_cite_for_search(citation["cite"])
+                self.cases_by_cite.setdefault(key, []).append(case)
+        self.latency = latency
+        self.bytes_per_second = bytes_per_second
+        self.fail_every = fail_every
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_example_data(
+        cls,
+        response_files: Iterable[str] = ("usc.json", "beard_act.json"),
+        **kwargs: Any,
+    ) -> FakeAPIServer:
+        """Create server for the example enactment responses and case files."""
+        responses: Dict[str, Dict] = {}
+        for filename in response_files:
+            responses.update(FakeClient.from_file(filename).responses)
+        return cls(enactment_client=FakeClient(responses), cases=load_cases(), **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        """Get the scheme, host, and port of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def legislice_api_root(self) -> str:
+        """Get URL to use as the ``api_root`` of a :class:`legislice.download.Client`."""
+        return self.base_url + LEGISLICE_PREFIX
+
+    @property
+    def cap_endpoint(self) -> str:
+        """Get URL to use as the ``endpoint`` of a :class:`justopinion.download.CAPClient`."""
+        return self.base_url + CAP_PREFIX
+
+    def start(self) -> None:
+        """Start answering requests in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop answering requests and release the port."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> FakeAPIServer:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def respond(self, url: str) -> Tuple[int, Any]:
+        """Get the status code and JSON body of the response for a URL."""
+        with self._count_lock:
+            self.request_count += 1
+            request_number = self.request_count
+        if self.latency:
+            time.sleep(self.latency)
+        if self.fail_every and request_number % self.fail_every == 0:
+            return 503, {"detail": "Service temporarily unavailable."}
+        parts = urlsplit(url)
+        path = unquote(parts.path)
+        params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        if path.startswith(LEGISLICE_PREFIX + "/"):
+            return self.respond_enactment(path[len(LEGISLICE_PREFIX) :])
+        if path.startswith(CAP_PREFIX):
+            return self.respond_case(path[len(CAP_PREFIX) :], params)
+        return 404, {"detail": "Not found."}
+
+    def respond_enactment(self, path: str) -> Tuple[int, Any]:
+        """Answer a request in the format of the Legislice API."""
+        if path.startswith("/coverage/"):
+            code_uri = path[len("/coverage") :].rstrip("/")
+            coverage = self.enactment_client.coverage.get(code_uri)
+            if coverage is None:
+                return 404, {"detail": "Not found."}
+            return 200, {
+                k: v.isoformat() if isinstance(v, datetime.date) else v
+                for k, v in coverage.items()
+            }
+        query, _, date = path.partition("@")
+        try:
+            return 200, self.enactment_client.fetch(query.rstrip("/"), date=date)
+        except (LegislicePathError, ValueError) as error:
+            return 404, {"detail": str(error)}
+
+    def respond_case(self, path: str, params: Dict[str, str]) -> Tuple[int, Any]:
+        """Answer a request in the format of the Caselaw Access Project API."""
+        full_case = params.get("full_case") == "true"
+        if path.strip("/"):
+            case_id = path.strip("/")
+            if not case_id.isdigit() or int(case_id) not in self.cases:
+                return 404, {"detail": "Not found."}
+            return 200, self.format_case(self.cases[int(case_id)], full_case)
+        matches = self.cases_by_cite.get(
+            normalize_cite_for_search(params.get("cite", "")), []
+        )
+        return 200, {
+            "count": len(matches),
+            "next": None,
+            "previous": None,
+            "results": [self.format_case(case, full_case) for case in matches],
+        }
+
+    @staticmethod
+    def format_case(case: RawDecision, full_case: bool) -> RawDecision:
+        """Omit the casebody unless the full case was requested, like the real API."""
+        if full_case:
+            return case
+        return {k: v for k, v in case.items() if k != "casebody"}
+
+    def write_throttled(self, stream, content: bytes) -> None:
+        """Send a response body no faster than the server's ``bytes_per_second``."""
+        if not self.bytes_per_second:
+            stream.write(content)
+            return
+        chunk_size = max(1, int(self.bytes_per_second / 20))
+        for start in range(0, len(content), chunk_size):
+            chunk = content[start : start + chunk_size]
+            stream.write(chunk)
+            time.sleep(len(chunk) / self.bytes_per_second)
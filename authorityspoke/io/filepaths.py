@@ -1,8 +1,17 @@
 """Functions to help locate data to import on disk."""
 
+import gzip
+import io
+import lzma
 import pathlib
 
-from typing import Optional
+from typing import Callable, Dict, Optional, Union
+
+# Functions to open files compressed in each format, by file suffix.
+COMPRESSION_OPENERS: Dict[str, Callable[..., io.IOBase]] = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+}
 
 
 def make_filepath(
@@ -57,3 +66,43 @@ def get_directory_path(stem: str) -> pathlib.Path:
     if not directory.exists():
         directory = pathlib.Path.cwd().parent / "example_data" / stem
     return directory
+
+
+def is_compressed(filepath: Union[str, pathlib.Path]) -> bool:
+    """Check whether a file's suffix shows that it's compressed."""
+    return pathlib.Path(filepath).suffix in COMPRESSION_OPENERS
+
+
+def data_suffix(filepath: Union[str, pathlib.Path]) -> str:
+    """
+    Get the suffix for the format of a file's data, ignoring any compression suffix.
+
+    :param filepath:
+        a path such as ``holdings.yaml`` or ``holdings.yaml.gz``
+
+    :returns:
+        the suffix of the data format, e.g. ``.yaml`` for either example
+    """
+    filepath = pathlib.Path(filepath)
+    if is_compressed(filepath):
+        filepath = filepath.with_suffix("")
+    return filepath.suffix
+
+
+def open_text(filepath: Union[str, pathlib.Path], mode: str = "r") -> io.TextIOBase:
+    """
+    Open a text file, using gzip or xz compression if the file has that suffix.
+
+    Compressed files are decompressed as they are read, rather than all at once.
+
+    :param filepath:
+        path to the file
+
+    :param mode:
+        "r" to read, "w" to write, or "a" to append
+    """
+    filepath = pathlib.Path(filepath)
+    opener = COMPRESSION_OPENERS.get(filepath.suffix)
+    if opener is None:
+        return open(filepath, mode, encoding="utf-8")
+    return opener(filepath, mode + "t", encoding="utf-8")
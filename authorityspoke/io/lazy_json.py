@@ -0,0 +1,232 @@
+r"""
+Index the locations of values in a JSON file, to decode them only when needed.
+
+Used for reading parts of files that are too large to load with :func:`json.load`\.
+The files are memory-mapped, so only the parts of the file that are decoded
+need to be read from disk.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import json
+import mmap
+import pathlib
+import re
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+Span = Tuple[int, int]
+
+WHITESPACE = re.compile(rb"[ \t\n\r]*")
+STRUCTURE = re.compile(rb'["\[\]{}]')
+STRING_BODY = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+SCALAR = re.compile(rb"[^,:\]}\s]+")
+
+
+class JSONIndexError(ValueError):
+    """Error for a JSON document that can't be indexed."""
+
+    pass
+
+
+def skip_whitespace(buffer, position: int) -> int:
+    """Get the position of the next character that isn't whitespace."""
+    return WHITESPACE.match(buffer, position).end()
+
+
+def find_string_end(buffer, start: int) -> int:
+    """Get the position after the closing quote of a string that starts at ``start``."""
+    match = STRING_BODY.match(buffer, start + 1)
+    if match is None:
+        raise JSONIndexError(f"Unterminated string starting at position {start}")
+    return match.end()
+
+
+def find_value_end(buffer, start: int) -> int:
+    """
+    Get the position after the end of a JSON value, without decoding the value.
+
+    :param buffer:
+        bytes or memory-mapped file containing JSON
+
+    :param start:
+        position of the first character of the value
+
+    :returns:
+        the position of the first character after the value
+    """
+    first = buffer[start : start + 1]
+    if first == b'"':
+        return find_string_end(buffer, start)
+    if first not in (b"{", b"["):
+        match = SCALAR.match(buffer, start)
+        if match is None:
+            raise JSONIndexError(f"No JSON value at position {start}")
+        return match.end()
+    depth = 0
+    position = start
+    while True:
+        match = STRUCTURE.search(buffer, position)
+        if match is None:
+            raise JSONIndexError(f"Unterminated value starting at position {start}")
+        token = match.group()
+        if token == b'"':
+            position = find_string_end(buffer, match.start())
+            continue
+        position = match.end()
+        if token in (b"{", b"["):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return position
+
+
+def _expect(buffer, position: int, character: bytes) -> int:
+    position = skip_whitespace(buffer, position)
+    if buffer[position : position + 1] != character:
+        raise JSONIndexError(f"Expected {character!r} at position {position}")
+    return position + 1
+
+
+def index_object(buffer, start: int) -> Dict[str, Span]:
+    """
+    Find the span of each value in a JSON object.
+
+    :param buffer:
+        bytes or memory-mapped file containing JSON
+
+    :param start:
+        position of the opening brace of the object
+
+    :returns:
+        the span where each member's value can be found, keyed by the member's name
+    """
+    result: Dict[str, Span] = {}
+    position = _expect(buffer, start, b"{")
+    position = skip_whitespace(buffer, position)
+    if buffer[position : position + 1] == b"}":
+        return result
+    while True:
+        position = skip_whitespace(buffer, position)
+        key_end = find_string_end(buffer, position)
+        key = json.loads(buffer[position:key_end])
+        position = _expect(buffer, key_end, b":")
+        value_start = skip_whitespace(buffer, position)
+        value_end = find_value_end(buffer, value_start)
+        result[key] = (value_start, value_end)
+        position = skip_whitespace(buffer, value_end)
+        separator = buffer[position : position + 1]
+        if separator == b"}":
+            return result
+        if separator != b",":
+            raise JSONIndexError(f"Expected ',' or '}}' at position {position}")
+        position += 1
+
+
+def index_array(buffer, start: int) -> List[Span]:
+    """
+    Find the span of each item in a JSON array.
+
+    :param buffer:
+        bytes or memory-mapped file containing JSON
+
+    :param start:
+        position of the opening bracket of the array
+
+    :returns:
+        the span where each item can be found, in order
+    """
+    result: List[Span] = []
+    position = _expect(buffer, start, b"[")
+    position = skip_whitespace(buffer, position)
+    if buffer[position : position + 1] == b"]":
+        return result
+    while True:
+        value_start = skip_whitespace(buffer, position)
+        value_end = find_value_end(buffer, value_start)
+        result.append((value_start, value_end))
+        position = skip_whitespace(buffer, value_end)
+        separator = buffer[position : position + 1]
+        if separator == b"]":
+            return result
+        if separator != b",":
+            raise JSONIndexError(f"Expected ',' or ']' at position {position}")
+        position += 1
+
+
+def decode_span(buffer, span: Span) -> Any:
+    """Decode the JSON value found at a span of the buffer."""
+    start, end = span
+    return json.loads(buffer[start:end])
+
+
+def read_span(path: Union[str, pathlib.Path], span: Span) -> Any:
+    """Decode the JSON value at a span of a file, reading only that part of the file."""
+    start, end = span
+    with open(path, "rb") as f:
+        f.seek(start)
+        return json.loads(f.read(end - start))
+
+
+def open_mapped(path: Union[str, pathlib.Path]) -> mmap.mmap:
+    """Memory-map a file for reading."""
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class LazyObject(Mapping):
+    """
+    Read-only mapping that decodes the values of a JSON object when they are accessed.
+
+    Decoded values are kept, so the same object is returned each
+    time a key is accessed.
+    """
+
+    def __init__(self, buffer, spans: Dict[str, Span]):
+        """Create mapping from a buffer and the spans of the object's values."""
+        self.buffer = buffer
+        self.spans = spans
+        self.decoded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.decoded:
+            self.decoded[key] = decode_span(self.buffer, self.spans[key])
+        return self.decoded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.spans
+
+
+class LazyNestedObject(LazyObject):
+    r"""
+    Read-only mapping of JSON objects, whose values are also decoded lazily.
+
+    Used for files in the format of a :class:`.FakeClient`\'s responses,
+    where the top level is keyed by path and the second level by date.
+    """
+
+    @classmethod
+    def from_file(cls, path: Union[str, pathlib.Path]) -> LazyNestedObject:
+        """Index a file, without decoding any values below the second level."""
+        buffer = open_mapped(path)
+        start = skip_whitespace(buffer, 0)
+        return cls(buffer=buffer, spans=index_object(buffer, start))
+
+    def __getitem__(self, key: str) -> LazyObject:
+        if key not in self.decoded:
+            start, _ = self.spans[key]
+            self.decoded[key] = LazyObject(
+                buffer=self.buffer, spans=index_object(self.buffer, start)
+            )
+        return self.decoded[key]
+
+    def close(self) -> None:
+        """Close the memory-mapped file."""
+        self.buffer.close()
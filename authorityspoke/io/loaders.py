@@ -3,10 +3,11 @@ Functions to load JSON or XML files for conversion into authorityspoke objects.
 
 Will usually hand off data to the io.readers module to create authorityspoke objects.
 """
+from functools import partial
 import json
 import pathlib
 
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 import yaml
 
@@ -17,7 +18,7 @@ from authorityspoke.facts import RawFactor
 from authorityspoke.holdings import Holding, RawHolding
 from authorityspoke.opinions import AnchoredHoldings
 
-from authorityspoke.io import filepaths, readers
+from authorityspoke.io import filepaths, lazy_json, readers
 
 
 def load_holdings(
@@ -49,8 +50,8 @@ def load_holdings(
         filename, directory, filepath, default_folder="holdings"
     )
 
-    with open(validated_filepath, "r") as f:
-        if validated_filepath.suffix == ".yaml":
+    with filepaths.open_text(validated_filepath) as f:
+        if filepaths.data_suffix(validated_filepath) == ".yaml":
             holdings = yaml.safe_load(f)
         else:
             holdings = json.load(f)
@@ -124,6 +125,44 @@ def read_anchored_holdings_from_file(
     return readers.read_holdings_with_anchors(raw_holdings, client=client)
 
 
+def read_anchored_holdings_from_files(
+    filenames: Sequence[str] = (),
+    directory: Optional[pathlib.Path] = None,
+    paths: Sequence[pathlib.Path] = (),
+    client: Optional[Client] = None,
+    max_workers: int = readers.DEFAULT_MAX_WORKERS,
+) -> List[AnchoredHoldings]:
+    r"""
+    Read holdings from several files, with Opinion text anchors for holdings and factors.
+
+    Any :class:`~legislice.enactments.Enactment` cited in more than one of
+    the files is only downloaded once, and downloads are made concurrently.
+
+    :param filenames: The names of the input files.
+
+    :param directory: The directory where the input files are located.
+
+    :param paths:
+        Complete paths to the input files, including filenames.
+
+    :param client:
+        The client with an API key to download :class:`Enactment`\s
+        mentioned in the holdings.
+
+    :param max_workers:
+        the maximum number of requests that may be made to `client` at once
+
+    :returns:
+        an :class:`.AnchoredHoldings` object for each file, in the same order
+    """
+    raw_holdings = [
+        load_holdings(filename=filename, directory=directory) for filename in filenames
+    ] + [load_holdings(filepath=filepath) for filepath in paths]
+    return readers.read_holdings_with_anchors_batch(
+        raw_holdings, client=client, max_workers=max_workers
+    )
+
+
 def load_decision(
     filename: Optional[str] = None,
     directory: Optional[pathlib.Path] = None,
@@ -148,16 +187,84 @@ def load_decision(
         filename, directory, filepath, default_folder="cases"
     )
 
-    with open(validated_filepath, "r") as f:
+    with filepaths.open_text(validated_filepath) as f:
         decision_dict = json.load(f)
 
     return decision_dict
 
 
+def load_decision_without_opinion_text(
+    filepath: pathlib.Path,
+) -> Tuple[RawDecision, List[Optional[lazy_json.Span]]]:
+    r"""
+    Load a judicial decision, but only find where the text of each opinion is.
+
+    :param filepath:
+        Complete path to an uncompressed JSON file in the format of
+        the Caselaw Access Project API.
+
+    :returns:
+        the decision with an empty ``text`` field for each opinion,
+        and the location in the file of each opinion's text. The ``text``
+        fields stay empty until they're filled in from those locations, e.g.
+        by the loaders that :func:`load_decision_as_reading` sets with
+        :meth:`.DecisionReading.set_opinion_text_loader`\.
+    """
+    buffer = lazy_json.open_mapped(filepath)
+    try:
+        spans = lazy_json.index_object(buffer, lazy_json.skip_whitespace(buffer, 0))
+        decision_dict = {
+            key: lazy_json.decode_span(buffer, span)
+            for key, span in spans.items()
+            if key != "casebody"
+        }
+        text_spans: List[Optional[lazy_json.Span]] = []
+        if "casebody" not in spans:
+            return decision_dict, text_spans
+        casebody_start = spans["casebody"][0]
+        if buffer[casebody_start : casebody_start + 1] != b"{":
+            decision_dict["casebody"] = None
+            return decision_dict, text_spans
+        casebody_spans = lazy_json.index_object(buffer, casebody_start)
+        casebody = {
+            key: lazy_json.decode_span(buffer, span)
+            for key, span in casebody_spans.items()
+            if key != "data"
+        }
+        data_spans = lazy_json.index_object(buffer, casebody_spans["data"][0])
+        data = {
+            key: lazy_json.decode_span(buffer, span)
+            for key, span in data_spans.items()
+            if key != "opinions"
+        }
+        data["opinions"] = []
+        opinion_spans_list = (
+            lazy_json.index_array(buffer, data_spans["opinions"][0])
+            if "opinions" in data_spans
+            else []
+        )
+        for opinion_span in opinion_spans_list:
+            opinion_spans = lazy_json.index_object(buffer, opinion_span[0])
+            data["opinions"].append(
+                {
+                    key: lazy_json.decode_span(buffer, span)
+                    for key, span in opinion_spans.items()
+                    if key != "text"
+                }
+            )
+            text_spans.append(opinion_spans.get("text"))
+        casebody["data"] = data
+        decision_dict["casebody"] = casebody
+    finally:
+        buffer.close()
+    return decision_dict, text_spans
+
+
 def load_decision_as_reading(
     filename: Optional[str] = None,
     directory: Optional[pathlib.Path] = None,
     filepath: Optional[pathlib.Path] = None,
+    lazy_text: bool = False,
 ) -> DecisionReading:
     r"""
     Load file containing a judicial decision with one or more opinions.
@@ -172,7 +279,33 @@ def load_decision_as_reading(
     :param filepath:
         Complete path to the JSON file representing the :class:`.Opinion`,
         including filename.
+
+    :param lazy_text:
+        whether to leave the text of each :class:`.Opinion` on disk until
+        it's needed by :meth:`.DecisionReading.select_text` or
+        :meth:`.DecisionReading.locate_text`\. Until then, the ``text``
+        of each Opinion is an empty string; call
+        :meth:`.DecisionReading.load_opinion_texts` before reading it
+        directly. Not available for compressed files.
     """
+    if not lazy_text:
+        loaded = load_decision(
+            filename=filename, directory=directory, filepath=filepath
+        )
+        return readers.read_decision(loaded)
 
-    loaded = load_decision(filename=filename, directory=directory, filepath=filepath)
-    return readers.read_decision(loaded)
+    validated_filepath = filepaths.make_filepath(
+        filename, directory, filepath, default_folder="cases"
+    )
+    if filepaths.is_compressed(validated_filepath):
+        raise ValueError(
+            f"Can't load opinion text lazily from compressed file {validated_filepath}"
+        )
+    loaded, text_spans = load_decision_without_opinion_text(validated_filepath)
+    reading = readers.read_decision(loaded)
+    for index, span in enumerate(text_spans):
+        if span is not None:
+            reading.set_opinion_text_loader(
+                index, partial(lazy_json.read_span, validated_filepath, span)
+            )
+    return reading
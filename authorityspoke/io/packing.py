@@ -0,0 +1,177 @@
+r"""
+Compact serialization of batches of Holdings for transfer between processes.
+
+:func:`pack` pickles objects such as :class:`.Holding`\s, :class:`.Rule`\s,
+or :class:`.AnchoredHoldings` so that each distinct term, predicate, and
+enactment passage is stored once per batch. Later appearances of an equal
+value, even in a different object, are written as a reference to the pickle
+memo entry of the first one. :func:`unpack` gives each appearance its own
+copy, so the restored objects don't share any terms that the originals didn't.
+
+    >>> from authorityspoke.io import loaders
+    >>> from authorityspoke.io.fake_enactments import FakeClient
+    >>> client = FakeClient.from_file("usc.json")
+    >>> holdings = loaders.read_holdings_from_file("holding_feist.yaml", client=client)
+    >>> data = pack(holdings)
+    >>> unpack(data) == holdings
+    True
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+import io
+import pickle
+from typing import Any, Dict, Hashable, List
+
+from legislice.enactments import Enactment, EnactmentPassage
+from nettlesome.predicates import PhraseABC
+from nettlesome.terms import Term
+from pydantic import BaseModel
+
+# Objects of these types are stored once per batch and then referenced.
+SHARED_TYPES = (Term, PhraseABC, Enactment, EnactmentPassage)
+
+PACKING_VERSION = 1
+
+# marks the part of a key that refers to another shared object
+_SHARED = object()
+
+# how values of each class are summarized in a key, found once per class
+_PLAIN, _SHARED_MODEL, _MODEL, _SEQUENCE, _MAPPING, _SET = range(6)
+_kinds: Dict[type, int] = {}
+
+
+def _kind(cls: type) -> int:
+    kind = _kinds.get(cls)
+    if kind is None:
+        if issubclass(cls, BaseModel):
+            kind = _SHARED_MODEL if issubclass(cls, SHARED_TYPES) else _MODEL
+        elif issubclass(cls, (list, tuple)):
+            kind = _SEQUENCE
+        elif issubclass(cls, dict):
+            kind = _MAPPING
+        elif issubclass(cls, (set, frozenset)):
+            kind = _SET
+        else:
+            kind = _PLAIN
+        _kinds[cls] = kind
+    return kind
+
+
+def _shared(obj: Any) -> Any:
+    """
+    Copy an object that was already restored earlier in the same batch.
+
+    Each appearance gets its own copy, so changing an unpacked object
+    doesn't change other objects that were equal to it when they were packed.
+    """
+    return deepcopy(obj)
+
+
+class _SharingPickler(pickle.Pickler):
+    """Pickler that writes each distinct shared value once per batch."""
+
+    def __init__(self, file: io.BytesIO):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.canonical: Dict[Hashable, Any] = {}
+        self.canonical_by_id: Dict[int, Any] = {}
+        # keeps objects alive, so ``id()`` values aren't reused during packing
+        self.seen: List[Any] = []
+
+    def model_key(self, model: BaseModel) -> Hashable:
+        """
+        Get a key that is the same for models with the same class and fields.
+
+        Shared objects in the fields are represented by the id of their
+        canonical object, so the fields of each shared object are only
+        summarized once per batch, however deeply the object is nested.
+
+        :raises TypeError:
+            if a field can't be summarized as a hashable key
+        """
+        values = [getattr(model, name) for name in type(model).model_fields]
+        if model.__pydantic_extra__:
+            values.append(model.__pydantic_extra__)
+        return (type(model),) + tuple(self.value_key(value) for value in values)
+
+    def value_key(self, value: Any) -> Hashable:
+        """Get a key that is the same for values that serialize the same way."""
+        cls = type(value)
+        if cls is str:
+            return value
+        kind = _kind(cls)
+        if kind == _SHARED_MODEL:
+            return (_SHARED, id(self.find_canonical(value)))
+        if kind == _MODEL:
+            return self.model_key(value)
+        if kind == _SEQUENCE:
+            return (cls,) + tuple(self.value_key(item) for item in value)
+        if kind == _MAPPING:
+            return (cls,) + tuple(
+                (self.value_key(key), self.value_key(item))
+                for key, item in value.items()
+            )
+        if kind == _SET:
+            return (cls, frozenset(self.value_key(item) for item in value))
+        hash(value)
+        return (cls, value)
+
+    def find_canonical(self, obj: BaseModel) -> BaseModel:
+        """
+        Get the first object in the batch with the same value as ``obj``.
+
+        :returns:
+            ``obj`` itself, if it's the first object with its value, or
+            if its value can't be summarized as a hashable key
+        """
+        canonical = self.canonical_by_id.get(id(obj))
+        if canonical is None:
+            self.seen.append(obj)
+            try:
+                key = self.model_key(obj)
+            except TypeError:
+                canonical = obj
+            else:
+                canonical = self.canonical.setdefault(key, obj)
+            self.canonical_by_id[id(obj)] = canonical
+        return canonical
+
+    def reducer_override(self, obj: Any) -> Any:
+        if _kind(type(obj)) != _SHARED_MODEL:
+            return NotImplemented
+        canonical = self.find_canonical(obj)
+        if canonical is obj:
+            return NotImplemented
+        # the pickle memo turns this into a reference to the earlier object,
+        # which is copied when it is unpacked
+        return (_shared, (canonical,))
+
+
+def pack(obj: Any) -> bytes:
+    r"""
+    Serialize objects, storing each distinct term, predicate, and enactment once.
+
+    :param obj:
+        an object to serialize, usually a list of :class:`.Holding`\s,
+        :class:`.Rule`\s, or :class:`.AnchoredHoldings`
+
+    :returns:
+        bytes that can be restored with :func:`unpack`
+    """
+    buffer = io.BytesIO()
+    _SharingPickler(buffer).dump((PACKING_VERSION, obj))
+    return buffer.getvalue()
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Restore objects serialized with :func:`pack`.
+
+    Values that were equal when they were packed are restored as separate
+    but equal objects, as they would be by :func:`pickle.loads`.
+    """
+    version, obj = pickle.loads(data)
+    if version != PACKING_VERSION:
+        raise ValueError(f"Can't unpack data in packing format version {version}")
+    return obj
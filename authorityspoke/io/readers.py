@@ -4,12 +4,13 @@ Converting simple structured data from XML or JSON into authorityspoke objects.
 These functions will usually be called by functions from the io.loaders module
 after they import some data from a file.
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, NamedTuple
 from typing import Dict, List, Optional, Tuple, Sequence, Union
 
 
 from anchorpoint.textselectors import TextQuoteSelector
-from legislice.download import Client
+from legislice.download import Client, enactment_needs_api_update, normalize_path
 from legislice.types import RawEnactment
 from nettlesome.entities import Entity
 
@@ -28,6 +29,9 @@ from authorityspoke.io.text_expansion import expand_shorthand
 
 RawSelector = Union[str, Dict[str, str]]
 
+# Upper bound on simultaneous requests made to a Legislice Client while loading
+DEFAULT_MAX_WORKERS = 8
+
 
 FACTOR_SUBCLASSES = {
     class_obj.__name__: class_obj
@@ -61,6 +65,7 @@ def collect_anchors_from_index(object_index, field_name: str):
 def read_holdings_with_anchors(
     record: Dict[str, Union[List[RawHolding], List[RawSelector]]],
     client: Optional[Client] = None,
+    max_workers: int = 1,
 ) -> AnchoredHoldings:
     r"""
     Load a list of Holdings from JSON, with text links.
@@ -71,27 +76,70 @@ def read_holdings_with_anchors(
     :param client:
         Legislice client for downloading missing fields from `record`
 
+    :param max_workers:
+        the maximum number of requests that may be made to `client` at once
+
     :returns:
         a namedtuple listing :class:`.Holding` objects with
         a list matching :class:`.Holding`\s to selectors and
         an index matching :class:`.Factor`\s to selectors.
     """
+    return read_holdings_with_anchors_batch(
+        [record], client=client, max_workers=max_workers
+    )[0]
 
-    (
-        holdings,
-        enactment_anchors,
-        factor_anchors,
-        holding_anchors,
-    ) = extract_anchors_from_holding_record(record, client)
-    holdings_with_anchors = []
-    for i, holding in enumerate(holdings):
-        new = HoldingWithAnchors(holding=holding, anchors=holding_anchors[i])
-        holdings_with_anchors.append(new)
-    return AnchoredHoldings(
-        holdings=holdings_with_anchors,
-        named_anchors=factor_anchors,
-        enactment_anchors=enactment_anchors,
-    )
+
+def read_holdings_with_anchors_batch(
+    records: Sequence[List[RawHolding]],
+    client: Optional[Client] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[AnchoredHoldings]:
+    r"""
+    Load several lists of Holdings from JSON, with text links.
+
+    Enactments cited in any of the records are downloaded together, so
+    a provision cited in several records is only fetched once.
+
+    :param records:
+        lists of dicts representing holdings, in the JSON input format,
+        for instance one list for each Opinion being loaded
+
+    :param client:
+        Legislice client for downloading missing fields from `records`
+
+    :param max_workers:
+        the maximum number of requests that may be made to `client` at once
+
+    :returns:
+        an :class:`.AnchoredHoldings` object for each record, in the same order
+    """
+    collected = [collect_enactments(record) for record in records]
+    if client:
+        update_enactment_indexes(
+            [enactment_index for _, enactment_index in collected],
+            client=client,
+            max_workers=max_workers,
+        )
+    result = []
+    for record_post_enactments, enactment_index in collected:
+        (
+            holdings,
+            enactment_anchors,
+            factor_anchors,
+            holding_anchors,
+        ) = extract_anchors_from_indexed_record(record_post_enactments, enactment_index)
+        holdings_with_anchors = []
+        for i, holding in enumerate(holdings):
+            new = HoldingWithAnchors(holding=holding, anchors=holding_anchors[i])
+            holdings_with_anchors.append(new)
+        result.append(
+            AnchoredHoldings(
+                holdings=holdings_with_anchors,
+                named_anchors=factor_anchors,
+                enactment_anchors=enactment_anchors,
+            )
+        )
+    return result
 
 
 def expand_factor(
@@ -225,8 +273,58 @@ def expand_holdings(
     return holdings
 
 
+def update_enactment_indexes(
+    enactment_indexes: Sequence[Mentioned],
+    client: Client,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[Mentioned]:
+    r"""
+    Fill in missing fields for every Enactment in several indexes, in place.
+
+    Each distinct combination of node and date is fetched only once, even if
+    it appears in more than one index, and up to ``max_workers`` fetches
+    are run in parallel threads.
+
+    :param enactment_indexes:
+        indexes of raw Enactment passages, as created by
+        :func:`~authorityspoke.io.name_index.collect_enactments`
+
+    :param client:
+        Legislice client for downloading missing fields
+
+    :param max_workers:
+        the maximum number of requests that may be made to `client` at once
+
+    :returns:
+        the same indexes, updated with data from `client`
+    """
+    to_update: List[Tuple[Dict, Tuple[str, str]]] = []
+    for enactment_index in enactment_indexes:
+        for value in enactment_index.values():
+            if enactment_needs_api_update(value["enactment"]):
+                query = (
+                    normalize_path(value["enactment"]["node"]),
+                    str(value["enactment"].get("start_date") or ""),
+                )
+                to_update.append((value, query))
+
+    queries = list(dict.fromkeys(query for _, query in to_update))
+    if len(queries) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = list(executor.map(lambda query: client.fetch(*query), queries))
+    else:
+        fetched = [client.fetch(*query) for query in queries]
+    responses = dict(zip(queries, fetched))
+
+    for value, query in to_update:
+        value["enactment"] = {**value["enactment"], **responses[query]}
+    return list(enactment_indexes)
+
+
 def extract_anchors_from_holding_record(
-    record: List[RawHolding], client: Optional[Client] = None
+    record: List[RawHolding],
+    client: Optional[Client] = None,
+    max_workers: int = 1,
 ) -> Tuple[
     List[Holding],
     List[EnactmentWithAnchors],
@@ -242,19 +340,46 @@ def extract_anchors_from_holding_record(
     :param client:
         Legislice client for downloading missing fields from `record`
 
+    :param max_workers:
+        the maximum number of requests that may be made to `client` at once
+
     :returns:
         a tuple of four objects containing holdings, terms, enactments,
         and anchors.
     """
     record_post_enactments, enactment_index = collect_enactments(record)
     if client:
-        enactment_index_post_client = client.update_entries_in_enactment_index(
-            enactment_index
+        update_enactment_indexes(
+            [enactment_index], client=client, max_workers=max_workers
         )
-    else:
-        enactment_index_post_client = enactment_index
+    return extract_anchors_from_indexed_record(record_post_enactments, enactment_index)
+
+
+def extract_anchors_from_indexed_record(
+    record_post_enactments: List[RawHolding], enactment_index: Mentioned
+) -> Tuple[
+    List[Holding],
+    List[EnactmentWithAnchors],
+    List[TermWithAnchors],
+    List[Dict[str, str]],
+]:
+    r"""
+    Load Holdings from JSON after the Enactments have been collected in an index.
+
+    :param record_post_enactments:
+        a list of dicts representing holdings, with Enactments
+        replaced by references to `enactment_index`
+
+    :param enactment_index:
+        an index of the Enactments cited in the holdings, which should
+        already have been updated with any fields missing from the JSON
+
+    :returns:
+        a tuple of four objects containing holdings, terms, enactments,
+        and anchors.
+    """
     enactment_anchors, enactment_index_post_anchors = collect_anchors_from_index(
-        enactment_index_post_client, "passage"
+        enactment_index, "passage"
     )
 
     enactment_result = []
@@ -294,7 +419,9 @@ def extract_anchors_from_holding_record(
 
 
 def read_holdings(
-    record: List[RawHolding], client: Optional[Client] = None
+    record: List[RawHolding],
+    client: Optional[Client] = None,
+    max_workers: int = 1,
 ) -> List[Holding]:
     r"""
     Load a list of :class:`Holdings`\s from JSON.
@@ -302,10 +429,11 @@ def read_holdings(
     :param record:
         a list of dicts representing holdings, in the JSON input format
 
-    :parame regime:
-        A collection of :class:`.Jurisdiction`\s and the :class:`.Code`\s
-        that have been enacted in each. Used for constructing
-        :class:`.Enactment`\s referenced by :class:`.Holding`\s.
+    :param client:
+        Legislice client for downloading missing fields from `record`
+
+    :param max_workers:
+        the maximum number of requests that may be made to `client` at once
 
     :returns:
         a list of :class:`.Holding` objects
@@ -315,7 +443,7 @@ def read_holdings(
         enactment_anchors,
         factor_anchors,
         holding_anchors,
-    ) = extract_anchors_from_holding_record(record, client)
+    ) = extract_anchors_from_holding_record(record, client, max_workers=max_workers)
 
     return holdings
 
@@ -0,0 +1,503 @@
+r"""
+Store for a corpus of judicial decisions and holdings, with a searchable index.
+
+Files are spread across subdirectories so no one directory gets too large,
+and a SQLite database records metadata about each decision, so subsets
+of the corpus can be selected without opening every file.
+"""
+
+from __future__ import annotations
+
+from contextlib import closing
+import datetime
+import hashlib
+import json
+import pathlib
+import sqlite3
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from legislice.download import Client, normalize_path
+from pydantic import BaseModel
+
+from authorityspoke.decisions import Decision, DecisionReading, RawDecision
+from authorityspoke.holdings import RawHolding
+from authorityspoke.io import filepaths, loaders, readers
+from authorityspoke.io.writers import case_to_file
+
+
+class StoredDecision(BaseModel):
+    """Metadata about a decision in a :class:`CorpusStore`."""
+
+    id: int
+    name: str = ""
+    citations: List[str] = []
+    court: str = ""
+    decision_date: datetime.date
+    decision_path: str
+    decision_hash: str
+    holdings_path: Optional[str] = None
+    holdings_hash: Optional[str] = None
+    holding_count: int = 0
+    enactment_nodes: List[str] = []
+
+
+def file_hash(path: pathlib.Path) -> str:
+    """Get the SHA-256 hash of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_enactment_nodes(records: Any) -> Set[str]:
+    """Find the paths of all the Enactments cited in raw holding records."""
+    nodes: Set[str] = set()
+    to_visit = [records]
+    while to_visit:
+        item = to_visit.pop()
+        if isinstance(item, dict):
+            node = item.get("node")
+            if isinstance(node, str) and node.startswith("/"):
+                nodes.add(normalize_path(node))
+            to_visit.extend(item.values())
+        elif isinstance(item, list):
+            to_visit.extend(item)
+    return nodes
+
+
+class CorpusStore:
+    r"""
+    Directory of decision and holding files, sharded by decision ID.
+
+    The layout of the directory is::
+
+        root/
+            index.db
+            decisions/<shard>/<id>.json
+            holdings/<shard>/<id>.json
+
+    where ``<shard>`` is a two-character hexadecimal prefix derived from
+    the decision's Caselaw Access Project ID.
+    """
+
+    def __init__(self, root: Union[str, pathlib.Path], compress: bool = False):
+        """
+        Open a store, creating its directory and index if they don't exist.
+
+        :param root:
+            directory where the store's files and index are kept
+
+        :param compress:
+            whether to save new decision files with gzip compression
+        """
+        self.root = pathlib.Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compress = compress
+        self.index_path = self.root / "index.db"
+        self._create_tables()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.index_path, timeout=30)
+
+    def _create_tables(self) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS decisions (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    court TEXT NOT NULL,
+                    decision_date TEXT NOT NULL,
+                    decision_path TEXT NOT NULL,
+                    decision_hash TEXT NOT NULL,
+                    holdings_path TEXT,
+                    holdings_hash TEXT,
+                    holding_count INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS citations (
+                    decision_id INTEGER NOT NULL,
+                    cite TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS enactment_nodes (
+                    decision_id INTEGER NOT NULL,
+                    node TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS decisions_by_court ON decisions (court);
+                CREATE INDEX IF NOT EXISTS decisions_by_date
+                    ON decisions (decision_date);
+                CREATE INDEX IF NOT EXISTS citations_by_cite ON citations (cite);
+                CREATE INDEX IF NOT EXISTS citations_by_decision
+                    ON citations (decision_id);
+                CREATE INDEX IF NOT EXISTS nodes_by_node ON enactment_nodes (node);
+                CREATE INDEX IF NOT EXISTS nodes_by_decision
+                    ON enactment_nodes (decision_id);
+                """)
+
+    @staticmethod
+    def shard_for(decision_id: int) -> str:
+        """Get the name of the subdirectory for a decision's files."""
+        return hashlib.sha1(str(decision_id).encode()).hexdigest()[:2]
+
+    @staticmethod
+    def normalize_cite(cite: str) -> str:
+        """Make a citation comparable regardless of case and spacing."""
+        return " ".join(cite.lower().split())
+
+    def _relative_path(self, kind: str, decision_id: int, suffix: str) -> str:
+        return f"{kind}/{self.shard_for(decision_id)}/{decision_id}{suffix}"
+
+    def add(
+        self,
+        decision: Union[Decision, DecisionReading, RawDecision],
+        holdings: Optional[List[RawHolding]] = None,
+    ) -> StoredDecision:
+        r"""
+        Save a decision, and optionally its holdings, and add them to the index.
+
+        :param decision:
+            a decision with a Caselaw Access Project ID. If a
+            :class:`.DecisionReading` is given, only its Decision is saved,
+            after loading any opinion text that was left on disk.
+
+        :param holdings:
+            raw holding records for the decision, in the format read by
+            :func:`.loaders.load_holdings`\. If ``None``, any holdings
+            already stored for the decision are kept.
+
+        :returns:
+            the index entry for the decision
+        """
+        if isinstance(decision, DecisionReading):
+            # the text may only be on disk in the file about to be replaced
+            decision.load_opinion_texts()
+            decision = decision.decision
+        elif not isinstance(decision, Decision):
+            decision = Decision(**decision)
+        if decision.id is None:
+            raise ValueError("Decision must have an ID to be added to a CorpusStore.")
+
+        suffix = ".json.gz" if self.compress else ".json"
+        decision_path = self._relative_path("decisions", decision.id, suffix)
+        full_decision_path = self.root / decision_path
+        full_decision_path.parent.mkdir(parents=True, exist_ok=True)
+        case_to_file(decision, filepath=full_decision_path, indent=None)
+
+        existing = self.get_entry(decision.id)
+        if existing and existing.decision_path != decision_path:
+            (self.root / existing.decision_path).unlink(missing_ok=True)
+        holdings_path = existing.holdings_path if existing else None
+        holdings_hash = existing.holdings_hash if existing else None
+        holding_count = existing.holding_count if existing else 0
+        nodes = set(existing.enactment_nodes) if existing else set()
+        if holdings is not None:
+            holdings_path = self._relative_path("holdings", decision.id, ".json")
+            full_holdings_path = self.root / holdings_path
+            full_holdings_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(full_holdings_path, "w") as f:
+                json.dump(holdings, f, default=str)
+            holdings_hash = file_hash(full_holdings_path)
+            holding_count = len(holdings)
+            nodes = find_enactment_nodes(holdings)
+
+        entry = StoredDecision(
+            id=decision.id,
+            name=decision.name_abbreviation or decision.name or "",
+            citations=[citation.cite for citation in decision.citations or []],
+            court=decision.court.name if decision.court else "",
+            decision_date=decision.decision_date,
+            decision_path=decision_path,
+            decision_hash=file_hash(full_decision_path),
+            holdings_path=holdings_path,
+            holdings_hash=holdings_hash,
+            holding_count=holding_count,
+            enactment_nodes=sorted(nodes),
+        )
+        self._save_entry(entry)
+        return entry
+
+    def _save_entry(self, entry: StoredDecision) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.id,
+                    entry.name,
+                    entry.court,
+                    entry.decision_date.isoformat(),
+                    entry.decision_path,
+                    entry.decision_hash,
+                    entry.holdings_path,
+                    entry.holdings_hash,
+                    entry.holding_count,
+                ),
+            )
+            connection.execute(
+                "DELETE FROM citations WHERE decision_id = ?", (entry.id,)
+            )
+            connection.executemany(
+                "INSERT INTO citations VALUES (?, ?)",
+                [(entry.id, self.normalize_cite(cite)) for cite in entry.citations],
+            )
+            connection.execute(
+                "DELETE FROM enactment_nodes WHERE decision_id = ?", (entry.id,)
+            )
+            connection.executemany(
+                "INSERT INTO enactment_nodes VALUES (?, ?)",
+                [(entry.id, node) for node in entry.enactment_nodes],
+            )
+
+    def remove(self, decision_id: int) -> None:
+        """Delete a decision's files and remove it from the index."""
+        entry = self.get_entry(decision_id)
+        if entry is None:
+            return
+        for path in (entry.decision_path, entry.holdings_path):
+            if path:
+                (self.root / path).unlink(missing_ok=True)
+        with closing(self._connect()) as connection, connection:
+            for table, column in (
+                ("decisions", "id"),
+                ("citations", "decision_id"),
+                ("enactment_nodes", "decision_id"),
+            ):
+                connection.execute(
+                    f"DELETE FROM {table} WHERE {column} = ?", (decision_id,)
+                )
+
+    def _entries_from_rows(
+        self, connection: sqlite3.Connection, rows: Sequence[Tuple]
+    ) -> List[StoredDecision]:
+        entries = []
+        for row in rows:
+            decision_id = row[0]
+            cites = connection.execute(
+                "SELECT cite FROM citations WHERE decision_id = ? ORDER BY rowid",
+                (decision_id,),
+            ).fetchall()
+            nodes = connection.execute(
+                "SELECT node FROM enactment_nodes WHERE decision_id = ? ORDER BY node",
+                (decision_id,),
+            ).fetchall()
+            entries.append(
+                StoredDecision(
+                    id=decision_id,
+                    name=row[1],
+                    court=row[2],
+                    decision_date=row[3],
+                    decision_path=row[4],
+                    decision_hash=row[5],
+                    holdings_path=row[6],
+                    holdings_hash=row[7],
+                    holding_count=row[8],
+                    citations=[cite for (cite,) in cites],
+                    enactment_nodes=[node for (node,) in nodes],
+                )
+            )
+        return entries
+
+    def get_entry(self, decision_id: int) -> Optional[StoredDecision]:
+        """Get the index entry for a decision, without opening its files."""
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT * FROM decisions WHERE id = ?", (decision_id,)
+            ).fetchall()
+            entries = self._entries_from_rows(connection, rows)
+        return entries[0] if entries else None
+
+    def find_id(self, cite: str) -> Optional[int]:
+        """Get the ID of the decision with a citation, if it's in the store."""
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT decision_id FROM citations WHERE cite = ?",
+                (self.normalize_cite(cite),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def select(
+        self,
+        court: Optional[str] = None,
+        cite: Optional[str] = None,
+        decided_after: Optional[Union[datetime.date, str]] = None,
+        decided_before: Optional[Union[datetime.date, str]] = None,
+        min_holdings: Optional[int] = None,
+        enactment: Optional[str] = None,
+    ) -> List[StoredDecision]:
+        """
+        Find the index entries for decisions matching all the given filters.
+
+        :param court:
+            the name of the court that issued the decision
+
+        :param cite:
+            a citation of the decision
+
+        :param decided_after:
+            the earliest decision date to include
+
+        :param decided_before:
+            the latest decision date to include
+
+        :param min_holdings:
+            the minimum number of stored holdings
+
+        :param enactment:
+            the path of an Enactment that must be cited in the holdings,
+            or the path of a provision containing a cited Enactment
+
+        :returns:
+            matching entries, ordered by decision date
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if court is not None:
+            clauses.append("court = ?")
+            params.append(court)
+        if cite is not None:
+            clauses.append("id IN (SELECT decision_id FROM citations WHERE cite = ?)")
+            params.append(self.normalize_cite(cite))
+        if decided_after is not None:
+            clauses.append("decision_date >= ?")
+            params.append(str(decided_after))
+        if decided_before is not None:
+            clauses.append("decision_date <= ?")
+            params.append(str(decided_before))
+        if min_holdings is not None:
+            clauses.append("holding_count >= ?")
+            params.append(min_holdings)
+        if enactment is not None:
+            node = normalize_path(enactment)
+            clauses.append(
+                "id IN (SELECT decision_id FROM enactment_nodes "
+                "WHERE node = ? OR substr(node, 1, ?) = ?)"
+            )
+            params.extend([node, len(node) + 1, node + "/"])
+        query = "SELECT * FROM decisions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY decision_date, id"
+        with closing(self._connect()) as connection:
+            rows = connection.execute(query, params).fetchall()
+            return self._entries_from_rows(connection, rows)
+
+    def load_holdings(self, entry: StoredDecision) -> List[RawHolding]:
+        """Load the raw holding records stored for a decision."""
+        if not entry.holdings_path:
+            return []
+        return loaders.load_holdings(filepath=self.root / entry.holdings_path)
+
+    def read_entry(
+        self,
+        entry: StoredDecision,
+        client: Optional[Client] = None,
+        with_holdings: bool = True,
+        lazy_text: bool = False,
+    ) -> DecisionReading:
+        """
+        Load the :class:`.DecisionReading` for an index entry.
+
+        :param entry:
+            the index entry for the decision
+
+        :param client:
+            a client to get any Enactments cited in the holdings
+
+        :param with_holdings:
+            whether to posit the stored holdings on the majority opinion
+
+        :param lazy_text:
+            whether to leave opinion text on disk until it's needed.
+            Ignored for compressed files.
+        """
+        decision_path = self.root / entry.decision_path
+        reading = loaders.load_decision_as_reading(
+            filepath=decision_path,
+            lazy_text=lazy_text and not filepaths.is_compressed(decision_path),
+        )
+        if with_holdings and entry.holding_count:
+            raw_holdings = self.load_holdings(entry)
+            reading.posit(readers.read_holdings_with_anchors(raw_holdings, client))
+        return reading
+
+    def read(
+        self,
+        query: Union[int, str],
+        client: Optional[Client] = None,
+        with_holdings: bool = True,
+        lazy_text: bool = False,
+    ) -> Optional[DecisionReading]:
+        """Load a stored decision by its ID or citation, or return ``None``."""
+        decision_id = query if isinstance(query, int) else self.find_id(query)
+        entry = self.get_entry(decision_id) if decision_id is not None else None
+        if entry is None:
+            return None
+        return self.read_entry(
+            entry, client=client, with_holdings=with_holdings, lazy_text=lazy_text
+        )
+
+    def iter_readings(
+        self,
+        client: Optional[Client] = None,
+        with_holdings: bool = True,
+        lazy_text: bool = False,
+        **filters: Any,
+    ) -> Iterator[DecisionReading]:
+        r"""
+        Load each stored decision matching the filters, one at a time.
+
+        The filters are the keyword arguments accepted by :meth:`select`\.
+        Only the files for matching decisions are opened.
+        """
+        for entry in self.select(**filters):
+            yield self.read_entry(
+                entry, client=client, with_holdings=with_holdings, lazy_text=lazy_text
+            )
+
+    def verify(self, entry: StoredDecision) -> bool:
+        """Check that a decision's files haven't changed since they were indexed."""
+        if file_hash(self.root / entry.decision_path) != entry.decision_hash:
+            return False
+        if entry.holdings_path:
+            return file_hash(self.root / entry.holdings_path) == entry.holdings_hash
+        return True
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+
+    def __contains__(self, decision_id: object) -> bool:
+        return isinstance(decision_id, int) and self.get_entry(decision_id) is not None
+
+    def add_files(
+        self,
+        decision_directory: Optional[pathlib.Path] = None,
+        holdings_for: Optional[Dict[str, str]] = None,
+        holdings_directory: Optional[pathlib.Path] = None,
+    ) -> List[StoredDecision]:
+        """
+        Import decision files from a directory, such as the example data.
+
+        :param decision_directory:
+            directory of JSON decision files. Defaults to ``example_data/cases``.
+
+        :param holdings_for:
+            names of holding files to import for each decision file,
+            keyed by the name of the decision file
+
+        :param holdings_directory:
+            directory of the holding files. Defaults to ``example_data/holdings``.
+        """
+        decision_directory = decision_directory or filepaths.get_directory_path("cases")
+        holdings_for = holdings_for or {}
+        entries = []
+        for path in sorted(decision_directory.iterdir()):
+            if filepaths.data_suffix(path) != ".json":
+                continue
+            holdings = None
+            if path.name in holdings_for:
+                holdings = loaders.load_holdings(
+                    filename=holdings_for[path.name], directory=holdings_directory
+                )
+            decision = loaders.load_decision(filepath=path)
+            entries.append(self.add(decision, holdings=holdings))
+        return entries
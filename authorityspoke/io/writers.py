@@ -16,10 +16,14 @@ def case_to_file(
     filename: Optional[str] = None,
     directory: Optional[pathlib.Path] = None,
     filepath: Optional[pathlib.Path] = None,
+    indent: Optional[int] = 4,
 ) -> None:
     r"""
     Save one case from an API response as a JSON file.
 
+    If the filename ends with ``.gz`` or ``.xz``, the file will be
+    compressed in that format.
+
     :param results:
         A dict representing a case, in the format
         of the Caselaw Access Project API.
@@ -36,9 +40,13 @@ def case_to_file(
     :param filepath:
         Complete path to the location where the JSON file should be saved,
         including filename.
+
+    :param indent:
+        number of spaces to indent each level of the JSON, or
+        ``None`` to write the file without line breaks or indentation.
     """
     validated_filepath = filepaths.make_filepath(
         filename, directory, filepath, default_folder="cases"
     )
-    with open(validated_filepath, "w") as fp:
-        fp.write(case.model_dump_json(indent=4))
+    with filepaths.open_text(validated_filepath, "w") as fp:
+        fp.write(case.model_dump_json(indent=indent))
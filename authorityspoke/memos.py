@@ -0,0 +1,153 @@
+r"""
+Remembered results of adding Procedures and Rules or taking their union.
+
+Adding two :class:`.Procedure`\s, or taking their union, searches through
+possible context registers and compares Factors for each of them, and
+workflows that compose :class:`.Rule`\s often repeat the same operation
+on equal operands. An :class:`OperationMemo` keeps the most recently used
+results, keyed by fingerprints of the operands and of the context.
+
+A fingerprint is made from the values of every field of the operands'
+Factors rather than their identity, so equal operands share results even
+if they're different objects. Each call copies a result once: a new result
+is copied when it's stored, and a remembered result is copied when it's
+returned, so changing a result can't change the remembered one. Memoized
+operations call each other's unmemoized versions, so a result isn't also
+copied by an inner operation.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import datetime
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional, Tuple, TypeVar
+from typing import Union
+
+from nettlesome.terms import ContextRegister, Explanation
+from pydantic import BaseModel
+
+from authorityspoke.passages import passage_store
+
+if TYPE_CHECKING:
+    from authorityspoke.procedures import Procedure
+    from authorityspoke.rules import Rule
+
+T = TypeVar("T")
+
+
+_PLAIN_TYPES = (str, int, float, bool, type(None), datetime.date)
+
+
+def structure_fingerprint(value: Any) -> Hashable:
+    """
+    Get a hashable summary of the class and every field of a model.
+
+    Lists and tuples are summarized item by item. Values that aren't models,
+    such as the quantities of a Comparison, are summarized by their class
+    and string.
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return value
+    if isinstance(value, BaseModel):
+        return (value.__class__.__name__,) + tuple(
+            structure_fingerprint(getattr(value, name))
+            for name in value.__class__.model_fields
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(structure_fingerprint(item) for item in value)
+    return (value.__class__.__name__, str(value))
+
+
+def procedure_fingerprint(procedure: Procedure) -> Hashable:
+    """Summarize the class and fields of each Factor of a Procedure, and its name."""
+    return structure_fingerprint(procedure)
+
+
+def rule_fingerprint(rule: Rule) -> Tuple[Hashable, ...]:
+    """Summarize the parts of a Rule that affect adding it or taking its union."""
+    return (
+        procedure_fingerprint(rule.procedure),
+        rule.mandatory,
+        rule.universal,
+        tuple(passage_store.key_of(passage) for passage in rule.enactments),
+        tuple(passage_store.key_of(passage) for passage in rule.enactments_despite),
+    )
+
+
+def context_fingerprint(
+    context: Optional[Union[ContextRegister, Explanation]],
+) -> Tuple[Hashable, ...]:
+    """Summarize the matched Terms of a context, and the reasons of an Explanation."""
+    reasons: Tuple[str, ...] = ()
+    if isinstance(context, Explanation):
+        reasons = tuple(reason.key for reason in context.reasons)
+        context = context.context
+    if not context:
+        return ((), reasons)
+    matches = tuple(
+        sorted((key, structure_fingerprint(value)) for key, value in context.items())
+    )
+    return (matches, reasons)
+
+
+class OperationMemo:
+    """Least recently used results of operations on Procedures and Rules."""
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Create empty memo.
+
+        :param max_size:
+            number of results to remember before forgetting the least
+            recently used result
+        """
+        self.max_size = max_size
+        self.results: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def clear(self) -> None:
+        """Forget all results."""
+        with self._lock:
+            self.results.clear()
+
+    def remember(
+        self, key: Hashable, operation: Callable[[], T], copy: Callable[[T], T]
+    ) -> T:
+        """
+        Get the result of an operation, performing it only if it's not remembered.
+
+        :param key:
+            fingerprint of the operation, its operands, and its context
+
+        :param operation:
+            function to perform the operation
+
+        :param copy:
+            function to copy a result that isn't ``None``
+
+        :returns:
+            a result that isn't shared with the memo
+        """
+        with self._lock:
+            found = key in self.results
+            if found:
+                self.results.move_to_end(key)
+                result = self.results[key]
+        if found:
+            return result if result is None else copy(result)
+        # the operation runs without the lock, so other threads aren't blocked
+        result = operation()
+        stored = result if result is None else copy(result)
+        with self._lock:
+            self.results[key] = stored
+            self.results.move_to_end(key)
+            while len(self.results) > self.max_size:
+                self.results.popitem(last=False)
+        return result
+
+
+operation_memo = OperationMemo()
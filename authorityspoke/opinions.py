@@ -2,8 +2,9 @@ r""":class:`Court` documents that decide litigation and posit :class:`.Rule`\s."
 
 from __future__ import annotations
 
+from copy import copy
 from itertools import zip_longest
-from typing import Any, Dict, Iterator, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 from typing import Optional, Sequence, Union
 
 import logging
@@ -17,10 +18,17 @@ from justopinion import Opinion
 from legislice.enactments import EnactmentPassage
 from nettlesome.terms import Comparable, ContextRegister, Explanation, Term
 from nettlesome.factors import Factor
-from pydantic import field_validator, BaseModel
+from pydantic import field_validator, BaseModel, PrivateAttr
 
+from authorityspoke.explanations import ExplanationStream
 from authorityspoke.facts import Entity, Fact, Allegation, Pleading, Exhibit, Evidence
 from authorityspoke.holdings import Holding, HoldingGroup
+from authorityspoke.indexes import (
+    EnactmentPathIndex,
+    HoldingFingerprint,
+    holding_fingerprint,
+)
+from authorityspoke.intervals import END_OF_TEXT, IntervalIndex, Span
 from authorityspoke.procedures import Procedure
 from authorityspoke.rules import Rule
 
@@ -82,55 +90,193 @@ class AnchoredHoldings(BaseModel):
     named_anchors: List[TermWithAnchors] = []
     enactment_anchors: List[EnactmentWithAnchors] = []
 
+    _term_indexes: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _enactment_indexes: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _holding_buckets: Dict[HoldingFingerprint, List[int]] = PrivateAttr(
+        default_factory=dict
+    )
+    # each indexed list, with its length when it was indexed
+    _indexed_lists: Dict[str, Tuple[List[Any], int]] = PrivateAttr(default_factory=dict)
+
+    def _index_is_current(self, name: str, items: List[Any]) -> bool:
+        """Check whether a list has been replaced or resized since it was indexed."""
+        indexed, length = self._indexed_lists.get(name, (None, 0))
+        return indexed is items and length == len(items)
+
+    def _mark_indexed(self, name: str, items: List[Any]) -> None:
+        self._indexed_lists[name] = (items, len(items))
+
+    def _term_index_for_key(self, key: str) -> Optional[int]:
+        r"""
+        Look up the position of a term in ``named_anchors`` by the term's key.
+
+        The index is rebuilt if ``named_anchors`` was changed without
+        using :meth:`add_term`\.
+        """
+        items = self.named_anchors
+        index = self._term_indexes.get(key)
+        if index is not None and index < len(items) and items[index].term.key == key:
+            return index
+        if index is None and self._index_is_current("named_anchors", items):
+            return None
+        self._term_indexes = {}
+        for position, item in enumerate(items):
+            self._term_indexes.setdefault(item.term.key, position)
+        self._mark_indexed("named_anchors", items)
+        return self._term_indexes.get(key)
+
+    def _enactment_index_for_key(self, key: str) -> Optional[int]:
+        r"""
+        Look up the position of a passage in ``enactment_anchors`` by its text.
+
+        The index is rebuilt if ``enactment_anchors`` was changed without
+        using :meth:`add_enactment`\.
+        """
+        items = self.enactment_anchors
+        index = self._enactment_indexes.get(key)
+        if (
+            index is not None
+            and index < len(items)
+            and str(items[index].passage) == key
+        ):
+            return index
+        if index is None and self._index_is_current("enactment_anchors", items):
+            return None
+        self._enactment_indexes = {}
+        for position, item in enumerate(items):
+            self._enactment_indexes.setdefault(str(item.passage), position)
+        self._mark_indexed("enactment_anchors", items)
+        return self._enactment_indexes.get(key)
+
+    def _holding_bucket(self, fingerprint: HoldingFingerprint) -> List[int]:
+        r"""
+        Look up the positions in ``holdings`` of Holdings with a fingerprint.
+
+        The index is rebuilt if ``holdings`` was changed without
+        using :meth:`append_holding`\.
+        """
+        items = self.holdings
+        if not self._index_is_current("holdings", items):
+            self._holding_buckets = {}
+            for position, item in enumerate(items):
+                self._holding_buckets.setdefault(
+                    holding_fingerprint(item.holding), []
+                ).append(position)
+            self._mark_indexed("holdings", items)
+        return self._holding_buckets.get(fingerprint, [])
+
+    def find_holding_index(self, holding: Holding) -> Optional[int]:
+        r"""
+        Find the index of the first Holding with the same meaning as ``holding``.
+
+        Only Holdings with the same :func:`.holding_fingerprint` are
+        compared with :meth:`~.Holding.means`\.
+        """
+        for position in self._holding_bucket(holding_fingerprint(holding)):
+            if holding.means(self.holdings[position].holding):
+                return position
+        return None
+
+    def append_holding(self, item: HoldingWithAnchors) -> None:
+        """Add a Holding with its anchors, without checking for duplicates."""
+        fingerprint = holding_fingerprint(item.holding)
+        bucket = self._holding_bucket(fingerprint)
+        self.holdings.append(item)
+        if not bucket:
+            self._holding_buckets[fingerprint] = bucket
+        bucket.append(len(self.holdings) - 1)
+        self._mark_indexed("holdings", self.holdings)
+
     def find_term_index(self, term: Term) -> Optional[int]:
         """Find the index of a term in the holdings."""
-        key = term.key
-        for index, term_with_anchors in enumerate(self.named_anchors):
-            if term_with_anchors.term.key == key:
-                return index
-        return None
+        return self._term_index_for_key(term.key)
 
     def add_term(self, term: Term, anchors: TextPositionSet) -> None:
         """Add a term that can be found in self's holdings, with the term's anchors to the text."""
         term_index = self.find_term_index(term)
         if term_index is None:
             self.named_anchors.append(TermWithAnchors(term=term, anchors=anchors))
+            self._term_indexes[term.key] = len(self.named_anchors) - 1
+            self._mark_indexed("named_anchors", self.named_anchors)
         else:
             self.named_anchors[term_index].anchors += anchors
 
     def get_term_anchors(self, key: str) -> TextPositionSet:
         """Get the anchors for a term."""
-        for item in self.named_anchors:
-            if item.term.key == key:
-                return item.anchors
-        raise KeyError(f"Term with key '{key}' not found")
+        term_index = self._term_index_for_key(key)
+        if term_index is None:
+            raise KeyError(f"Term with key '{key}' not found")
+        return self.named_anchors[term_index].anchors
 
     def find_enactment_index(self, enactment: EnactmentPassage) -> Optional[int]:
         """Find the index of a term in the holdings."""
-        key = str(enactment)
-        for index, enactment_with_anchors in enumerate(self.enactment_anchors):
-            if str(enactment_with_anchors.passage) == key:
-                return index
-        return None
+        return self._enactment_index_for_key(str(enactment))
 
     def add_enactment(
         self, enactment: EnactmentPassage, anchors: TextPositionSet
     ) -> None:
         """Add EnactmentPassage with text anchors, if it isn't a duplicate."""
-        term_index = self.find_enactment_index(enactment)
+        key = str(enactment)
+        term_index = self._enactment_index_for_key(key)
         if term_index is None:
             self.enactment_anchors.append(
                 EnactmentWithAnchors(passage=enactment, anchors=anchors)
             )
+            self._enactment_indexes[key] = len(self.enactment_anchors) - 1
+            self._mark_indexed("enactment_anchors", self.enactment_anchors)
         else:
             self.enactment_anchors[term_index].anchors += anchors
 
     def get_enactment_anchors(self, key: str) -> TextPositionSet:
         """Get the anchors for a term."""
-        for item in self.enactment_anchors:
-            if str(item.passage) == key:
-                return item.anchors
-        raise KeyError(f"Enactment passage with key '{key}' not found")
+        enactment_index = self._enactment_index_for_key(key)
+        if enactment_index is None:
+            raise KeyError(f"Enactment passage with key '{key}' not found")
+        return self.enactment_anchors[enactment_index].anchors
+
+
+AnchoredItem = Union[HoldingWithAnchors, TermWithAnchors, EnactmentWithAnchors]
+
+
+# lists that a cached index or view was built from, with their lengths then
+ListSignature = Tuple[Tuple[List[Any], int], ...]
+
+
+def _list_signature(*lists: List[Any]) -> ListSignature:
+    """Get the lists and their current lengths, to check later for changes."""
+    return tuple((items, len(items)) for items in lists)
+
+
+def _same_lists(old: ListSignature, new: ListSignature) -> bool:
+    """
+    Check that two signatures have the same list objects with the same lengths.
+
+    The lists are compared by identity, because equal lists could be
+    different objects, and the ``id`` of a discarded list can be reused.
+    """
+    return len(old) == len(new) and all(
+        old_items is new_items and old_length == new_length
+        for (old_items, old_length), (new_items, new_length) in zip(old, new)
+    )
+
+
+def anchor_spans(
+    item: AnchoredItem, anchors: Optional[TextPositionSet] = None
+) -> List[Span]:
+    """
+    Get a :class:`.Span` for each text position where an item is anchored.
+
+    A position with no ``end`` is treated as continuing to the end of the text.
+    """
+    anchors = item.anchors if anchors is None else anchors
+    return [
+        Span(
+            start=position.start,
+            end=END_OF_TEXT if position.end is None else position.end,
+            item=item,
+        )
+        for position in anchors.positions
+    ]
 
 
 class OpinionReading(Comparable, BaseModel):
@@ -140,16 +286,62 @@ class OpinionReading(Comparable, BaseModel):
     generic: bool = False
     opinion_type: str = ""
     opinion_author: str = ""
+    _anchor_index: Optional[IntervalIndex] = PrivateAttr(default=None)
+    _anchor_index_signature: ListSignature = PrivateAttr(default=())
+    _enactment_index: Optional[EnactmentPathIndex] = PrivateAttr(default=None)
+    _enactment_index_signature: ListSignature = PrivateAttr(default=())
+    # views of the Holdings, with the signature of the Holdings they were built from
+    _views: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _term_lookup: Optional[TermLookup] = PrivateAttr(default=None)
+    _term_lookup_signature: ListSignature = PrivateAttr(default=())
+
+    def _cached_view(self, name: str, build: Callable[[], Any]) -> Any:
+        r"""
+        Get a view of the Holdings that is only rebuilt when the Holdings change.
+
+        Views are discarded by :meth:`posit_holding` and :meth:`clear_holdings`\,
+        and when the list of Holdings is replaced or resized some other way.
+        """
+        views = self._views
+        signature = self._holdings_signature()
+        if not _same_lists(views.get("signature", ()), signature):
+            views.clear()
+            views["signature"] = signature
+        view = views.get(name)
+        if view is None:
+            view = views[name] = build()
+        return view
+
+    def _clear_views(self) -> None:
+        self._views.clear()
 
     @property
     def holdings(self) -> HoldingGroup:
-        """Get Holdings for the Opinion."""
-        return HoldingGroup([item.holding for item in self.anchored_holdings.holdings])
+        """
+        Get Holdings for the Opinion.
+
+        Each call returns a new HoldingGroup, so replacing the group's
+        ``sequence`` doesn't change the cached view. The Holdings in the
+        group are the OpinionReading's own Holdings, not copies.
+        """
+        return copy(
+            self._cached_view(
+                "holdings",
+                lambda: HoldingGroup(
+                    [item.holding for item in self.anchored_holdings.holdings]
+                ),
+            )
+        )
 
     @property
     def holding_anchors(self) -> List[TextPositionSet]:
         """Get Holdings with corresponding anchors for the Opinion."""
-        return [item.anchors for item in self.anchored_holdings.holdings]
+        return list(
+            self._cached_view(
+                "holding_anchors",
+                lambda: [item.anchors for item in self.anchored_holdings.holdings],
+            )
+        )
 
     @property
     def anchored_factors(self) -> List[TermWithAnchors]:
@@ -161,6 +353,104 @@ class OpinionReading(Comparable, BaseModel):
         """Get Enactment passages with corresponding anchors for the Opinion."""
         return self.anchored_holdings.enactment_anchors
 
+    def _anchor_lists_signature(self) -> ListSignature:
+        """Get the current lists of anchored items and their lengths."""
+        anchored = self.anchored_holdings
+        return _list_signature(
+            anchored.holdings, anchored.named_anchors, anchored.enactment_anchors
+        )
+
+    def _anchor_index_is_current(self) -> bool:
+        return self._anchor_index is not None and _same_lists(
+            self._anchor_index_signature, self._anchor_lists_signature()
+        )
+
+    @property
+    def anchor_index(self) -> IntervalIndex:
+        r"""
+        Get an index of the text positions of the anchors in ``anchored_holdings``.
+
+        The index is updated by :meth:`posit_holding`\, and rebuilt if
+        the lists of ``anchored_holdings`` are replaced or resized some
+        other way. Anchors that are only quotes have no positions to index
+        until they are located in the text, for instance with
+        :meth:`.DecisionReading.resolve_anchor_positions`\.
+        """
+        if not self._anchor_index_is_current():
+            anchored = self.anchored_holdings
+            self._anchor_index = IntervalIndex(
+                span
+                for items in (
+                    anchored.holdings,
+                    anchored.named_anchors,
+                    anchored.enactment_anchors,
+                )
+                for item in items
+                for span in anchor_spans(item)
+            )
+            self._anchor_index_signature = self._anchor_lists_signature()
+        return self._anchor_index
+
+    def _holdings_signature(self) -> ListSignature:
+        return _list_signature(self.anchored_holdings.holdings)
+
+    @property
+    def enactment_index(self) -> EnactmentPathIndex:
+        r"""
+        Get an index of the Holdings by the paths of the enactments they cite.
+
+        The index is updated by :meth:`posit_holding`\, and rebuilt if
+        the list of Holdings is replaced or resized some other way.
+        """
+        if self._enactment_index is None or not _same_lists(
+            self._enactment_index_signature, self._holdings_signature()
+        ):
+            self._enactment_index = EnactmentPathIndex(
+                item.holding for item in self.anchored_holdings.holdings
+            )
+            self._enactment_index_signature = self._holdings_signature()
+        return self._enactment_index
+
+    def holdings_citing(
+        self,
+        path: str,
+        include_subsections: bool = True,
+        include_ancestors: bool = False,
+        despite: Optional[bool] = None,
+    ) -> List[Holding]:
+        r"""
+        Get the Holdings that cite an enactment, using :attr:`enactment_index`\.
+
+        The parameters are the same as :meth:`.EnactmentPathIndex.find`\.
+        """
+        return self.enactment_index.find(
+            path,
+            include_subsections=include_subsections,
+            include_ancestors=include_ancestors,
+            despite=despite,
+        )
+
+    def anchored_at(self, start: int, end: Optional[int] = None) -> List[AnchoredItem]:
+        """
+        Get the Holdings, terms, and enactments anchored in part of the Opinion's text.
+
+        :param start:
+            the first text position to search
+
+        :param end:
+            the position after the last one to search. If ``None``, only
+            ``start`` is searched.
+
+        :returns:
+            each item with an anchor overlapping the range, ordered by
+            where its first overlapping anchor starts
+        """
+        end = start + 1 if end is None else end
+        found: Dict[int, AnchoredItem] = {}
+        for span in self.anchor_index.overlapping(start, end):
+            found.setdefault(id(span.item), span.item)
+        return list(found.values())
+
     def __str__(self):
         return super().__str__()
 
@@ -169,19 +459,40 @@ class OpinionReading(Comparable, BaseModel):
         factors_by_name = self.factors_by_name()
         return list(factors_by_name.values())
 
+    @property
+    def term_lookup(self) -> TermLookup:
+        r"""
+        Get an index of the terms of the Holdings, by name and by string.
+
+        The index is updated by :meth:`posit_holding`\, and rebuilt if
+        the list of Holdings is replaced or resized some other way.
+        """
+        if self._term_lookup is None or not _same_lists(
+            self._term_lookup_signature, self._holdings_signature()
+        ):
+            self._term_lookup = TermLookup(
+                item.holding for item in self.anchored_holdings.holdings
+            )
+            self._term_lookup_signature = self._holdings_signature()
+        return self._term_lookup
+
     def factors_by_name(self) -> FactorIndex:
-        """Get an index of Factors, indexed by name."""
-        factor_index = FactorIndex()
-        for holding in self.holdings:
-            factors_for_holding = holding.recursive_terms
-            for value in factors_for_holding.values():
-                if not isinstance(value, Holding):
-                    factor_index.insert_by_name(value=value)
-        return factor_index
+        """
+        Get an index of Factors, indexed by name.
+
+        Each call returns a new FactorIndex, so inserting into it doesn't
+        change the cached index.
+        """
+        lookup = self.term_lookup
+        if lookup.conflict is not None:
+            raise lookup.conflict
+        return FactorIndex(lookup.factor_index)
 
     def clear_holdings(self):
         r"""Remove all :class:`.Holding`\s from the opinion."""
         self.anchored_holdings.holdings = []
+        self._clear_views()
+        self._term_lookup = None
 
     def get_enactment_anchors(self, key: str) -> TextPositionSet:
         """Get the anchors for an enactment passage."""
@@ -265,6 +576,14 @@ class OpinionReading(Comparable, BaseModel):
             return None
         return explanation
 
+    def stream_contradiction(self, other: Comparable) -> ExplanationStream:
+        """Get a stream of distinct Explanations of how other contradicts self."""
+        return ExplanationStream(self.explanations_contradiction(other))
+
+    def stream_implication(self, other: Comparable) -> ExplanationStream:
+        """Get a stream of distinct Explanations of how self implies other."""
+        return ExplanationStream(self.explanations_implication(other))
+
     def explanations_implication(
         self,
         other: Comparable,
@@ -296,6 +615,11 @@ class OpinionReading(Comparable, BaseModel):
             of ``self``, with guaranteed order, including each
             generic :class:`.Factor` only once.
         """
+        return dict(
+            self._cached_view("generic_terms_by_str", self._build_generic_terms_by_str)
+        )
+
+    def _build_generic_terms_by_str(self) -> Dict[str, Comparable]:
         generics: Dict[str, Comparable] = {}
         for holding in self.holdings:
             for generic in holding.generic_terms():
@@ -316,22 +640,18 @@ class OpinionReading(Comparable, BaseModel):
             Otherwise ``None``.
         """
 
-        for holding in self.holdings:
-            factor = holding.get_factor_by_name(name)
-            if factor is not None:
-                return factor
-        return None
+        return self.term_lookup.by_name.get(name)
 
     def get_factor_by_str(self, query: str) -> Optional[Factor]:
         r"""Search recursively for :class:`.Factor` in holdings of self."""
-        return self.holdings.get_factor_by_str(query)
+        return self.term_lookup.by_str.get(query)
 
     def get_matching_holding(self, holding: Holding) -> Optional[Holding]:
         """Check self's Holdings for a Holding with the same meaning."""
-        for known_holding in self.holdings:
-            if holding.means(known_holding):
-                return known_holding
-        return None
+        index = self.anchored_holdings.find_holding_index(holding)
+        if index is None:
+            return None
+        return self.anchored_holdings.holdings[index].holding
 
     def posit_holding(
         self,
@@ -365,25 +685,61 @@ class OpinionReading(Comparable, BaseModel):
         if not isinstance(holding, Holding):
             raise TypeError('"holding" must be an object of type Holding.')
 
+        index_is_current = self._anchor_index_is_current()
+        enactment_index_is_current = self._enactment_index is not None and _same_lists(
+            self._enactment_index_signature, self._holdings_signature()
+        )
+        term_lookup_is_current = self._term_lookup is not None and _same_lists(
+            self._term_lookup_signature, self._holdings_signature()
+        )
+        new_spans: List[Span] = []
+        anchored = self.anchored_holdings
+
         for named_anchor in named_anchors:
-            self.anchored_holdings.add_term(
-                term=named_anchor.term, anchors=named_anchor.anchors
-            )
+            anchored.add_term(term=named_anchor.term, anchors=named_anchor.anchors)
+            if index_is_current:
+                item = anchored.named_anchors[
+                    anchored.find_term_index(named_anchor.term)
+                ]
+                new_spans.extend(anchor_spans(item, anchors=named_anchor.anchors))
 
         for enactment_anchor in enactment_anchors:
-            self.anchored_holdings.add_enactment(
-                enactment=enactment_anchor.passage, anchors=named_anchor.anchors
+            anchored.add_enactment(
+                enactment=enactment_anchor.passage, anchors=enactment_anchor.anchors
             )
-
-        matching_holding = self.get_matching_holding(holding)
-        if matching_holding:
-            matching_holding.anchors += holding.anchors
+            if index_is_current:
+                item = anchored.enactment_anchors[
+                    anchored.find_enactment_index(enactment_anchor.passage)
+                ]
+                new_spans.extend(anchor_spans(item, anchors=enactment_anchor.anchors))
+
+        matching_index = anchored.find_holding_index(holding)
+        if matching_index is not None:
+            matching_item = anchored.holdings[matching_index]
+            new_anchors = HoldingWithAnchors(
+                holding=holding, anchors=holding_anchors
+            ).anchors
+            matching_item.anchors += new_anchors
+            if index_is_current:
+                new_spans.extend(anchor_spans(matching_item, anchors=new_anchors))
         else:
             if context:
                 holding = holding.new_context(context, source=self)
-            self.anchored_holdings.holdings.append(
-                HoldingWithAnchors(holding=holding, anchors=holding_anchors)
-            )
+            new_item = HoldingWithAnchors(holding=holding, anchors=holding_anchors)
+            anchored.append_holding(new_item)
+            if index_is_current:
+                new_spans.extend(anchor_spans(new_item))
+            if enactment_index_is_current:
+                self._enactment_index.add(holding)
+                self._enactment_index_signature = self._holdings_signature()
+            if term_lookup_is_current:
+                self._term_lookup.add(holding)
+                self._term_lookup_signature = self._holdings_signature()
+
+        if index_is_current:
+            self._anchor_index.extend(new_spans)
+            self._anchor_index_signature = self._anchor_lists_signature()
+        self._clear_views()
 
     def posit_holdings(
         self,
@@ -557,3 +913,47 @@ class FactorIndex(Dict[str, Factor]):
                     )
         else:
             self[key] = value
+
+
+class TermLookup:
+    r"""
+    Index of the terms of a sequence of :class:`.Holding`\s.
+
+    Lookups give the same results as searching the ``recursive_terms``
+    of each Holding in order, but Holdings only need to be searched
+    once, when they're added.
+    """
+
+    def __init__(self, holdings: Iterable[Holding] = ()):
+        """
+        Create index, optionally containing the terms of some Holdings.
+
+        :param holdings:
+            Holdings to add to the index, in order
+        """
+        self.factor_index = FactorIndex()
+        self.by_name: Dict[str, Comparable] = {}
+        self.by_str: Dict[str, Comparable] = {}
+        self.conflict: Optional[NameError] = None
+        for holding in holdings:
+            self.add(holding)
+
+    def add(self, holding: Holding) -> None:
+        r"""
+        Index the terms of a Holding.
+
+        If terms with the same representation have different names, the
+        error is kept in ``conflict`` and no more terms are added to
+        ``factor_index``\.
+        """
+        terms = holding.recursive_terms
+        self.by_str.update(terms)
+        for value in terms.values():
+            name = getattr(value, "name", None)
+            if name is not None:
+                self.by_name.setdefault(name, value)
+            if self.conflict is None and not isinstance(value, Holding):
+                try:
+                    self.factor_index.insert_by_name(value=value)
+                except NameError as error:
+                    self.conflict = error
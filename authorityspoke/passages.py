@@ -0,0 +1,222 @@
+r"""
+Shared copies of the enactment passages cited by Rules.
+
+Many :class:`.Rule`\s cite the same selected text of the same
+:class:`~legislice.enactments.Enactment`\. A :class:`PassageStore` keeps one
+:class:`~legislice.enactments.EnactmentPassage` for each combination of
+node, version, text, and text selectors, so equal passages are copied and
+selected once and then shared by reference. The store also remembers the result of
+adding together groups of shared passages, because combining
+:class:`~legislice.groups.EnactmentGroup`\s consolidates their passages
+by comparing every pair of them.
+
+Each Rule gets its own shallow copy of a shared passage, with the same
+enactment and selection objects. The selection methods of
+:class:`~legislice.enactments.EnactmentPassage` replace the passage's
+selection instead of changing it, so selecting text on one Rule's passage
+doesn't change any other Rule, and the store stops treating the changed
+passage as a copy of the shared one.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+import datetime
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from legislice.enactments import Enactment, EnactmentPassage
+from legislice.groups import EnactmentGroup
+
+PassageKey = Tuple[
+    str,
+    datetime.date,
+    Optional[datetime.date],
+    str,
+    Tuple[Tuple[int, int], ...],
+    Tuple[Tuple[Optional[str], ...], ...],
+]
+
+# ids of the shared passages in two groups being added
+GroupKey = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+# the shared passages in two groups, and the shared passages in their sum
+GroupSum = Tuple[List[EnactmentPassage], List[EnactmentPassage], List[EnactmentPassage]]
+
+
+def passage_key(passage: EnactmentPassage) -> PassageKey:
+    """Identify a passage by its node, version, text, and selectors."""
+    return (
+        passage.node,
+        passage.start_date,
+        passage.end_date,
+        passage.enactment.text,
+        tuple(
+            (position.start, position.end) for position in passage.selection.positions
+        ),
+        tuple(
+            (quote.exact, quote.prefix, quote.suffix)
+            for quote in passage.selection.quotes
+        ),
+    )
+
+
+def _same_passages(left: List[EnactmentPassage], right: List[EnactmentPassage]) -> bool:
+    return len(left) == len(right) and all(
+        left_passage is right_passage
+        for left_passage, right_passage in zip(left, right)
+    )
+
+
+class PassageStore:
+    """Table of shared EnactmentPassages and of sums of groups of them."""
+
+    def __init__(self, max_passages: int = 10_000, max_sums: int = 10_000):
+        """
+        Create empty store.
+
+        :param max_passages:
+            number of shared passages to remember before forgetting them all,
+            along with the sums
+
+        :param max_sums:
+            number of sums of groups to remember before forgetting them all
+        """
+        self.max_passages = max_passages
+        self.max_sums = max_sums
+        self.passages: Dict[PassageKey, EnactmentPassage] = {}
+        self.sums: Dict[GroupKey, GroupSum] = {}
+        # shared passages and their keys, by the ids of their selections
+        self._by_selection: Dict[int, Tuple[EnactmentPassage, PassageKey]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_selection)
+
+    def clear(self) -> None:
+        """Forget all shared passages and sums."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self.passages.clear()
+        self.sums.clear()
+        self._by_selection.clear()
+
+    def _find(
+        self, passage: EnactmentPassage
+    ) -> Optional[Tuple[EnactmentPassage, PassageKey]]:
+        """Get the shared passage that ``passage`` is a copy of, and its key."""
+        found = self._by_selection.get(id(passage.selection))
+        if found is None:
+            return None
+        shared = found[0]
+        if shared.selection is passage.selection and (
+            shared.enactment is passage.enactment
+        ):
+            return found
+        return None
+
+    def is_shared(self, passage: EnactmentPassage) -> bool:
+        """Check whether a passage still has the selection of a shared passage."""
+        return self._find(passage) is not None
+
+    def key_of(self, passage: EnactmentPassage) -> PassageKey:
+        """Get the key of a passage, which is remembered for shared passages."""
+        found = self._find(passage)
+        if found is None:
+            return passage_key(passage)
+        return found[1]
+
+    def _share(self, passage: EnactmentPassage) -> EnactmentPassage:
+        """Get the shared passage equal to a passage, adding it if needed."""
+        found = self._find(passage)
+        if found is not None:
+            return found[0]
+        key = passage_key(passage)
+        with self._lock:
+            shared = self.passages.get(key)
+            if shared is not None:
+                return shared
+            if len(self.passages) >= self.max_passages:
+                self._clear()
+            # copy the passage, so changes to the original don't affect the store
+            shared = deepcopy(passage)
+            shared_key = key
+            if not shared.selected_text() and shared.enactment.text:
+                shared.select_all()
+                shared_key = passage_key(shared)
+                # unselected passages with the same key get the same shared copy
+                shared = self.passages.get(shared_key, shared)
+            if shared_key not in self.passages:
+                self.passages[shared_key] = shared
+                self._by_selection[id(shared.selection)] = (shared, shared_key)
+            self.passages[key] = shared
+            return shared
+
+    def intern(self, passage: EnactmentPassage) -> EnactmentPassage:
+        r"""
+        Get a copy of the shared passage equal to a passage.
+
+        The copy has the same enactment and selection objects as the
+        shared passage, so making it doesn't copy or select any text. If
+        the passage has no selected text, the copy has all of its
+        text selected, like :meth:`.Rule.select_enactment_text`\.
+
+        :returns:
+            ``passage`` itself, if it's already a copy of a shared passage
+        """
+        if self.is_shared(passage):
+            return passage
+        return self._share(passage).model_copy()
+
+    def intern_group(self, group: EnactmentGroup) -> EnactmentGroup:
+        """Replace each passage of a group with a copy of its shared passage."""
+        group.passages = [self.intern(passage) for passage in group.passages]
+        return group
+
+    def add_groups(
+        self,
+        left: EnactmentGroup,
+        right: Union[
+            EnactmentGroup, Enactment, EnactmentPassage, Sequence[EnactmentPassage]
+        ],
+    ) -> EnactmentGroup:
+        """
+        Add two groups of passages together, reusing the result of any earlier sum.
+
+        :returns:
+            a new group of copies of shared passages, equal to ``left + right``
+        """
+        if not isinstance(right, EnactmentGroup):
+            right = EnactmentGroup(passages=right)
+        left_shared = [self._share(passage) for passage in left.passages]
+        right_shared = [self._share(passage) for passage in right.passages]
+        key = (
+            tuple(id(passage) for passage in left_shared),
+            tuple(id(passage) for passage in right_shared),
+        )
+        found = self.sums.get(key)
+        # the passages are kept with the sum and compared, because an id can be
+        # reused once a passage that was forgotten by the store is freed
+        if (
+            found is not None
+            and _same_passages(found[0], left_shared)
+            and _same_passages(found[1], right_shared)
+        ):
+            passages = found[2]
+        else:
+            total = EnactmentGroup.model_construct(
+                passages=list(left_shared)
+            ) + EnactmentGroup.model_construct(passages=list(right_shared))
+            passages = [self._share(passage) for passage in total.passages]
+            with self._lock:
+                if len(self.sums) >= self.max_sums:
+                    self.sums.clear()
+                self.sums[key] = (left_shared, right_shared, passages)
+        return EnactmentGroup.model_construct(
+            passages=[passage.model_copy() for passage in passages]
+        )
+
+
+passage_store = PassageStore()
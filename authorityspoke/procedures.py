@@ -29,6 +29,8 @@ from nettlesome.formatting import indented
 
 from authorityspoke.facts import Fact, Allegation, Pleading, Exhibit, Evidence
 from authorityspoke.facts import RawFactor
+from authorityspoke.memos import context_fingerprint, operation_memo
+from authorityspoke.memos import procedure_fingerprint
 
 
 RawProcedure = Dict[str, Sequence[RawFactor]]
@@ -141,9 +143,30 @@ class Procedure(Comparable, BaseModel):
         other: Comparable,
         context: Optional[Union[ContextRegister, Explanation]] = None,
     ) -> Optional[Procedure]:
-        """Show how first Procedure triggers the second if not both are universal."""
+        r"""
+        Show how first Procedure triggers the second if not both are universal.
+
+        The result of adding two Procedures is remembered
+        by :data:`~authorityspoke.memos.operation_memo`\.
+        """
         if not isinstance(other, self.__class__):
             return self.with_factor(other)
+        return operation_memo.remember(
+            key=(
+                "add",
+                procedure_fingerprint(self),
+                procedure_fingerprint(other),
+                context_fingerprint(context),
+            ),
+            operation=lambda: self._add_procedure(other, context=context),
+            copy=deepcopy,
+        )
+
+    def _add_procedure(
+        self,
+        other: Procedure,
+        context: Optional[Union[ContextRegister, Explanation]] = None,
+    ) -> Optional[Procedure]:
         for explanation in self.triggers_next_procedure(other, context=context):
             added = self._trigger_addition(other, explanation)
             if added:
@@ -158,6 +181,20 @@ class Procedure(Comparable, BaseModel):
         self, other: Procedure, explanation: Explanation
     ) -> Optional[Procedure]:
         """Show how first Procedure triggers the second if both are universal."""
+        return operation_memo.remember(
+            key=(
+                "add_if_universal",
+                procedure_fingerprint(self),
+                procedure_fingerprint(other),
+                context_fingerprint(explanation),
+            ),
+            operation=lambda: self._add_universal_procedure(other, explanation),
+            copy=deepcopy,
+        )
+
+    def _add_universal_procedure(
+        self, other: Procedure, explanation: Explanation
+    ) -> Optional[Procedure]:
         self_output_or_input = FactorGroup((*self.outputs_group, *self.inputs_group))
         other_input = list(other.inputs)
         implied_inputs = []
@@ -179,7 +216,7 @@ class Procedure(Comparable, BaseModel):
         to_combine = Procedure(
             inputs=not_implied, outputs=other.outputs, despite=other.despite
         )
-        return self.union(to_combine, context=explanation)
+        return self._union_with_procedure(to_combine, explanation)
 
     def _trigger_addition(
         self, other: Procedure, explanation: Explanation
@@ -753,9 +790,30 @@ class Procedure(Comparable, BaseModel):
         other: Comparable,
         context: Optional[Union[ContextRegister, Explanation]] = None,
     ) -> Optional[Comparable]:
-        """Get a procedure with all the inputs and outputs of self and other."""
+        r"""
+        Get a procedure with all the inputs and outputs of self and other.
+
+        The union of two Procedures is remembered
+        by :data:`~authorityspoke.memos.operation_memo`\.
+        """
         if not isinstance(context, Explanation):
             context = Explanation.from_context(context)
+        if isinstance(other, self.__class__):
+            return operation_memo.remember(
+                key=(
+                    "union",
+                    procedure_fingerprint(self),
+                    procedure_fingerprint(other),
+                    context_fingerprint(context),
+                ),
+                operation=lambda: self._union_with_procedure(other, context),
+                copy=deepcopy,
+            )
+        return self._union_with_procedure(other, context)
+
+    def _union_with_procedure(
+        self, other: Comparable, context: Explanation
+    ) -> Optional[Comparable]:
         explanations = self.explanations_union(other, context)
         try:
             explanation = next(explanations)
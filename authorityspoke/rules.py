@@ -11,7 +11,7 @@ from copy import deepcopy
 from typing import Any, ClassVar, Dict, Iterator
 from typing import Optional, Sequence, Tuple, Union
 
-from pydantic import field_validator, BaseModel, ValidationError
+from pydantic import field_validator, BaseModel, PrivateAttr, ValidationError
 from pydantic.class_validators import validator
 
 from legislice.enactments import Enactment, EnactmentPassage
@@ -27,6 +27,9 @@ from nettlesome.terms import (
 )
 from nettlesome.factors import Factor
 from nettlesome.formatting import indented
+from authorityspoke.coverage import EnactmentCoverage
+from authorityspoke.memos import context_fingerprint, operation_memo, rule_fingerprint
+from authorityspoke.passages import passage_store
 from authorityspoke.procedures import Procedure, RawProcedure
 
 RawRule = Dict[str, Union[RawProcedure, Sequence[RawEnactment], str, bool]]
@@ -91,6 +94,9 @@ class Rule(Comparable, BaseModel):
         "enactments",
         "enactments_despite",
     )
+    _enactment_coverage: Dict[str, Tuple[Tuple[Any, ...], EnactmentCoverage]] = (
+        PrivateAttr(default_factory=dict)
+    )
 
     @field_validator("enactments", "enactments_despite", mode="before")
     @classmethod
@@ -114,11 +120,24 @@ class Rule(Comparable, BaseModel):
     @field_validator("enactments", "enactments_despite")
     @classmethod
     def select_enactment_text(cls, v: EnactmentGroup) -> EnactmentGroup:
-        """For Enactments with no text selection, select all text."""
-        for enactment in v:
-            if not enactment.selected_text():
-                enactment.select_all()
-        return v
+        """
+        For Enactments with no text selection, select all text.
+
+        Each passage is replaced by a copy of the shared passage from the
+        :class:`.PassageStore`, so text is only selected once for
+        equal passages.
+        """
+        return passage_store.intern_group(v)
+
+    def _copy(self) -> Rule:
+        """Make a deep copy of ``self`` without copying shared enactment text."""
+        memo = {
+            id(passage): passage.model_copy()
+            for name in self.enactment_attr_names
+            for passage in getattr(self, name)
+            if passage_store.is_shared(passage)
+        }
+        return deepcopy(self, memo)
 
     @property
     def despite(self):
@@ -168,11 +187,13 @@ class Rule(Comparable, BaseModel):
         else:
             new_procedure = self.procedure.add(other.procedure, context=context)
 
-        new_enactments = self.enactments + other.enactments
-        new_despite = self.enactments_despite + other.enactments_despite
+        new_enactments = passage_store.add_groups(self.enactments, other.enactments)
+        new_despite = passage_store.add_groups(
+            self.enactments_despite, other.enactments_despite
+        )
 
         if new_procedure is not None:
-            result = deepcopy(self)
+            result = self._copy()
             result.procedure = new_procedure
             result.universal = min(self.universal, other.universal)
             result.mandatory = min(self.mandatory, other.mandatory)
@@ -226,7 +247,7 @@ class Rule(Comparable, BaseModel):
         self.procedure.valid_for_exclusive_tag()
 
         for input_factor in self.inputs:
-            result = deepcopy(self)
+            result = self._copy()
             next_input = deepcopy(input_factor)
             next_input.absent = not next_input.absent
             next_output = deepcopy(self.outputs[0])
@@ -271,7 +292,7 @@ class Rule(Comparable, BaseModel):
         if not isinstance(incoming, (Enactment, EnactmentPassage)):
             raise TypeError
 
-        new_enactments = self.enactments + incoming
+        new_enactments = passage_store.add_groups(self.enactments, incoming)
         self.set_enactments(new_enactments)
 
     def add_enactment_despite(self, incoming: Enactment) -> None:
@@ -287,7 +308,7 @@ class Rule(Comparable, BaseModel):
         if not isinstance(incoming, (Enactment, EnactmentPassage)):
             raise TypeError
 
-        new_enactments = self.enactments_despite + incoming
+        new_enactments = passage_store.add_groups(self.enactments_despite, incoming)
         self.set_enactments_despite(new_enactments)
 
     def with_enactment(self, incoming: Enactment) -> Rule:
@@ -303,8 +324,8 @@ class Rule(Comparable, BaseModel):
         if not isinstance(incoming, (Enactment, EnactmentPassage)):
             raise TypeError
 
-        new_enactments = self.enactments + incoming
-        result = deepcopy(self)
+        new_enactments = passage_store.add_groups(self.enactments, incoming)
+        result = self._copy()
         result.set_enactments(new_enactments)
         return result
 
@@ -321,8 +342,8 @@ class Rule(Comparable, BaseModel):
         if not isinstance(incoming, (Enactment, EnactmentPassage)):
             raise TypeError
 
-        new_enactments = self.enactments_despite + incoming
-        result = deepcopy(self)
+        new_enactments = passage_store.add_groups(self.enactments_despite, incoming)
+        result = self._copy()
         result.set_enactments_despite(new_enactments)
         return result
 
@@ -349,7 +370,7 @@ class Rule(Comparable, BaseModel):
         new_procedure = self.procedure.with_factor(incoming)
         if new_procedure is None:
             return None
-        result = deepcopy(self)
+        result = self._copy()
         result.procedure = new_procedure
         return result
 
@@ -425,6 +446,39 @@ class Rule(Comparable, BaseModel):
 
         yield from self._explanations_contradiction(other=other, context=context)
 
+    def enactment_coverage(self, name: str) -> EnactmentCoverage:
+        r"""
+        Get a summary of the text selected by one of the Rule's groups of enactments.
+
+        The summary is cached, and made again if the group or the
+        selected text of any of its passages is replaced.
+
+        :param name:
+            ``enactments``, ``enactments_despite``, or ``combined``
+            for both groups added together
+        """
+        if name == "combined":
+            groups = (self.enactments, self.enactments_despite)
+        else:
+            groups = (getattr(self, name),)
+        signature = tuple(
+            part
+            for group in groups
+            for passage in group
+            for part in (passage, passage.selection)
+        ) + groups
+        cached = self._enactment_coverage.get(name)
+        if cached is not None and len(cached[0]) == len(signature):
+            if all(old is new for old, new in zip(cached[0], signature)):
+                return cached[1]
+        if name == "combined":
+            passages = self.enactments + self.enactments_despite
+        else:
+            passages = groups[0]
+        coverage = EnactmentCoverage.from_passages(passages)
+        self._enactment_coverage[name] = (signature, coverage)
+        return coverage
+
     def needs_subset_of_enactments(self, other) -> bool:
         r"""
         Test whether ``self``\'s :class:`.Enactment` support is a subset of ``other``\'s.
@@ -435,17 +489,14 @@ class Rule(Comparable, BaseModel):
         So this method must return ``True`` for ``self`` to imply ``other``.
         """
 
-        if not all(
-            any(other_e >= e for other_e in other.enactments) for e in self.enactments
+        if not other.enactment_coverage("enactments").implies_all(
+            self.enactment_coverage("enactments")
         ):
             return False
 
-        if not all(
-            any(e >= other_d for e in self.enactments + self.enactments_despite)
-            for other_d in other.enactments_despite
-        ):
-            return False
-        return True
+        return self.enactment_coverage("combined").implies_all(
+            other.enactment_coverage("enactments_despite")
+        )
 
     def explanations_implication(
         self, other, context: Optional[ContextRegister] = None
@@ -529,13 +580,12 @@ class Rule(Comparable, BaseModel):
         :returns:
             whether the :meth:`~.Enactment.means` test passes for all :class:`.Enactment`\s
         """
-        for enactment_group in self.enactment_attr_names:
-            if not all(
-                any(other_e.means(self_e) for self_e in self.__dict__[enactment_group])
-                for other_e in other.__dict__[enactment_group]
-            ):
-                return False
-        return True
+        return all(
+            self.enactment_coverage(name).has_all_meanings_of(
+                other.enactment_coverage(name)
+            )
+            for name in self.enactment_attr_names
+        )
 
     def explanations_same_meaning(
         self, other: Optional[Factor], context: Optional[ContextRegister] = None
@@ -568,12 +618,22 @@ class Rule(Comparable, BaseModel):
         )
 
     def _union_with_rule(self, other: Rule, context: ContextRegister) -> Optional[Rule]:
-        new_procedure = self.procedure.union(other.procedure, context=context)
+        # the memoized Procedure.union would copy a result this Rule.union copies
+        explanation = (
+            context
+            if isinstance(context, Explanation)
+            else Explanation.from_context(context)
+        )
+        new_procedure = self.procedure._union_with_procedure(
+            other.procedure, explanation
+        )
         if new_procedure is None:
             return None
 
-        enactments = self.enactments + other.enactments
-        enactments_despite = self.enactments_despite + other.enactments_despite
+        enactments = passage_store.add_groups(self.enactments, other.enactments)
+        enactments_despite = passage_store.add_groups(
+            self.enactments_despite, other.enactments_despite
+        )
 
         if self.procedure.implies_all_to_all(
             other.procedure, context=context
@@ -600,12 +660,26 @@ class Rule(Comparable, BaseModel):
     def union(
         self, other: Optional[Rule], context: Optional[ContextRegister] = None
     ) -> Optional[Rule]:
-        """Get new Rule with all the Factors of self and other."""
+        r"""
+        Get new Rule with all the Factors of self and other.
+
+        The union of two Rules is remembered
+        by :data:`~authorityspoke.memos.operation_memo`\.
+        """
         if other is None:
             return self
         context = context or ContextRegister()
         if isinstance(other, Rule):
-            return self._union_with_rule(other, context=context)
+            return operation_memo.remember(
+                key=(
+                    "rule_union",
+                    rule_fingerprint(self),
+                    rule_fingerprint(other),
+                    context_fingerprint(context),
+                ),
+                operation=lambda: self._union_with_rule(other, context=context),
+                copy=Rule._copy,
+            )
         elif hasattr(other, "union") and hasattr(other, "rule"):
             return other.union(self, context=context.reversed())
         raise TypeError(f"Union operation not possible between Rule and {type(other)}.")
@@ -653,7 +727,9 @@ class Rule(Comparable, BaseModel):
 
         Any prior enactments are replaced.
         """
-        self.enactments = EnactmentGroup(passages=enactments)
+        self.enactments = passage_store.intern_group(
+            EnactmentGroup(passages=enactments)
+        )
 
     def set_enactments_despite(
         self, enactments: Union[Enactment, Sequence[Enactment], EnactmentGroup]
@@ -663,7 +739,9 @@ class Rule(Comparable, BaseModel):
 
         Any prior despite enactments are replaced.
         """
-        self.enactments_despite = EnactmentGroup(passages=enactments)
+        self.enactments_despite = passage_store.intern_group(
+            EnactmentGroup(passages=enactments)
+        )
 
     def __str__(self):
         mandatory = "MUST" if self.mandatory else "MAY"
@@ -0,0 +1,149 @@
+"""
+Benchmark the Legislice and CAP download clients against a local stand-in server.
+
+Run from the root of the repository with AuthoritySpoke installed, so the
+example data can be found::
+
+    python benchmarks/download_clients.py --latency 0.05 --workers 8
+
+With ``--fail-every N``, every Nth request gets a 503 error, and only
+the clients that retry failed requests are benchmarked.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Callable, Sequence
+
+import requests
+
+from authorityspoke import CAPClient, LegisClient
+from authorityspoke.io.downloads import SessionCAPClient
+from authorityspoke.io.fake_server import FakeAPIServer
+
+ENACTMENT_QUERIES = [
+    "/us/const/amendment/IV",
+    "/us/const/amendment/XIV",
+    "/us/usc/t17/s102/a",
+    "/us/usc/t17/s102/b",
+    "/us/usc/t17/s103",
+    "/test/acts/47/1",
+    "/test/acts/47/4",
+    "/test/acts/47/6A",
+    "/test/acts/47/8",
+    "/test/acts/47/11",
+]
+
+
+def time_calls(
+    name: str, function: Callable, queries: Sequence, workers: int, rounds: int
+) -> None:
+    """Print the request rate for calling ``function`` once for each query."""
+    jobs = list(queries) * rounds
+    start = time.perf_counter()
+    if workers <= 1:
+        for query in jobs:
+            function(query)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(function, jobs))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<40} {len(jobs):>5} requests {elapsed:8.3f}s {len(jobs) / elapsed:9.1f}/s"
+    )
+
+
+def run(
+    latency: float,
+    bytes_per_second: float,
+    workers: int,
+    rounds: int,
+    fail_every: int = 0,
+) -> None:
+    """Run each benchmark against a new server."""
+    with FakeAPIServer.from_example_data(
+        latency=latency,
+        bytes_per_second=bytes_per_second or None,
+        fail_every=fail_every or None,
+    ) as server:
+        legis_client = LegisClient(
+            api_root=server.legislice_api_root, update_coverage_from_api=False
+        )
+        case_client = CAPClient(api_token="fake")
+        case_client.endpoint = server.cap_endpoint
+        session_client = SessionCAPClient(
+            api_token="fake",
+            endpoint=server.cap_endpoint,
+            pool_size=workers,
+            backoff_factor=0,
+        )
+        case_ids = sorted(server.cases)
+        cites = [case["citations"][0]["cite"] for case in server.cases.values()]
+
+        for worker_count in sorted({1, workers}):
+            label = f"({worker_count} workers)"
+            if not fail_every:
+                time_calls(
+                    f"LegisClient.fetch {label}",
+                    legis_client.fetch,
+                    ENACTMENT_QUERIES,
+                    worker_count,
+                    rounds,
+                )
+                time_calls(
+                    f"CAPClient.read_id full case {label}",
+                    lambda cap_id: case_client.read_id(cap_id, full_case=True),
+                    case_ids,
+                    worker_count,
+                    rounds,
+                )
+                time_calls(
+                    f"CAPClient.read_cite {label}",
+                    case_client.read_cite,
+                    cites,
+                    worker_count,
+                    rounds,
+                )
+            time_calls(
+                f"SessionCAPClient.read_id full case {label}",
+                lambda cap_id: session_client.read_id(cap_id, full_case=True),
+                case_ids,
+                worker_count,
+                rounds,
+            )
+        session_client.close()
+        print(f"{server.request_count} requests answered by server")
+
+        if not fail_every:
+            urls = [legis_client.url_from_enactment_path(q) for q in ENACTMENT_QUERIES]
+            time_calls(
+                "requests.get, new connection each", requests.get, urls, 1, rounds
+            )
+            with requests.Session() as session:
+                time_calls(
+                    "requests.Session, reused connection", session.get, urls, 1, rounds
+                )
+
+
+def main() -> None:
+    """Parse command line options and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--bytes-per-second", type=float, default=0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--fail-every", type=int, default=0)
+    args = parser.parse_args()
+    run(
+        latency=args.latency,
+        bytes_per_second=args.bytes_per_second,
+        workers=args.workers,
+        rounds=args.rounds,
+        fail_every=args.fail_every,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import pytest
+
+from legislice.download import LegislicePathError
+
+from authorityspoke.io.cached_enactments import CachedClient
+from authorityspoke.io.fake_enactments import FakeClient
+from authorityspoke.io.loaders import read_holdings_from_file
+
+
+class CountingFakeClient(FakeClient):
+    """FakeClient that counts the requests that reach it."""
+
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.queries = []
+
+    def fetch(self, query, date=""):
+        self.queries.append((query, date))
+        return super().fetch(query=query, date=date)
+
+
+class TestCachedClient:
+    def test_second_fetch_uses_cache(self, make_response, tmp_path):
+        fake = CountingFakeClient(make_response)
+        client = CachedClient(fake, path=tmp_path / "cache.db")
+        first = client.fetch("/us/const/amendment/IV")
+        second = client.fetch("us/const/amendment/IV/")
+        assert first == second
+        assert len(fake.queries) == 1
+
+    def test_dates_cached_separately(self, make_response, tmp_path):
+        fake = CountingFakeClient(make_response)
+        client = CachedClient(fake, path=tmp_path / "cache.db")
+        client.fetch("/us/usc/t17/s103", date="2020-01-01")
+        client.fetch("/us/usc/t17/s103")
+        assert client.count() == 2
+
+    def test_cache_shared_between_clients(self, make_response, tmp_path):
+        path = tmp_path / "cache.db"
+        read_holdings_from_file(
+            "holding_feist.yaml",
+            client=CachedClient(CountingFakeClient(make_response), path=path),
+        )
+        fake = CountingFakeClient(make_response)
+        holdings = read_holdings_from_file(
+            "holding_feist.yaml", client=CachedClient(fake, path=path)
+        )
+        assert holdings[0].enactments[0].node == "/us/const/article/I/8/8"
+        assert not fake.queries
+
+    def test_stale_response_fetched_again(self, make_response, tmp_path):
+        fake = CountingFakeClient(make_response)
+        client = CachedClient(fake, path=tmp_path / "cache.db", ttl=0)
+        client.fetch("/us/const/amendment/IV")
+        client.fetch("/us/const/amendment/IV")
+        assert len(fake.queries) == 2
+
+    def test_least_recently_used_evicted(self, make_response, tmp_path):
+        fake = CountingFakeClient(make_response)
+        client = CachedClient(fake, path=tmp_path / "cache.db", max_entries=2)
+        client.fetch("/us/const/amendment/IV")
+        client.fetch("/us/const/amendment/V")
+        client.fetch("/us/const/amendment/IV")
+        client.fetch("/us/const/amendment/XIV")
+        assert client.count() == 2
+        assert client.get_cached("/us/const/amendment/IV")
+        assert client.get_cached("/us/const/amendment/V") is None
+
+    def test_errors_not_cached(self, make_response, tmp_path):
+        client = CachedClient(
+            CountingFakeClient(make_response), path=tmp_path / "cache.db"
+        )
+        with pytest.raises(LegislicePathError):
+            client.fetch("/us/const/amendment/CC")
+        assert client.count() == 0
+
+    def test_read_enactment(self, make_response, tmp_path):
+        client = CachedClient(
+            CountingFakeClient(make_response), path=tmp_path / "cache.db"
+        )
+        enactment = client.read("/us/const/amendment/IV")
+        assert enactment.text.startswith("The right of the people")
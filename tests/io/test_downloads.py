@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from authorityspoke.io import loaders
+from authorityspoke.io.downloads import (
+    RateLimiter,
+    SessionCAPClient,
+    download_cases,
+    filename_for_query,
+)
+from authorityspoke.io.fake_server import FakeAPIServer
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    with FakeAPIServer.from_example_data() as server:
+        yield server
+
+
+@pytest.fixture
+def session_client(fake_server):
+    client = SessionCAPClient(
+        api_token="fake", endpoint=fake_server.cap_endpoint, backoff_factor=0
+    )
+    yield client
+    client.close()
+
+
+class TestSessionClient:
+    def test_read_cite(self, session_client):
+        decision = session_client.read_cite("388 F.2d 853", full_case=True)
+        assert decision.majority.author.startswith("HAMLEY")
+
+    def test_retry_server_error(self):
+        with FakeAPIServer.from_example_data(fail_every=2) as server:
+            client = SessionCAPClient(endpoint=server.cap_endpoint, backoff_factor=0)
+            decisions = [client.read_id(2094128) for _ in range(3)]
+            client.close()
+        assert all(d.id == 2094128 for d in decisions)
+        assert server.request_count == 5
+
+
+class TestDownloadCases:
+    queries = ["388 F.2d 853", 2094128, "750 F.3d 1339"]
+
+    def test_filename_for_query(self):
+        assert filename_for_query("388 F.2d 853") == "388_f_2d_853.json"
+        assert filename_for_query(2094128) == "2094128.json"
+
+    def test_download_cases(self, tmp_path, session_client):
+        report = download_cases(
+            self.queries, directory=tmp_path, client=session_client, full_case=True
+        )
+        assert sorted(report.downloaded) == ["2094128", "388 F.2d 853", "750 F.3d 1339"]
+        decision = loaders.load_decision_as_reading(
+            "388_f_2d_853.json", directory=tmp_path
+        )
+        assert decision.decision.majority.author.startswith("HAMLEY")
+
+    def test_resume_skips_completed(self, tmp_path, session_client, fake_server):
+        download_cases(self.queries[:1], directory=tmp_path, client=session_client)
+        requests_before = fake_server.request_count
+        report = download_cases(self.queries, directory=tmp_path, client=session_client)
+        assert report.skipped == ["388 F.2d 853"]
+        assert fake_server.request_count - requests_before == 2
+
+    def test_failed_query_retried_on_resume(self, tmp_path, session_client):
+        report = download_cases([1], directory=tmp_path, client=session_client)
+        assert "1" in report.failed
+        lines = (tmp_path / ".download_progress.jsonl").read_text().splitlines()
+        assert json.loads(lines[-1])["status"] == "failed"
+        report = download_cases([1], directory=tmp_path, client=session_client)
+        assert not report.skipped
+
+    def test_unexpected_error_recorded_as_failure(self, tmp_path, fake_server):
+        class BrokenClient(SessionCAPClient):
+            def read(self, query, full_case=False):
+                if query == "2094128":
+                    raise KeyError("results")
+                return super().read(query, full_case=full_case)
+
+        client = BrokenClient(endpoint=fake_server.cap_endpoint, backoff_factor=0)
+        report = download_cases(
+            self.queries, directory=tmp_path, client=client, max_workers=2
+        )
+        client.close()
+        assert sorted(report.downloaded) == ["388 F.2d 853", "750 F.3d 1339"]
+        assert "KeyError" in report.failed["2094128"]
+        lines = (tmp_path / ".download_progress.jsonl").read_text().splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert len(entries) == 3
+        assert {
+            "query": "2094128",
+            "status": "failed",
+            "error": "KeyError: 'results'",
+        } in entries
+
+    def test_ignore_partial_progress_line(self, tmp_path, session_client):
+        progress_file = tmp_path / "progress.jsonl"
+        progress_file.write_text('{"query": "2094128", "status": "done"}\n{"query')
+        report = download_cases(
+            self.queries,
+            directory=tmp_path,
+            client=session_client,
+            progress_file=progress_file,
+        )
+        assert report.skipped == ["2094128"]
+        assert len(report.downloaded) == 2
+        report = download_cases(
+            self.queries,
+            directory=tmp_path,
+            client=session_client,
+            progress_file=progress_file,
+        )
+        assert len(report.skipped) == 3
+
+
+class TestRateLimiter:
+    def test_spacing(self):
+        limiter = RateLimiter(per_second=100)
+        for _ in range(3):
+            limiter.wait()
+        assert limiter.next_time > 0
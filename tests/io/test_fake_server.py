@@ -0,0 +1,94 @@
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from justopinion.download import CaseAccessProjectAPIError
+
+from authorityspoke import CAPClient, LegisClient
+from authorityspoke.io.fake_server import FakeAPIServer
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    with FakeAPIServer.from_example_data() as server:
+        yield server
+
+
+@pytest.fixture
+def case_client(fake_server):
+    client = CAPClient()
+    client.endpoint = fake_server.cap_endpoint
+    return client
+
+
+class TestFakeLegisliceAPI:
+    def test_fetch_enactment_at_date(self, fake_server, fake_beard_client):
+        client = LegisClient(api_root=fake_server.legislice_api_root)
+        fetched = client.fetch("/test/acts/47/8", date="2000-01-01")
+        assert fetched == fake_beard_client.fetch("/test/acts/47/8", date="2000-01-01")
+
+    def test_read_enactment_with_coverage(self, fake_server):
+        client = LegisClient(api_root=fake_server.legislice_api_root)
+        enactment = client.read("/us/usc/t17/s103")
+        assert enactment.node == "/us/usc/t17/s103"
+        assert client.coverage["/us/usc"]["latest_heading"] == (
+            "United States Code (USC)"
+        )
+
+    def test_missing_enactment(self, fake_server):
+        response = requests.get(fake_server.legislice_api_root + "/us/usc/t99/")
+        assert response.status_code == 404
+
+
+class TestFakeCAPAPI:
+    def test_read_cite(self, case_client):
+        decision = case_client.read_cite("388 F.2d 853")
+        assert decision.name_abbreviation == "Wattenburg v. United States"
+        assert decision.casebody is None
+
+    def test_read_id(self, case_client):
+        decision = case_client.read_id(2094128)
+        assert decision.citations[0].cite == "388 F.2d 853"
+
+    def test_full_case(self, case_client):
+        case_client.api_token = "fake"
+        decision = case_client.read_cite("388 F.2d 853", full_case=True)
+        assert decision.majority.text.startswith("HAMLEY")
+
+    def test_missing_id(self, case_client):
+        with pytest.raises(CaseAccessProjectAPIError):
+            case_client.fetch_id(1)
+
+
+class TestServerLimits:
+    def test_fail_every(self):
+        with FakeAPIServer.from_example_data(fail_every=2) as server:
+            url = server.cap_endpoint + "2094128/"
+            statuses = [requests.get(url).status_code for _ in range(4)]
+        assert statuses == [200, 503, 200, 503]
+
+    def test_retrying_session_recovers_from_failures(self):
+        retry = Retry(total=2, backoff_factor=0, status_forcelist=(503,))
+        with FakeAPIServer.from_example_data(fail_every=2) as server:
+            with requests.Session() as session:
+                session.mount("http://", HTTPAdapter(max_retries=retry))
+                url = server.cap_endpoint + "2094128/"
+                statuses = [session.get(url).status_code for _ in range(3)]
+        assert statuses == [200, 200, 200]
+        assert server.request_count == 5
+
+    def test_bytes_per_second(self):
+        rate = 100_000
+        with FakeAPIServer.from_example_data(bytes_per_second=rate) as server:
+            start = time.perf_counter()
+            response = requests.get(
+                server.cap_endpoint + "2094128/", params={"full_case": "true"}
+            )
+            elapsed = time.perf_counter() - start
+        size = len(response.content)
+        assert size > rate / 10
+        assert elapsed >= size / rate
+        assert server.request_count == 1
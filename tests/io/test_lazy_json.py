@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from authorityspoke.io.lazy_json import (
+    JSONIndexError,
+    LazyNestedObject,
+    decode_span,
+    index_array,
+    index_object,
+)
+
+
+class TestIndexJSON:
+    document = json.dumps(
+        {
+            "a": {"text": 'quoted "}" brace', "children": [1, 2.5, None]},
+            "b": [True, {"c": "\\"}],
+            "d": -3,
+        },
+        indent=2,
+    ).encode()
+
+    def test_index_object(self):
+        spans = index_object(self.document, 0)
+        assert list(spans) == ["a", "b", "d"]
+        assert decode_span(self.document, spans["a"])["text"] == 'quoted "}" brace'
+        assert decode_span(self.document, spans["d"]) == -3
+
+    def test_index_array(self):
+        spans = index_object(self.document, 0)
+        start, _ = spans["b"]
+        items = index_array(self.document, start)
+        assert [decode_span(self.document, item) for item in items] == [
+            True,
+            {"c": "\\"},
+        ]
+
+    def test_unterminated_object(self):
+        with pytest.raises(JSONIndexError):
+            index_object(b'{"a": [1, 2}', 0)
+
+    def test_lazy_nested_object(self, tmp_path):
+        path = tmp_path / "responses.json"
+        path.write_bytes(self.document)
+        lazy = LazyNestedObject.from_file(path)
+        assert lazy["a"]["children"] == [1, 2.5, None]
+        assert lazy["a"]["children"] is lazy["a"]["children"]
+        assert "text" not in lazy["a"].decoded
+        lazy.close()
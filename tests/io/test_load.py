@@ -1,16 +1,20 @@
 import os
+import threading
+import time
 
 import pytest
 
 from authorityspoke import LegisClient
 from authorityspoke.opinions import AnchoredHoldings
 from authorityspoke.decisions import DecisionReading
-from authorityspoke.io import filepaths, loaders, readers
+from authorityspoke.io import filepaths, loaders, readers, writers
 from authorityspoke.io.fake_enactments import FakeClient
 from authorityspoke.io.loaders import (
     read_holdings_from_file,
     read_anchored_holdings_from_file,
+    read_anchored_holdings_from_files,
 )
+from authorityspoke.io.name_index import Mentioned
 
 LEGISLICE_API_TOKEN = os.getenv("LEGISLICE_API_TOKEN")
 
@@ -102,3 +106,149 @@ class TestLoadAndRead:
         key = str(anchored.holdings[1].holding.enactments_despite[0])
         quotes = anchored.get_enactment_anchors(key).quotes
         assert "domestic financial" in quotes[0].exact
+
+
+class SlowFakeClient(FakeClient):
+    """FakeClient that imitates network latency and counts its requests."""
+
+    latency = 0.05
+
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.queries = []
+        self.threads = set()
+
+    def fetch(self, query, date=""):
+        self.queries.append((query, date))
+        self.threads.add(threading.get_ident())
+        time.sleep(self.latency)
+        return super().fetch(query=query, date=date)
+
+
+class TestConcurrentEnactmentLoading:
+    def test_deduplicate_enactments_across_files(self, make_response):
+        client = SlowFakeClient(make_response)
+        results = read_anchored_holdings_from_files(
+            filenames=["holding_mazza_alaluf.yaml", "holding_mazza_alaluf.yaml"],
+            client=client,
+        )
+        assert len(results) == 2
+        assert len(results[1].holdings) == 2
+        assert len(client.queries) == len(set(client.queries)) == 2
+
+    def test_concurrent_fetch_same_as_sequential(self, make_response):
+        filenames = ["holding_feist.yaml", "holding_oracle.yaml"]
+        sequential_client = SlowFakeClient(make_response)
+        expected = read_anchored_holdings_from_files(
+            filenames=filenames, client=sequential_client, max_workers=1
+        )
+
+        concurrent_client = SlowFakeClient(make_response)
+        results = read_anchored_holdings_from_files(
+            filenames=filenames, client=concurrent_client, max_workers=8
+        )
+
+        assert sorted(sequential_client.queries) == sorted(concurrent_client.queries)
+        assert len(concurrent_client.queries) > 2
+        assert len(concurrent_client.queries) == len(set(concurrent_client.queries))
+        for result, expected_result in zip(results, expected):
+            assert [anchored.holding for anchored in result.holdings] == [
+                anchored.holding for anchored in expected_result.holdings
+            ]
+        assert results[0].holdings[0].holding.enactments[0].node.startswith("/us/")
+
+    def test_read_holdings_uses_max_workers(self, make_response):
+        record = loaders.load_holdings("holding_oracle.yaml")
+        sequential_client = SlowFakeClient(make_response)
+        expected = readers.read_holdings(record, client=sequential_client)
+
+        record = loaders.load_holdings("holding_oracle.yaml")
+        concurrent_client = SlowFakeClient(make_response)
+        holdings = readers.read_holdings(
+            record, client=concurrent_client, max_workers=8
+        )
+
+        assert holdings == expected
+        assert len(sequential_client.threads) == 1
+        assert len(concurrent_client.threads) > 1
+
+    def test_update_enactment_indexes_in_place(self, make_response):
+        client = SlowFakeClient(make_response)
+        index = Mentioned(
+            {
+                "search clause": {"enactment": {"node": "/us/const/amendment/IV"}},
+                "also search clause": {"enactment": {"node": "us/const/amendment/IV/"}},
+            }
+        )
+        readers.update_enactment_indexes([index], client=client)
+        assert len(client.queries) == 1
+        assert index["also search clause"]["enactment"]["start_date"] == "1791-12-15"
+
+
+class TestCompressedFiles:
+    @pytest.mark.parametrize("suffix", [".gz", ".xz"])
+    def test_round_trip_compressed_decision(self, tmp_path, suffix):
+        reading = loaders.load_decision_as_reading("watt_h.json")
+        filepath = tmp_path / f"watt_h.json{suffix}"
+        writers.case_to_file(reading.decision, filepath=filepath, indent=None)
+        loaded = loaders.load_decision_as_reading(filepath=filepath)
+        assert loaded.decision == reading.decision
+        plain_size = len(reading.decision.model_dump_json(indent=None))
+        assert filepath.stat().st_size < plain_size / 2
+
+    def test_compact_mode_has_no_line_breaks(self, tmp_path):
+        reading = loaders.load_decision_as_reading("watt_h.json")
+        writers.case_to_file(reading.decision, filename="watt.json", directory=tmp_path)
+        writers.case_to_file(
+            reading.decision, filename="compact.json", directory=tmp_path, indent=None
+        )
+        compact = (tmp_path / "compact.json").read_text()
+        assert "\n" not in compact
+        assert len(compact) < len((tmp_path / "watt.json").read_text())
+
+    def test_load_compressed_yaml_holdings(self, tmp_path):
+        source = filepaths.make_filepath("holding_watt.yaml")
+        filepath = tmp_path / "holding_watt.yaml.gz"
+        with filepaths.open_text(filepath, "w") as f:
+            f.write(source.read_text())
+        assert filepaths.data_suffix(filepath) == ".yaml"
+        assert loaders.load_holdings(filepath=filepath) == loaders.load_holdings(
+            filepath=source
+        )
+
+
+class TestLazyOpinionText:
+    def test_text_not_loaded_until_selected(self):
+        eager = loaders.load_decision_as_reading("watt_h.json")
+        lazy = loaders.load_decision_as_reading("watt_h.json", lazy_text=True)
+        assert lazy.decision.majority.text == ""
+        assert lazy.decision.majority.author == eager.decision.majority.author
+        selector = "neither count of the indictment states an offense"
+        assert str(lazy.select_text(selector)) == str(eager.select_text(selector))
+        assert lazy.decision.majority.text == eager.decision.majority.text
+
+    def test_locate_text_loads_opinion(self):
+        lazy = loaders.load_decision_as_reading("oracle_h.json", lazy_text=True)
+        positions = lazy.locate_text("copyrightable")
+        assert positions.positions
+        assert lazy.opinions[0].text
+
+    def test_load_all_texts_for_saving(self, tmp_path):
+        eager = loaders.load_decision_as_reading("brad_h.json")
+        lazy = loaders.load_decision_as_reading("brad_h.json", lazy_text=True)
+        lazy.load_opinion_texts()
+        assert lazy.decision == eager.decision
+
+    def test_serializing_reading_loads_texts(self):
+        eager = loaders.load_decision_as_reading("brad_h.json")
+        lazy = loaders.load_decision_as_reading("brad_h.json", lazy_text=True)
+        dumped = lazy.model_dump()
+        assert dumped["decision"] == eager.decision.model_dump()
+        assert lazy.decision.majority.text == eager.decision.majority.text
+
+    def test_no_lazy_text_for_compressed_file(self, tmp_path):
+        filepath = tmp_path / "watt_h.json.gz"
+        reading = loaders.load_decision_as_reading("watt_h.json")
+        writers.case_to_file(reading.decision, filepath=filepath)
+        with pytest.raises(ValueError):
+            loaders.load_decision_as_reading(filepath=filepath, lazy_text=True)
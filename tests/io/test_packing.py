@@ -0,0 +1,35 @@
+import pickle
+
+from authorityspoke.io import loaders
+from authorityspoke.io.packing import pack, unpack
+
+
+class TestPacking:
+    def test_round_trip_anchored_holdings(self, make_anchored_holding):
+        batch = list(make_anchored_holding.values())
+        assert unpack(pack(batch)) == batch
+
+    def test_packed_smaller_than_pickle(self, make_anchored_holding):
+        batch = [anchored.holdings for anchored in make_anchored_holding.values()]
+        assert len(pack(batch)) < len(pickle.dumps(batch)) * 0.75
+
+    def test_equal_terms_copied_after_unpacking(self, fake_usc_client):
+        first = loaders.read_holdings_from_file(
+            "holding_feist.yaml", client=fake_usc_client
+        )
+        second = loaders.read_holdings_from_file(
+            "holding_feist.yaml", client=fake_usc_client
+        )
+        packed = pack([first, second])
+        assert len(packed) < len(pack([first])) * 1.5
+        restored_first, restored_second = unpack(packed)
+        assert restored_first == first
+        assert restored_second == second
+        restored_term = restored_second[0].inputs[0]
+        assert restored_term is not restored_first[0].inputs[0]
+        restored_term.terms[0].name = "a changed name"
+        assert restored_first[0].inputs[0] == first[0].inputs[0]
+
+    def test_different_values_not_merged(self, make_holding):
+        batch = [make_holding["h1"], make_holding["h2"], make_holding["h3"]]
+        assert unpack(pack(batch)) == batch
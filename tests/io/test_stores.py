@@ -0,0 +1,108 @@
+import datetime
+
+import pytest
+
+from authorityspoke.io import loaders
+from authorityspoke.io.stores import CorpusStore, find_enactment_nodes
+
+HOLDINGS_FOR = {
+    "watt_h.json": "holding_watt.yaml",
+    "brad_h.json": "holding_brad.yaml",
+    "oracle_h.json": "holding_oracle.yaml",
+}
+
+
+@pytest.fixture(scope="class")
+def example_store(tmp_path_factory):
+    store = CorpusStore(tmp_path_factory.mktemp("corpus"))
+    store.add_files(holdings_for=HOLDINGS_FOR)
+    return store
+
+
+class TestCorpusStore:
+    def test_files_sharded(self, example_store):
+        entry = example_store.get_entry(2094128)
+        shard = CorpusStore.shard_for(2094128)
+        assert entry.decision_path == f"decisions/{shard}/2094128.json"
+        assert (example_store.root / entry.decision_path).exists()
+        assert len(example_store) == 6
+
+    def test_find_by_citation(self, example_store):
+        assert example_store.find_id("388 f.2d  853") == 2094128
+        assert [e.id for e in example_store.select(cite="388 F.2d 853")] == [2094128]
+
+    def test_select_by_date_and_holdings(self, example_store):
+        entries = example_store.select(decided_after="1969-01-01", min_holdings=1)
+        assert [e.name for e in entries] == [
+            "People v. Bradley",
+            "Oracle America, Inc. v. Google Inc.",
+        ]
+        assert all(e.decision_date >= datetime.date(1969, 1, 1) for e in entries)
+
+    def test_select_by_cited_enactment(self, example_store):
+        oracle = example_store.find_id("750 F.3d 1339")
+        entries = example_store.select(enactment="/us/usc/t17")
+        assert oracle in [e.id for e in entries]
+        assert not example_store.select(enactment="/us/usc/t1")
+
+    def test_select_by_court(self, example_store):
+        court = example_store.get_entry(2094128).court
+        entries = example_store.select(court=court)
+        assert 2094128 in [e.id for e in entries]
+
+    def test_read_with_holdings(self, example_store, fake_usc_client):
+        reading = example_store.read("750 F.3d 1339", client=fake_usc_client)
+        expected = loaders.read_anchored_holdings_from_file(
+            "holding_oracle.yaml", client=fake_usc_client
+        )
+        assert len(reading.holdings) == len(expected.holdings)
+
+    def test_iter_readings_without_holdings(self, example_store):
+        readings = list(
+            example_store.iter_readings(with_holdings=False, lazy_text=True)
+        )
+        assert len(readings) == 6
+        assert not readings[0].opinion_readings
+
+    def test_verify_detects_changed_file(self, tmp_path):
+        store = CorpusStore(tmp_path, compress=True)
+        entry = store.add(loaders.load_decision("watt_h.json"))
+        assert entry.decision_path.endswith(".json.gz")
+        assert store.verify(entry)
+        (tmp_path / entry.decision_path).write_bytes(b"")
+        assert not store.verify(entry)
+
+    def test_replace_with_compressed_file(self, tmp_path):
+        CorpusStore(tmp_path).add(loaders.load_decision("watt_h.json"))
+        store = CorpusStore(tmp_path, compress=True)
+        entry = store.add(loaders.load_decision("watt_h.json"))
+        assert len(list(tmp_path.glob("decisions/*/*"))) == 1
+        reading = store.read(entry.id, lazy_text=True)
+        assert reading.decision.majority.text
+
+    def test_add_lazy_reading_keeps_text(self, tmp_path):
+        store = CorpusStore(tmp_path)
+        entry = store.add(loaders.load_decision("brad_h.json"))
+        lazy = store.read_entry(entry, lazy_text=True)
+        store.add(lazy)
+        reading = store.read_entry(store.get_entry(entry.id))
+        expected = loaders.load_decision_as_reading("brad_h.json")
+        assert [opinion.text for opinion in reading.opinions] == [
+            opinion.text for opinion in expected.opinions
+        ]
+        assert all(opinion.text for opinion in reading.opinions)
+
+    def test_remove(self, tmp_path):
+        store = CorpusStore(tmp_path)
+        entry = store.add(loaders.load_decision("watt_h.json"))
+        store.remove(entry.id)
+        assert entry.id not in store
+        assert not (tmp_path / entry.decision_path).exists()
+
+
+def test_find_enactment_nodes():
+    records = loaders.load_holdings("holding_mazza_alaluf.yaml")
+    assert find_enactment_nodes(records) == {
+        "/us/usc/t18/s1960/b/1",
+        "/us/usc/t31/s5312/b/1",
+    }
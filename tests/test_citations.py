@@ -0,0 +1,86 @@
+import pytest
+
+from authorityspoke.citations import CitationGraph, extract_cites, normalize_cite
+from authorityspoke.io import loaders
+
+BRAD_ID = 1183311
+WATT_ID = 2094128
+FEIST_ID = 11318883
+LOTUS_ID = 7416609
+ORACLE_ID = 4066790
+
+
+@pytest.fixture(scope="class")
+def graph(make_decision):
+    return CitationGraph.from_decisions(make_decision.values(), max_workers=1)
+
+
+class TestExtractCites:
+    def test_extract_full_case_citations(self):
+        text = "See Feist Publications, 499 U.S. 340, 345 (1991); 499 U.S. at 348."
+        assert extract_cites(text) == ["499u.s.340"]
+
+    def test_normalize_cite(self):
+        assert normalize_cite("49 F.3d  807") == normalize_cite("49 f.3d 807")
+
+
+class TestCitationGraph:
+    def test_decisions_in_graph(self, graph, make_decision):
+        assert len(graph) == len(make_decision)
+        assert ORACLE_ID in graph
+
+    def test_oracle_cites_lotus_and_feist(self, graph):
+        assert graph.cites[ORACLE_ID] == {LOTUS_ID, FEIST_ID}
+        assert ORACLE_ID in graph.cited_by[FEIST_ID]
+
+    def test_bradley_cites_wattenburg(self, graph):
+        assert (BRAD_ID, WATT_ID) in graph.edges
+
+    def test_citations_outside_graph_unresolved(self, graph):
+        assert "499u.s.340" not in graph.unresolved[ORACLE_ID]
+        assert "975f.2d832" in graph.unresolved[ORACLE_ID]
+
+    def test_within_hops(self, graph):
+        assert graph.within(LOTUS_ID, hops=1) == {ORACLE_ID: 1, FEIST_ID: 1}
+        assert graph.connected(WATT_ID, BRAD_ID)
+        assert not graph.connected(WATT_ID, ORACLE_ID, hops=3)
+
+    def test_pairs_within_hops(self, graph):
+        pairs = set(graph.pairs_within(hops=1))
+        assert (BRAD_ID, WATT_ID) in pairs
+        assert (ORACLE_ID, LOTUS_ID) in pairs
+        assert not any(WATT_ID in pair and ORACLE_ID in pair for pair in pairs)
+
+    def test_pairs_limited_to_decision_ids(self, graph):
+        pairs = list(graph.pairs_within(hops=2, decision_ids=[LOTUS_ID, FEIST_ID]))
+        assert pairs == [(LOTUS_ID, FEIST_ID)]
+
+    def test_add_cited_decision_later(self, make_decision):
+        graph = CitationGraph()
+        graph.add_decision(make_decision["brad"])
+        assert not graph.cites[BRAD_ID]
+        graph.add_decision(make_decision["watt"])
+        assert graph.cites[BRAD_ID] == {WATT_ID}
+
+    def test_add_one_at_a_time_same_as_all_at_once(self, make_decision, graph):
+        one_at_a_time = CitationGraph()
+        for decision in reversed(list(make_decision.values())):
+            one_at_a_time.add_decision(decision)
+        assert sorted(one_at_a_time.edges) == sorted(graph.edges)
+        assert one_at_a_time.unresolved == graph.unresolved
+
+    def test_lazy_text_not_kept(self):
+        readings = [
+            loaders.load_decision_as_reading(filename, lazy_text=True)
+            for filename in ("brad_h.json", "watt_h.json")
+        ]
+        graph = CitationGraph.from_decisions(readings, max_workers=1)
+        assert graph.cites[BRAD_ID] == {WATT_ID}
+        assert all(
+            opinion.text == "" for reading in readings for opinion in reading.opinions
+        )
+
+    def test_extract_in_worker_processes(self, make_decision, graph):
+        decisions = [make_decision[name] for name in ("oracle", "lotus", "feist")]
+        parallel = CitationGraph.from_decisions(decisions, max_workers=2)
+        assert parallel.cites[ORACLE_ID] == graph.cites[ORACLE_ID]
@@ -98,3 +98,60 @@ class TestCodes:
         enactment = client.read("/us/const/amendment/IV")
         with pytest.raises(TextSelectionError):
             _ = enactment.convert_selection_to_set(make_selector["bad_selector"])
+
+
+class TestFakeClientIndex:
+    def test_closest_entry_respects_segments(self, fake_beard_client):
+        """The entry for section 1 doesn't contain section 10."""
+        entry = fake_beard_client.get_entry_closest_to_cited_path("/test/acts/47/10")
+        assert entry["1935-04-01"]["node"] == "/test/acts/47/10"
+
+    def test_fetch_nested_node(self, fake_beard_client):
+        result = fake_beard_client.fetch("/test/acts/47/6D/1")
+        assert result["node"] == "/test/acts/47/6D/1"
+
+    def test_fetch_latest_version_before_date(self, fake_beard_client):
+        early = fake_beard_client.fetch("/test/acts/47/8", date="2000-01-01")
+        late = fake_beard_client.fetch(
+            "/test/acts/47/8", date=datetime.date(2015, 1, 1)
+        )
+        latest = fake_beard_client.fetch("/test/acts/47/8")
+        assert early is fake_beard_client.responses["/test/acts/47/8"]["1935-04-01"]
+        assert late is latest
+        assert late is fake_beard_client.responses["/test/acts/47/8"]["2013-07-18"]
+
+    def test_no_version_before_date(self, fake_beard_client):
+        with pytest.raises(ValueError):
+            fake_beard_client.fetch("/test/acts/47/9", date="1990-01-01")
+
+    def test_path_outside_index(self, fake_beard_client):
+        with pytest.raises(LegislicePathError):
+            fake_beard_client.fetch("/test/acts/48/1")
+
+
+class TestLazyFakeClient:
+    def test_lazy_fetch_matches_eager(self, fake_usc_client):
+        with FakeClient.from_file("usc.json", lazy=True) as lazy_client:
+            for query in ("/us/const/amendment/IV", "/us/usc/t17/s102/b"):
+                assert lazy_client.fetch(query) == fake_usc_client.fetch(query)
+
+    def test_only_fetched_versions_decoded(self):
+        with FakeClient.from_file("beard_act.json", lazy=True) as lazy_client:
+            assert not lazy_client.responses.decoded
+            lazy_client.fetch("/test/acts/47/8", date="2000-01-01")
+            assert list(lazy_client.responses.decoded) == ["/test/acts/47/8"]
+            assert list(
+                lazy_client.responses.decoded["/test/acts/47/8"].decoded
+            ) == ["1935-04-01"]
+
+    def test_lazy_errors_match_eager(self):
+        with FakeClient.from_file("beard_act.json", lazy=True) as lazy_client:
+            with pytest.raises(ValueError):
+                lazy_client.fetch("/test/acts/47/9", date="1990-01-01")
+            with pytest.raises(LegislicePathError):
+                lazy_client.fetch("/test/acts/48/1")
+
+    def test_close_memory_mapped_file(self):
+        lazy_client = FakeClient.from_file("beard_act.json", lazy=True)
+        lazy_client.close()
+        assert lazy_client.responses.buffer.closed
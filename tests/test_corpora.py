@@ -0,0 +1,165 @@
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import itertools
+
+import pytest
+
+from authorityspoke.corpora import Corpus
+from authorityspoke.decisions import DecisionReading
+from authorityspoke.indexes import output_templates
+
+
+@pytest.fixture(scope="class")
+def corpus(make_decision_with_holding):
+    return Corpus(make_decision_with_holding.values())
+
+
+class TestCorpus:
+    def test_holdings_from_each_reading(self, corpus, make_decision_with_holding):
+        assert len(corpus) == len(make_decision_with_holding)
+        assert len(corpus.holdings) == sum(
+            len(reading.holdings) for reading in make_decision_with_holding.values()
+        )
+
+    def test_output_templates_of_holding(self, make_holding):
+        assert output_templates(make_holding["h1"]) == frozenset(["{} was {}’s abode"])
+
+    def test_candidates_exclude_unrelated_holdings(self, corpus):
+        for item in corpus.holdings:
+            if output_templates(item.holding) is not None:
+                assert len(corpus.candidates(item.holding)) < len(corpus.holdings)
+
+    def test_find_contradicting(self, corpus, make_decision_with_holding):
+        oracle = make_decision_with_holding["oracle"]
+        lotus = make_decision_with_holding["lotus"]
+        found = []
+        for holding in oracle.holdings:
+            found.extend(corpus.find_contradicting(holding))
+        assert any(item.reading is lotus for item in found)
+        assert all(
+            any(item.holding.contradicts(holding) for holding in oracle.holdings)
+            for item in found
+        )
+
+    def test_find_implying_and_implied_by(self, corpus, make_decision_with_holding):
+        holding = make_decision_with_holding["oracle"].holdings[0]
+        implying = corpus.find_implying(holding)
+        implied = corpus.find_implied_by(holding)
+        assert any(item.holding is holding for item in implying)
+        assert any(item.holding is holding for item in implied)
+        assert all(item.holding.implies(holding) for item in implying)
+        assert all(holding.implies(item.holding) for item in implied)
+
+    def test_find_with_executor(self, corpus, make_decision_with_holding):
+        holding = make_decision_with_holding["oracle"].holdings[0]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            found = corpus.find_contradicting(holding, executor=executor)
+        assert found == corpus.find_contradicting(holding)
+
+    def test_find_with_rule(self, corpus, make_decision_with_holding):
+        holding = make_decision_with_holding["oracle"].holdings[0]
+        assert corpus.find_implied_by(holding.rule)
+
+    def test_filter_by_date(self, corpus, make_decision_with_holding):
+        holding = make_decision_with_holding["oracle"].holdings[0]
+        assert not corpus.find_implying(holding, end=datetime.date(1900, 1, 1))
+        oracle_date = make_decision_with_holding["oracle"].decision.decision_date
+        found = corpus.find_implying(holding, start=oracle_date, end=oracle_date)
+        assert all(item.reading.decision.decision_date == oracle_date for item in found)
+        assert found
+
+    def test_find_readings_by_court(self, corpus, make_decision_with_holding):
+        oracle = make_decision_with_holding["oracle"]
+        court = oracle.decision.court
+        readings = corpus.find_readings(court=court.slug)
+        assert oracle in readings
+        assert readings == corpus.find_readings(court=court.name)
+        assert all(reading.decision.court == court for reading in readings)
+
+    def test_find_citing_enactment(self, corpus):
+        found = corpus.find_citing("/us/usc/t17/s102")
+        assert found
+        assert all(
+            any(
+                passage.node.startswith("/us/usc/t17/s102")
+                for passage in item.holding.enactments + item.holding.enactments_despite
+            )
+            for item in found
+        )
+
+
+class TestRelations:
+    def test_relations_same_as_all_pairs(self, make_decision_with_holding):
+        corpus = Corpus(make_decision_with_holding.values(), track_relations=True)
+        holdings = [item.holding for item in corpus.holdings]
+        implications = {
+            (left, right)
+            for left, right in itertools.permutations(range(len(holdings)), 2)
+            if holdings[left].implies(holdings[right])
+        }
+        contradictions = {
+            (left, right)
+            for left, right in itertools.combinations(range(len(holdings)), 2)
+            if holdings[right].contradicts(holdings[left])
+        }
+        position = {id(item): number for number, item in enumerate(corpus.holdings)}
+
+        def numbered(pairs):
+            return {(position[id(left)], position[id(right)]) for left, right in pairs}
+
+        assert numbered(corpus.relations("implies")) == implications
+        assert numbered(corpus.relations("contradicts")) == contradictions
+        assert contradictions
+
+    def test_no_relations_unless_tracked(self, make_decision_with_holding):
+        corpus = Corpus(make_decision_with_holding.values())
+        assert not corpus.relations("implies")
+
+    def test_posit_holding_announces_relations(
+        self, make_decision_with_holding, make_decision
+    ):
+        oracle = make_decision_with_holding["oracle"]
+        corpus = Corpus([oracle], track_relations=True)
+        changes = []
+        corpus.subscribe(changes.append)
+        new_reading = DecisionReading(decision=make_decision["lotus"])
+        corpus.add(new_reading)
+        assert not changes
+        returned = corpus.posit(new_reading, oracle.holdings[0].negated())
+        assert returned == changes
+        assert all(change.added for change in changes)
+        assert any(
+            change.relation == "contradicts"
+            and change.left.holding is oracle.holdings[0]
+            and change.right.reading is new_reading
+            for change in changes
+        )
+
+    def test_posit_duplicate_holding_not_indexed_again(
+        self, make_decision_with_holding
+    ):
+        oracle = make_decision_with_holding["oracle"]
+        corpus = Corpus([oracle], track_relations=True)
+        count = len(corpus.holdings)
+        assert not corpus.posit(oracle, oracle.holdings[0])
+        assert len(corpus.holdings) == count
+
+    def test_remove_holding(self, make_decision_with_holding):
+        oracle = make_decision_with_holding["oracle"]
+        corpus = Corpus([oracle], track_relations=True)
+        holding = corpus.relations("implies")[0][0].holding
+        implications = len(corpus.relations("implies"))
+        changes = []
+        corpus.subscribe(changes.append)
+        returned = corpus.remove_holding(holding)
+        assert returned == changes
+        assert changes and not any(change.added for change in changes)
+        assert len(corpus.relations("implies")) == implications - len(changes)
+        assert all(item.holding is not holding for item in corpus.holdings)
+        assert all(
+            item.holding is not holding for item in corpus.find_implied_by(holding)
+        )
+        assert all(
+            item.holding is not holding
+            for item in corpus.find_citing("/us/usc/t17/s102")
+        )
@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+
+import pytest
+
+from legislice.enactments import Enactment
+
+from authorityspoke.coverage import EnactmentCoverage, InternTable, PassageSummary
+from authorityspoke.coverage import clear_caches
+from authorityspoke.rules import Rule
+
+
+@pytest.fixture(scope="module")
+def example_passages(
+    e_search_clause,
+    e_warrants_clause,
+    e_fourth_a,
+    e_due_process_5,
+    e_due_process_14,
+    e_securing_for_authors,
+    e_securing_exclusive_right_to_writings,
+    e_right_to_writings,
+    e_copyright_requires_originality,
+    e_copyright,
+    e_copyright_exceptions,
+):
+    return [
+        e_search_clause,
+        e_warrants_clause,
+        e_fourth_a,
+        e_due_process_5,
+        e_due_process_14,
+        e_securing_for_authors,
+        e_securing_exclusive_right_to_writings,
+        e_right_to_writings,
+        e_copyright_requires_originality,
+        e_copyright,
+        e_copyright_exceptions,
+    ]
+
+
+class TestPassageSummary:
+    def test_same_implication_as_passages(self, example_passages):
+        for left, right in itertools.product(example_passages, repeat=2):
+            left_summary = PassageSummary.from_passage(left)
+            right_summary = PassageSummary.from_passage(right)
+            assert left_summary.implies(right_summary) == (left >= right)
+
+    def test_same_meaning_as_passages(self, example_passages):
+        for left, right in itertools.product(example_passages, repeat=2):
+            left_summary = PassageSummary.from_passage(left)
+            right_summary = PassageSummary.from_passage(right)
+            assert (left_summary.meaning_id == right_summary.meaning_id) == (
+                left.means(right)
+            )
+
+    def test_same_text_same_id(self, make_response):
+        first = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        second = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        assert (
+            PassageSummary.from_passage(
+                first.select("and no Warrants shall issue")
+            ).text_id
+            == PassageSummary.from_passage(
+                second.select("and no Warrants shall issue")
+            ).text_id
+        )
+
+    def test_group_implies_passages(self, e_fourth_a, e_search_clause, e_due_process_5):
+        coverage = EnactmentCoverage.from_passages([e_fourth_a])
+        assert coverage.implies_all(EnactmentCoverage.from_passages([e_search_clause]))
+        assert not coverage.implies_all(
+            EnactmentCoverage.from_passages([e_search_clause, e_due_process_5])
+        )
+
+
+class TestInternTable:
+    def test_distinct_ids_from_threads(self):
+        table = InternTable()
+        keys = [(str(number),) for number in range(2000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(table.intern, keys))
+        assert len(set(ids)) == len(keys)
+        assert [table.intern(key) for key in keys] == ids
+
+    def test_ids_not_reused_after_clearing(self):
+        table = InternTable(max_size=2)
+        first = table.intern(("a",))
+        table.intern(("b",))
+        table.intern(("c",))
+        assert len(table) == 1
+        assert table.intern(("a",)) != first
+
+    def test_same_meaning_after_clearing_caches(self, e_search_clause):
+        before = EnactmentCoverage.from_passages([e_search_clause])
+        clear_caches()
+        after = EnactmentCoverage.from_passages([e_search_clause])
+        assert before.meaning_ids != after.meaning_ids
+        assert before.summaries[0].means(after.summaries[0])
+        assert before.has_all_meanings_of(after)
+        assert before.implies_all(after)
+
+
+class TestRuleCoverage:
+    def test_coverage_is_cached(self, make_holding):
+        rule = make_holding["h1"].rule
+        assert rule.enactment_coverage("enactments") is rule.enactment_coverage(
+            "enactments"
+        )
+
+    def test_coverage_updated_when_enactments_change(
+        self, make_procedure, make_response
+    ):
+        enactment = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        passage = enactment.select("and no Warrants shall issue")
+        rule = Rule(procedure=make_procedure["c1"], enactments=[passage])
+        before = rule.enactment_coverage("enactments")
+        rule.set_enactments(enactment.select("but upon probable cause"))
+        after = rule.enactment_coverage("enactments")
+        assert after is not before
+        assert "probable cause" in after.summaries[0].texts[0]
@@ -121,6 +121,23 @@ class TestDecision:
         assert len(reading.opinion_readings) == 1
         assert len(reading.holdings) == 20
 
+    def test_majority_found_after_reading_added(self):
+        reading = DecisionReading(decision=Decision(decision_date=date(2000, 2, 2)))
+        assert reading.majority is None
+        majority = OpinionReading(opinion_type="majority")
+        reading.add_opinion_reading(majority)
+        assert reading.majority is majority
+        reading.opinion_readings = [OpinionReading(opinion_type="concurring")]
+        assert reading.majority is None
+
+    def test_matching_opinion_found_after_opinion_added(self, make_opinion):
+        reading = DecisionReading(decision=Decision(decision_date=date(2000, 2, 2)))
+        assert reading.find_matching_opinion(opinion_type="majority") is None
+        opinion = make_opinion["oracle_majority"]
+        reading.add_opinion(opinion)
+        assert reading.find_matching_opinion(opinion_type="majority") is opinion
+        assert reading.get_majority().opinion_author == opinion.author
+
 
 class TestImplication:
     def test_implication_of_decision_with_one_of_same_holdings(
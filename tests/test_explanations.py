@@ -3,6 +3,7 @@ from nettlesome.entities import Entity
 from nettlesome import Predicate
 
 from authorityspoke import Fact
+from authorityspoke.explanations import ExplanationStream
 from authorityspoke.io.text_expansion import expand_shorthand
 
 
@@ -55,3 +56,63 @@ class TestExplainHoldings:
         explanation = left.explain_implication(right)
 
         assert "implies" in str(explanation).lower()
+
+
+def explanations_with_repeats():
+    """Yield Explanations matching Al to Alice, Bob, Alice, Carl, and Bob."""
+    for name in ("Alice", "Bob", "Alice", "Carl", "Bob"):
+        register = ContextRegister()
+        register.insert_pair(Entity(name="Al"), Entity(name=name))
+        yield Explanation(reasons=[], context=register)
+
+
+def matched_names(explanations):
+    return [explanation.context.get("<Al>").name for explanation in explanations]
+
+
+class TestExplanationStream:
+    def test_skip_repeated_registers(self):
+        stream = ExplanationStream(explanations_with_repeats())
+        assert matched_names(stream) == ["Alice", "Bob", "Carl"]
+        assert stream.exhausted
+
+    def test_keep_repeated_registers(self):
+        stream = ExplanationStream(explanations_with_repeats(), distinct=False)
+        assert len(stream.get()) == 5
+
+    def test_generate_only_as_needed(self):
+        stream = ExplanationStream(explanations_with_repeats())
+        assert matched_names(stream.first(1)) == ["Alice"]
+        assert len(stream) == 1
+        assert not stream.exhausted
+
+    def test_offset_and_limit(self):
+        stream = ExplanationStream(explanations_with_repeats())
+        assert matched_names(stream.get(offset=1, limit=1)) == ["Bob"]
+        assert matched_names(stream.get(offset=2)) == ["Carl"]
+
+    def test_pages(self):
+        stream = ExplanationStream(explanations_with_repeats())
+        first = stream.page(limit=2)
+        assert matched_names(first.explanations) == ["Alice", "Bob"]
+        second = stream.page(cursor=first.next_cursor, limit=2)
+        assert matched_names(second.explanations) == ["Carl"]
+        assert second.next_cursor is None
+        assert stream.page(cursor=first.next_cursor, limit=2) == second
+
+    def test_last_full_page(self):
+        stream = ExplanationStream(explanations_with_repeats())
+        assert stream.page(limit=3).next_cursor is None
+
+    def test_stream_contradiction_of_decisions(self, make_decision_with_holding):
+        oracle = make_decision_with_holding["oracle"]
+        lotus = make_decision_with_holding["lotus"]
+        stream = oracle.stream_contradiction(lotus)
+        page = stream.page(limit=1)
+        assert page.explanations
+        assert "contradicts" in str(page.explanations[0]).lower()
+
+    def test_stream_implication_of_opinion(self, make_decision_with_holding):
+        oracle = make_decision_with_holding["oracle"]
+        stream = oracle.majority.stream_implication(oracle.holdings[0])
+        assert stream.first(5)
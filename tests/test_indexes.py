@@ -0,0 +1,184 @@
+import pytest
+
+from anchorpoint.textselectors import TextQuoteSelector, TextSelectionError
+from nettlesome.entities import Entity
+
+from authorityspoke.decisions import DecisionReading
+from authorityspoke.indexes import EnactmentPathIndex, QuoteIndex, holding_fingerprint
+from authorityspoke.io import loaders
+from authorityspoke.io.fake_enactments import FakeClient
+from authorityspoke.opinions import HoldingWithAnchors, OpinionReading
+
+
+def all_quotes(anchored):
+    for group in (
+        anchored.holdings,
+        anchored.named_anchors,
+        anchored.enactment_anchors,
+    ):
+        for item in group:
+            yield from item.anchors.quotes
+
+
+class TestQuoteIndex:
+    text = (
+        "The Court held that the method of operation was not copyrightable. "
+        "A METHOD OF OPERATION,\n  such as a menu, is a method of operation "
+        "under 17 U.S.C. § 102(b)."
+    )
+
+    @pytest.mark.parametrize(
+        "selector",
+        [
+            TextQuoteSelector(exact="method of operation"),
+            TextQuoteSelector(exact="method of operation", prefix="A"),
+            TextQuoteSelector(exact="Method of Operation", suffix="under 17"),
+            TextQuoteSelector(exact="such as", prefix="operation,", suffix="a menu"),
+            TextQuoteSelector(exact="§ 102(b)"),
+            TextQuoteSelector(prefix="such as a menu,"),
+            TextQuoteSelector(exact=" is a method"),
+        ],
+    )
+    def test_same_position_as_regex(self, selector):
+        index = QuoteIndex(self.text, gram_size=4)
+        assert index.as_position(selector) == selector.as_position(self.text)
+
+    def test_missing_quote(self):
+        index = QuoteIndex(self.text)
+        selector = TextQuoteSelector(exact="method of operation", prefix="the Court")
+        assert index.locate(selector) is None
+        with pytest.raises(TextSelectionError):
+            index.as_position(selector)
+
+    def test_example_anchors_match_regex(self, make_decision, make_anchored_holding):
+        for name, anchored in make_anchored_holding.items():
+            text = make_decision[name].majority.text
+            index = QuoteIndex(text)
+            for quote in all_quotes(anchored):
+                assert index.as_position(quote) == quote.as_position(text)
+
+    def test_resolve_anchors(self, make_decision, make_anchored_holding):
+        anchored = make_anchored_holding["oracle"]
+        text = make_decision["oracle"].majority.text
+        resolved = QuoteIndex(text).resolve_anchors(anchored)
+        for before, after in zip(anchored.holdings, resolved.holdings):
+            assert after.anchors == before.anchors.convert_quotes_to_positions(text)
+        assert resolved.holdings[0].holding is anchored.holdings[0].holding
+
+    def test_decision_reading_resolves_anchors(
+        self, make_decision, make_anchored_holding
+    ):
+        decision = make_decision["oracle"]
+        reading = DecisionReading(
+            decision=decision,
+            opinion_readings=[
+                OpinionReading(
+                    opinion_type="majority",
+                    opinion_author=decision.majority.author,
+                    anchored_holdings=make_anchored_holding["oracle"],
+                )
+            ],
+        )
+        reading.resolve_anchor_positions()
+        resolved = reading.majority.anchored_holdings
+        assert any(item.anchors.quotes for item in resolved.holdings)
+        for item in resolved.holdings:
+            assert bool(item.anchors.positions) == bool(item.anchors.quotes)
+
+
+@pytest.fixture(scope="module")
+def usc_client():
+    return FakeClient.from_file("usc.json")
+
+
+@pytest.fixture(scope="module")
+def holdings(usc_client):
+    return loaders.read_holdings_from_file("holding_lotus.yaml", client=usc_client)
+
+
+class TestEnactmentPathIndex:
+    def test_find_exact_path(self, holdings):
+        index = EnactmentPathIndex(holdings)
+        found = index.find("/us/usc/t17/s410/c")
+        assert found == [holdings[2]]
+
+    def test_find_subsections(self, holdings):
+        index = EnactmentPathIndex(holdings)
+        found = index.find("/us/usc/t17/s102")
+        assert len(found) == len(holdings) - 1
+        assert holdings[2] not in found
+        assert not index.find("/us/usc/t17/s102", include_subsections=False)
+
+    def test_prefix_is_not_a_parent_path(self, holdings):
+        index = EnactmentPathIndex(holdings)
+        assert not index.find("/us/usc/t17/s41")
+
+    def test_find_ancestors(self, holdings):
+        index = EnactmentPathIndex(holdings)
+        assert not index.find("/us/usc/t17/s410/c/1")
+        found = index.find("/us/usc/t17/s410/c/1", include_ancestors=True)
+        assert found == [holdings[2]]
+
+    def test_remove_holding(self, holdings):
+        index = EnactmentPathIndex(holdings)
+        index.remove(holdings[2])
+        assert len(index) == len(holdings) - 1
+        assert not index.find("/us/usc/t17/s410/c")
+        assert "/us/usc/t17/s410/c" not in index.paths
+        assert index.find_numbers("/us/usc/t17/s102")[-1] == len(holdings) - 1
+
+    def test_find_enactments_despite(self, usc_client):
+        oracle = loaders.read_holdings_from_file(
+            "holding_oracle.yaml", client=usc_client
+        )
+        index = EnactmentPathIndex(oracle)
+        despite = index.find("/us/usc/t17/s102/b", despite=True)
+        assert despite
+        assert len(despite) < len(index.find("/us/usc/t17/s102/b"))
+        assert all(holding.enactments_despite for holding in despite)
+
+    def test_opinion_reading_updates_index(self, holdings):
+        reading = OpinionReading()
+        reading.posit(holdings[0])
+        assert reading.holdings_citing("/us/usc/t17/s102/a") == [holdings[0]]
+        reading.posit(holdings[2])
+        assert reading.holdings_citing("/us/usc/t17/s410") == [holdings[2]]
+        reading.clear_holdings()
+        assert reading.holdings_citing("/us/usc/t17") == []
+
+    def test_opinion_reading_index_after_holdings_replaced_twice(self, holdings):
+        first, second, third = (
+            HoldingWithAnchors(holding=holding) for holding in holdings[:3]
+        )
+        reading = OpinionReading()
+        reading.anchored_holdings.holdings = [first, third]
+        assert reading.holdings_citing("/us/usc/t17/s410") == [holdings[2]]
+        reading.anchored_holdings.holdings = [first, first]
+        reading.anchored_holdings.holdings = [first, second]
+        assert reading.holdings_citing("/us/usc/t17/s410") == []
+        reading.posit(holdings[2])
+        assert reading.holdings_citing("/us/usc/t17/s410") == [holdings[2]]
+
+
+class TestHoldingFingerprint:
+    def test_same_meaning_same_fingerprint(self, make_holding):
+        for name in ("h1", "h2"):
+            holding = make_holding[name]
+            changed = holding.new_context(
+                [
+                    Entity(name=f"replacement {number}")
+                    for number in range(len(holding.generic_terms()))
+                ]
+            )
+            assert holding.means(changed)
+            assert holding_fingerprint(holding) == holding_fingerprint(changed)
+
+    def test_different_flags_different_fingerprint(self, make_holding):
+        holding = make_holding["h1"]
+        assert holding_fingerprint(holding) != holding_fingerprint(holding.negated())
+
+    def test_holdings_with_same_meaning_share_fingerprint(self, holdings):
+        for left in holdings:
+            for right in holdings:
+                if left.means(right):
+                    assert holding_fingerprint(left) == holding_fingerprint(right)
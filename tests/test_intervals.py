@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from authorityspoke.intervals import IntervalIndex, Span
+
+
+def brute_force_overlapping(spans, start, end):
+    return sorted(
+        (span for span in spans if span.start < end and span.end > start),
+        key=lambda span: (span.start, span.end),
+    )
+
+
+class TestIntervalIndex:
+    def test_empty_index(self):
+        index = IntervalIndex()
+        assert len(index) == 0
+        assert index.at(5) == []
+
+    def test_span_end_is_excluded(self):
+        index = IntervalIndex([Span(start=3, end=8, item="quote")])
+        assert index.at(3)
+        assert index.at(7)
+        assert not index.at(8)
+        assert not index.overlapping(0, 3)
+
+    @pytest.mark.parametrize("bulk", [True, False])
+    def test_same_results_as_scanning_every_span(self, bulk):
+        generator = random.Random(38)
+        spans = []
+        for number in range(300):
+            start = generator.randrange(10000)
+            spans.append(
+                Span(start=start, end=start + generator.randrange(1, 400), item=number)
+            )
+        if bulk:
+            index = IntervalIndex(spans)
+        else:
+            index = IntervalIndex()
+            index.extend(spans)
+        assert len(index) == 300
+        for _ in range(100):
+            start = generator.randrange(10500)
+            end = start + generator.randrange(1, 200)
+            expected = brute_force_overlapping(spans, start, end)
+            found = index.overlapping(start, end)
+            assert [(span.start, span.end) for span in found] == [
+                (span.start, span.end) for span in expected
+            ]
+            assert sorted(span.item for span in found) == sorted(
+                span.item for span in expected
+            )
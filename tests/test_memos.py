@@ -0,0 +1,154 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+from nettlesome.entities import Entity
+from nettlesome.terms import ContextRegister
+
+from authorityspoke.memos import OperationMemo, context_fingerprint, operation_memo
+from authorityspoke.memos import procedure_fingerprint, rule_fingerprint
+from authorityspoke.passages import passage_key
+
+
+class TestOperationMemo:
+    def test_operation_performed_once(self):
+        memo = OperationMemo()
+        calls = []
+
+        def operation():
+            calls.append(1)
+            return [1, 2]
+
+        first = memo.remember("key", operation, copy=list)
+        second = memo.remember("key", operation, copy=list)
+        assert first == second
+        assert first is not second
+        assert len(calls) == 1
+
+    def test_none_result_remembered(self):
+        memo = OperationMemo()
+        calls = []
+        for _ in range(2):
+            memo.remember("key", lambda: calls.append(1), copy=deepcopy)
+        assert len(calls) == 1
+
+    def test_least_recently_used_forgotten(self):
+        memo = OperationMemo(max_size=2)
+        memo.remember("first", lambda: 1, copy=int)
+        memo.remember("second", lambda: 2, copy=int)
+        memo.remember("first", lambda: 0, copy=int)
+        memo.remember("third", lambda: 3, copy=int)
+        assert len(memo) == 2
+        assert memo.remember("first", lambda: 0, copy=int) == 1
+        assert memo.remember("second", lambda: 0, copy=int) == 0
+
+    def test_changing_result_does_not_change_memo(self):
+        memo = OperationMemo()
+        result = memo.remember("key", lambda: [1], copy=list)
+        result.append(2)
+        assert memo.remember("key", lambda: [], copy=list) == [1]
+
+    def test_shared_between_threads(self):
+        memo = OperationMemo(max_size=4)
+
+        def remember(number):
+            key = number % 10
+            return memo.remember(key, lambda: [key], copy=list)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(remember, range(2000)))
+        assert results == [[number % 10] for number in range(2000)]
+        assert len(memo) == 4
+
+
+class TestFingerprints:
+    def test_equal_procedures_same_fingerprint(self, make_procedure):
+        procedure = make_procedure["c1"]
+        assert procedure_fingerprint(procedure) == procedure_fingerprint(
+            deepcopy(procedure)
+        )
+        assert procedure_fingerprint(procedure) != procedure_fingerprint(
+            make_procedure["c2"]
+        )
+
+    def test_fingerprint_includes_term_fields(self, make_procedure):
+        procedure = make_procedure["c1"]
+        changed = deepcopy(procedure)
+        term = changed.inputs[0].terms[0]
+        term.plural = not term.plural
+        assert procedure_fingerprint(procedure) != procedure_fingerprint(changed)
+
+    def test_rule_fingerprint_includes_flags(self, make_rule):
+        rule = make_rule["h1"]
+        changed = deepcopy(rule)
+        changed.universal = not rule.universal
+        assert rule_fingerprint(rule) != rule_fingerprint(changed)
+
+    def test_shared_passage_key_remembered(self, make_rule):
+        rule = make_rule["h1"]
+        assert rule_fingerprint(rule)[3] == tuple(
+            passage_key(passage) for passage in rule.enactments
+        )
+
+    def test_context_fingerprint(self):
+        register = ContextRegister()
+        register.insert_pair(Entity(name="Al"), Entity(name="Alice"))
+        other = ContextRegister()
+        other.insert_pair(Entity(name="Al"), Entity(name="Bob"))
+        assert context_fingerprint(None) == context_fingerprint(ContextRegister())
+        assert context_fingerprint(register) != context_fingerprint(other)
+
+
+class TestMemoizedOperations:
+    def test_procedure_union_reused(self, make_opinion_with_holding):
+        feist = make_opinion_with_holding["feist_majority"]
+        left = feist.holdings[0].procedure
+        right = feist.holdings[2].procedure
+        operation_memo.clear()
+        first = left | right
+        assert len(operation_memo) == 1
+        second = deepcopy(left) | deepcopy(right)
+        assert len(operation_memo) == 1
+        assert first.means(second)
+        assert first is not second
+
+    def test_changing_union_does_not_change_next_union(self, make_opinion_with_holding):
+        feist = make_opinion_with_holding["feist_majority"]
+        left = feist.holdings[4].rule
+        right = feist.holdings[6].rule
+        first = left | right
+        first.set_inputs(first.inputs[:1])
+        second = left | right
+        assert len(second.inputs) == 6
+
+    def test_rule_union_copied_once(self, make_opinion_with_holding, monkeypatch):
+        feist = make_opinion_with_holding["feist_majority"]
+        left = feist.holdings[4].rule
+        right = feist.holdings[6].rule
+        operation_memo.clear()
+        copied = []
+        remember = OperationMemo.remember
+
+        def counting_remember(self, key, operation, copy):
+            return remember(
+                self,
+                key,
+                operation,
+                lambda result: copied.append(key[0]) or copy(result),
+            )
+
+        monkeypatch.setattr(OperationMemo, "remember", counting_remember)
+        left | right
+        assert copied == ["rule_union"]
+        left | right
+        assert copied == ["rule_union", "rule_union"]
+
+    def test_rule_addition_reused(self, make_complex_rule):
+        left = make_complex_rule["accept_relevance_testimony_ALL"]
+        right = make_complex_rule["accept_murder_fact_from_relevance"]
+        operation_memo.clear()
+        first = left + right
+        remembered = len(operation_memo)
+        assert remembered
+        second = left + right
+        assert len(operation_memo) == remembered
+        assert first.means(second)
@@ -1,6 +1,7 @@
 import pytest
 
 from anchorpoint.textselectors import (
+    TextPositionSelector,
     TextPositionSet,
     TextQuoteSelector,
     TextSelectionError,
@@ -16,8 +17,10 @@ from authorityspoke.io import loaders, readers
 from authorityspoke.io.fake_enactments import FakeClient
 from authorityspoke.opinions import (
     AnchoredHoldings,
+    EnactmentWithAnchors,
     Opinion,
     FactorIndex,
+    HoldingWithAnchors,
     OpinionReading,
     TermWithAnchors,
 )
@@ -152,6 +155,95 @@ class TestOpinionHoldings:
         watt.posit(make_rule["h1"])
         assert watt.implies(make_holding["h1"])
 
+    def test_posit_duplicate_holding_adds_anchors(self, make_holding):
+        reading = OpinionReading()
+        first = TextPositionSet(positions=[TextPositionSelector(start=0, end=10)])
+        second = TextPositionSet(positions=[TextPositionSelector(start=20, end=30)])
+        reading.posit_holding(make_holding["h1"], holding_anchors=first)
+        reading.posit_holding(make_holding["h2"])
+        assert not reading.anchored_at(25)
+        reading.posit_holding(make_holding["h1"], holding_anchors=second)
+        assert len(reading.holdings) == 2
+        assert (
+            reading.holding_anchors[0].positions == first.positions + second.positions
+        )
+        assert [item.holding for item in reading.anchored_at(25)] == [
+            make_holding["h1"]
+        ]
+
+    def test_matching_holding_after_holdings_replaced(self, make_holding):
+        reading = OpinionReading()
+        reading.posit_holding(make_holding["h1"])
+        reading.anchored_holdings.holdings = [
+            HoldingWithAnchors(holding=make_holding["h2"])
+        ]
+        assert reading.get_matching_holding(make_holding["h1"]) is None
+        assert reading.get_matching_holding(make_holding["h2"]) == make_holding["h2"]
+
+    def test_matching_holding_after_holdings_replaced_twice(self, real_holding):
+        reading = OpinionReading()
+        reading.posit_holding(real_holding["h1"])
+        reading.posit_holding(real_holding["h2"])
+        first, third, fourth = (
+            HoldingWithAnchors(holding=real_holding[key]) for key in ("h1", "h3", "h4")
+        )
+        # the second new list may be given the id of the original list
+        reading.anchored_holdings.holdings = [first, third]
+        reading.anchored_holdings.holdings = [first, fourth]
+        assert reading.get_matching_holding(real_holding["h4"]) == real_holding["h4"]
+        reading.posit_holding(real_holding["h4"])
+        assert len(reading.anchored_holdings.holdings) == 2
+
+    def test_holdings_cached_until_posit(self, make_holding):
+        reading = OpinionReading()
+        reading.posit_holding(make_holding["h1"])
+        holdings = reading.holdings
+        assert reading.holdings.sequence is holdings.sequence
+        reading.posit_holding(make_holding["h2"])
+        assert reading.holdings.sequence is not holdings.sequence
+        assert list(reading.holdings) == [make_holding["h1"], make_holding["h2"]]
+        reading.clear_holdings()
+        assert len(reading.holdings) == 0
+        assert not reading.generic_terms_by_str()
+
+    def test_holdings_view_after_holdings_replaced_twice(self, real_holding):
+        first, second, third, fourth = (
+            HoldingWithAnchors(holding=real_holding[key])
+            for key in ("h1", "h2", "h3", "h4")
+        )
+        reading = OpinionReading()
+        reading.anchored_holdings.holdings = [first, second]
+        assert len(reading.holdings) == 2
+        reading.anchored_holdings.holdings = [first, third]
+        reading.anchored_holdings.holdings = [first, fourth]
+        assert list(reading.holdings) == [real_holding["h1"], real_holding["h4"]]
+
+    def test_changing_returned_views_does_not_change_cache(self, make_holding):
+        reading = OpinionReading()
+        reading.posit_holding(make_holding["h1"])
+        reading.holdings.sequence = ()
+        reading.holding_anchors.clear()
+        reading.generic_terms_by_str().clear()
+        assert list(reading.holdings) == [make_holding["h1"]]
+        assert len(reading.holding_anchors) == 1
+        assert reading.generic_terms_by_str()
+
+    def test_holding_anchors_updated_for_duplicate_holding(self, make_holding):
+        reading = OpinionReading()
+        first = TextPositionSet(positions=[TextPositionSelector(start=0, end=10)])
+        second = TextPositionSet(positions=[TextPositionSelector(start=20, end=30)])
+        reading.posit_holding(make_holding["h1"], holding_anchors=first)
+        assert reading.holding_anchors[0].positions == first.positions
+        reading.posit_holding(make_holding["h1"], holding_anchors=second)
+        assert len(reading.holding_anchors[0].positions) == 2
+
+    def test_factors_by_name_updated_after_posit(self, make_holding):
+        reading = OpinionReading()
+        reading.posit_holding(make_holding["h1"])
+        count = len(reading.factors_by_name())
+        reading.posit_holding(make_holding["h3"])
+        assert len(reading.factors_by_name()) > count
+
     def test_new_context_wrong_number_of_changes(
         self, make_opinion_with_holding, make_holding
     ):
@@ -261,6 +353,84 @@ class TestOpinionHoldings:
         factor = factors["the fact that <the elephant> was an elephant"]
         assert factor.terms[0].name == "the elephant"
 
+    def test_find_holdings_and_terms_anchored_at_position(self, make_holding):
+        reading = OpinionReading()
+        assert reading.anchored_at(50) == []
+        elephant = Entity(name="the elephant")
+        reading.posit(
+            make_holding["h1"],
+            holding_anchors=TextPositionSet(
+                positions=[TextPositionSelector(start=40, end=90)]
+            ),
+            named_anchors=[
+                TermWithAnchors(
+                    term=elephant,
+                    anchors=TextPositionSet(
+                        positions=[TextPositionSelector(start=80, end=95)]
+                    ),
+                )
+            ],
+        )
+        reading.posit(
+            make_holding["h2"],
+            holding_anchors=TextPositionSet(
+                positions=[TextPositionSelector(start=200, end=250)]
+            ),
+        )
+        assert [item.holding for item in reading.anchored_at(50)] == [
+            make_holding["h1"]
+        ]
+        found = reading.anchored_at(85)
+        assert len(found) == 2
+        assert found[1].term.name == "the elephant"
+        assert len(reading.anchored_at(0, 1000)) == 3
+        assert reading.anchored_at(100, 200) == []
+
+    def test_find_holding_anchored_without_end(self, make_holding):
+        reading = OpinionReading()
+        reading.posit(
+            make_holding["h1"],
+            holding_anchors=TextPositionSet(positions=[TextPositionSelector(start=5)]),
+        )
+        assert reading.anchored_at(3) == []
+        assert [item.holding for item in reading.anchored_at(10)] == [
+            make_holding["h1"]
+        ]
+        reading.posit(
+            make_holding["h2"],
+            holding_anchors=TextPositionSet(positions=[TextPositionSelector(start=20)]),
+        )
+        assert len(reading.anchored_at(10_000)) == 2
+
+    def test_anchor_index_after_holdings_replaced_twice(self, real_holding):
+        first, second, third = (
+            HoldingWithAnchors(
+                holding=real_holding[key],
+                anchors=TextPositionSet(
+                    positions=[TextPositionSelector(start=start, end=start + 10)]
+                ),
+            )
+            for key, start in (("h1", 0), ("h2", 20), ("h3", 40))
+        )
+        reading = OpinionReading()
+        reading.anchored_holdings.holdings = [first, second]
+        assert reading.anchored_at(45) == []
+        reading.anchored_holdings.holdings = [first, first]
+        reading.anchored_holdings.holdings = [first, third]
+        assert reading.anchored_at(45) == [third]
+
+    def test_anchor_index_rebuilt_after_clearing_holdings(self, make_holding):
+        reading = OpinionReading()
+        reading.posit(
+            make_holding["h1"],
+            holding_anchors=TextPositionSet(
+                positions=[TextPositionSelector(start=40, end=90)]
+            ),
+        )
+        assert reading.anchored_at(50)
+        reading.clear_holdings()
+        assert reading.anchored_at(50) == []
+
 
 class TestOpinionFactors:
     def test_only_one_factor_with_same_content(self, make_opinion_with_holding):
@@ -299,6 +469,56 @@ class TestOpinionFactors:
         assert len(index.named_anchors) == 1
         assert index.named_anchors[0].anchors.quotes == [quote_selector]
 
+    def test_find_terms_added_to_anchored_holdings(self):
+        anchors = TextPositionSet(quotes=TextQuoteSelector(exact="the Java API"))
+        index = AnchoredHoldings()
+        entities = [Entity(name=f"entity {number}") for number in range(20)]
+        for entity in entities:
+            index.add_term(term=entity, anchors=anchors)
+        assert index.find_term_index(entities[13]) == 13
+        assert index.get_term_anchors(entities[7].key) == anchors
+        with pytest.raises(KeyError):
+            index.get_term_anchors("no such term")
+
+    def test_find_term_after_named_anchors_replaced(self):
+        anchors = TextPositionSet(quotes=TextQuoteSelector(exact="the Java API"))
+        api = Entity(name="the Java API")
+        oracle = Entity(name="Oracle")
+        index = AnchoredHoldings()
+        index.add_term(term=api, anchors=anchors)
+        index.named_anchors = [TermWithAnchors(term=oracle, anchors=anchors)]
+        assert index.find_term_index(api) is None
+        assert index.find_term_index(oracle) == 0
+
+    def test_find_term_after_named_anchors_replaced_twice(self):
+        anchors = TextPositionSet(quotes=TextQuoteSelector(exact="the Java API"))
+        api, oracle, google = (
+            TermWithAnchors(term=Entity(name=name), anchors=anchors)
+            for name in ("the Java API", "Oracle", "Google")
+        )
+        index = AnchoredHoldings()
+        index.named_anchors = [api, oracle]
+        assert index.find_term_index(api.term) == 0
+        index.named_anchors = [oracle, oracle]
+        index.named_anchors = [oracle, google]
+        assert index.find_term_index(google.term) == 1
+        assert index.find_term_index(api.term) is None
+
+    def test_find_enactment_after_enactment_anchors_replaced_twice(
+        self, e_fourth_a, e_search_clause, e_due_process_5
+    ):
+        fourth_a, search_clause, due_process = (
+            EnactmentWithAnchors(passage=passage)
+            for passage in (e_fourth_a, e_search_clause, e_due_process_5)
+        )
+        index = AnchoredHoldings()
+        index.enactment_anchors = [fourth_a, search_clause]
+        assert index.find_enactment_index(e_fourth_a) == 0
+        index.enactment_anchors = [search_clause, search_clause]
+        index.enactment_anchors = [search_clause, due_process]
+        assert index.find_enactment_index(e_due_process_5) == 1
+        assert index.find_enactment_index(e_fourth_a) is None
+
     def test_get_factor_from_opinion(self, make_opinion_with_holding):
         oracle = make_opinion_with_holding["oracle_majority"]
         company = oracle.get_factor_by_name("the Java API")
@@ -310,6 +530,54 @@ class TestOpinionFactors:
         factor = factors["false the Java API was an original work"]
         assert factor.terms[0].name == "the Java API"
 
+    def test_term_lookup_same_as_search(self, make_opinion_with_holding):
+        oracle = make_opinion_with_holding["oracle_majority"]
+        terms = oracle.holdings.recursive_terms
+        for key, term in terms.items():
+            assert oracle.get_factor_by_str(key) is term
+            if term.name:
+                expected = next(
+                    found
+                    for found in (
+                        holding.get_factor_by_name(term.name)
+                        for holding in oracle.holdings
+                    )
+                    if found is not None
+                )
+                assert oracle.get_factor_by_name(term.name) is expected
+
+    def test_inserting_into_factors_by_name_does_not_change_cache(self, make_holding):
+        reading = OpinionReading()
+        reading.posit_holding(make_holding["h1"])
+        factors = reading.factors_by_name()
+        count = len(factors)
+        factors.insert_by_name(Entity(name="the elephant"))
+        assert "the elephant" in factors
+        assert "the elephant" not in reading.factors_by_name()
+        assert len(reading.factors_by_name()) == count
+
+    def test_term_lookup_after_holdings_replaced_twice(self, make_holding):
+        first, second, third = (
+            HoldingWithAnchors(holding=make_holding[key]) for key in ("h1", "h2", "h3")
+        )
+        name = "officers' search of the stockpile of trees"
+        reading = OpinionReading()
+        reading.anchored_holdings.holdings = [first, second]
+        assert reading.get_factor_by_name(name) is None
+        reading.anchored_holdings.holdings = [first, first]
+        reading.anchored_holdings.holdings = [first, third]
+        expected = make_holding["h3"].get_factor_by_name(name)
+        assert reading.get_factor_by_name(name) == expected
+
+    def test_term_lookup_updated_after_posit(self, make_holding):
+        reading = OpinionReading()
+        reading.posit_holding(make_holding["h1"])
+        assert reading.get_factor_by_name("the Java API") is None
+        reading.posit_holding(make_holding["h3"])
+        assert reading.get_factor_by_name(
+            "proof of Wattenburg's guilt"
+        ) == make_holding["h3"].get_factor_by_name("proof of Wattenburg's guilt")
+
 
 class TestImplication:
     def test_opinion_implies_holding_group(self, make_opinion_with_holding):
@@ -0,0 +1,114 @@
+from legislice.enactments import Enactment
+from legislice.groups import EnactmentGroup
+
+from authorityspoke.passages import PassageStore, passage_key, passage_store
+from authorityspoke.rules import Rule
+
+
+class TestPassageStore:
+    def test_equal_passages_shared(self, make_response):
+        store = PassageStore()
+        first = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        second = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        shared = store.intern(first.select("and no Warrants shall issue"))
+        other = store.intern(second.select("and no Warrants shall issue"))
+        assert other is not shared
+        assert other.selection is shared.selection
+        assert other.enactment is shared.enactment
+        assert len(store) == 1
+
+    def test_original_passage_not_stored(self, make_response):
+        store = PassageStore()
+        enactment = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        passage = enactment.select("and no Warrants shall issue")
+        shared = store.intern(passage)
+        assert shared is not passage
+        passage.select_more("but upon probable cause")
+        assert "probable cause" not in shared.selected_text()
+
+    def test_unselected_passage_selects_all(self, make_response):
+        store = PassageStore()
+        enactment = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        passage = EnactmentGroup(passages=enactment).passages[0]
+        passage.selection.positions = []
+        shared = store.intern(passage)
+        assert shared.selected_text() == enactment.text
+        assert store.intern(passage).selection is shared.selection
+        assert len(store) == 1
+
+    def test_sum_of_groups_reused(self, e_search_clause, e_due_process_5):
+        store = PassageStore()
+        left = EnactmentGroup(passages=e_search_clause)
+        first = store.add_groups(left, e_due_process_5)
+        second = store.add_groups(left, e_due_process_5)
+        assert first is not second
+        assert first.passages == second.passages
+        assert all(
+            a is not b and a.selection is b.selection
+            for a, b in zip(first.passages, second.passages)
+        )
+        assert len(store.sums) == 1
+
+    def test_store_size_limited(self, make_response):
+        store = PassageStore(max_passages=2)
+        enactment = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        store.add_groups(EnactmentGroup(passages=enactment.select("effects")), [])
+        assert len(store.sums) == 1
+        for text in ("and no Warrants shall issue", "but upon probable cause"):
+            store.intern(enactment.select(text))
+        assert len(store) == 1
+        assert len(store.passages) == 1
+        assert not store.sums
+
+    def test_sum_not_reused_for_other_passages_with_same_ids(self, make_response):
+        store = PassageStore()
+        enactment = Enactment(**make_response["/us/const/amendment/IV"]["1791-12-15"])
+        persons, houses, papers = (
+            EnactmentGroup(passages=enactment.select(text))
+            for text in ("persons", "houses", "papers")
+        )
+        store.add_groups(persons, houses)
+        (earlier_sum,) = store.sums.values()
+        store.intern(papers.passages[0])
+        shared = [
+            store.passages[passage_key(group.passages[0])]
+            for group in (persons, papers)
+        ]
+        # as if the shared passage for "houses" had been freed and its id reused
+        store.sums = {((id(shared[0]),), (id(shared[1]),)): earlier_sum}
+        assert store.add_groups(persons, papers) == persons + papers
+
+
+class TestRulePassages:
+    def test_rules_share_passages(self, make_procedure, e_search_clause):
+        first = Rule(procedure=make_procedure["c1"], enactments=e_search_clause)
+        second = Rule(procedure=make_procedure["c2"], enactments=e_search_clause)
+        assert first.enactments[0] is not second.enactments[0]
+        assert first.enactments[0].selection is second.enactments[0].selection
+        assert passage_store.is_shared(first.enactments[0])
+
+    def test_changing_selection_of_one_rule(self, make_procedure, make_response):
+        passages = [
+            Enactment(**make_response["/us/usc/t17/s102/b"]["2013-07-18"]).select()
+            for _ in range(2)
+        ]
+        first = Rule(procedure=make_procedure["c1"], enactments=passages[0])
+        second = Rule(procedure=make_procedure["c2"], enactments=passages[1])
+        before = second.enactments[0].selected_text()
+        old_key = passage_store.key_of(first.enactments[0])
+        first.enactments[0].select("In no case does copyright protection")
+        assert second.enactments[0].selected_text() == before
+        assert first.enactments[0].selected_text() != before
+        assert not passage_store.is_shared(first.enactments[0])
+        assert passage_store.key_of(first.enactments[0]) != old_key
+        assert passage_store.key_of(second.enactments[0]) == old_key
+        total = passage_store.add_groups(first.enactments, second.enactments)
+        assert len(total) == 1
+        assert total[0].selected_text() == before
+
+    def test_copy_of_rule_shares_passages(self, make_holding):
+        rule = make_holding["h1"].rule
+        new = rule.with_factor(make_holding["h2"].inputs[0])
+        assert new.enactments[0] is not rule.enactments[0]
+        assert new.enactments[0].selection is rule.enactments[0].selection
+        assert new.procedure is not rule.procedure